@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Show how a background acquisition absorbs consumer stalls: a simulated
+camera runs at frame_rate while the consumer stalls every 10th frame,
+frames lost by the driver show up as gaps in the frame counter
+
+    python benchmark_acquisition.py [frame_rate] [stall_ms] [n_frames]
+"""
+
+import sys
+import time
+
+from flycapture2 import oo, raw, sim
+
+
+frame_rate = 200.
+stall = 0.03
+n_frames = 200
+if len(sys.argv) > 1:
+    frame_rate = float(sys.argv[1])
+if len(sys.argv) > 2:
+    stall = float(sys.argv[2]) / 1000.
+if len(sys.argv) > 3:
+    n_frames = int(sys.argv[3])
+
+raw.load(sim.Library([sim.Camera(
+    width=640, height=480, frame_rate=frame_rate)]))
+c = oo.PointGrey()
+
+
+def lost(counters):
+    return sum(b - a - 1 for (a, b) in zip(counters[:-1], counters[1:]))
+
+
+def consume(get):
+    counters = []
+    t0 = time.time()
+    for i in range(n_frames):
+        _, meta = get()
+        counters.append(meta.frameCounter)
+        if i % 10 == 9:
+            time.sleep(stall)
+    return counters, time.time() - t0
+
+
+counters, dt = consume(lambda: c.grab(stop=False))
+c.stop_capture()
+print("{:<12} {:>6} lost {:>8.1f} fps".format(
+    'grab', lost(counters), n_frames / dt))
+for n in (4, 16):
+    for policy in ('drop', 'block'):
+        with c.start_acquisition(n, policy) as acq:
+            counters, dt = consume(acq.get)
+        print("{:<12} {:>6} lost {:>8.1f} fps {}".format(
+            '%s %s' % (policy, n), lost(counters), n_frames / dt,
+            acq.counters()))
+c.disconnect()
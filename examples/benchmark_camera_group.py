@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Compare the timestamp skew between simulated cameras started one by one
+with a synchronized CameraGroup (with frames dropped independently by
+each camera, so bundles need realigning)
+
+    python benchmark_camera_group.py [n_cameras] [frame_rate] [n_frames]
+"""
+
+import sys
+import time
+
+from flycapture2 import oo, raw, sim
+
+
+n_cameras = 3
+frame_rate = 100.
+n_frames = 100
+if len(sys.argv) > 1:
+    n_cameras = int(sys.argv[1])
+if len(sys.argv) > 2:
+    frame_rate = float(sys.argv[2])
+if len(sys.argv) > 3:
+    n_frames = int(sys.argv[3])
+
+raw.load(sim.Library([
+    sim.Camera(frame_rate=frame_rate, drop_rate=0.05, seed=i)
+    for i in range(n_cameras)]))
+cameras = [oo.PointGrey(i) for i in range(n_cameras)]
+
+# started one after another, each camera has its own frame times
+for c in cameras:
+    c.start_capture()
+    time.sleep(0.5 / frame_rate / n_cameras)
+skew = 0.
+t0 = time.time()
+for i in range(n_frames):
+    ts = [c.grab(stop=False)[1].timestamp for c in cameras]
+    skew = max(skew, max(ts) - min(ts))
+dt = time.time() - t0
+for c in cameras:
+    c.stop_capture()
+print("{:<12} {:>8.2f} ms skew {:>8.1f} bundles/s".format(
+    'separate', skew * 1000., n_frames / dt))
+
+for match in ('timestamp', 'frameCounter'):
+    t0 = time.time()
+    with oo.CameraGroup(cameras, match=match, n_frames=n_frames) as group:
+        for (frames, metas) in group:
+            pass
+    dt = time.time() - t0
+    c = group.counters()
+    print("{:<12} {:>8.2f} ms skew {:>8.1f} bundles/s skipped {}".format(
+        match, c['max_skew'] * 1000., n_frames / dt, c['skipped']))
+
+for c in cameras:
+    c.disconnect()
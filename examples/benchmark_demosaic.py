@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Measure demosaic.demosaic on a random RAW8 (or RAW16) frame for each
+method with one thread and with a thread per cpu
+
+    python benchmark_demosaic.py [width] [height] [dtype] [repeats]
+"""
+
+import os
+import sys
+import time
+
+import numpy
+
+from flycapture2 import demosaic
+
+
+width = 2448
+height = 2048
+dtype = 'u1'
+repeats = 10
+if len(sys.argv) > 1:
+    width = int(sys.argv[1])
+if len(sys.argv) > 2:
+    height = int(sys.argv[2])
+if len(sys.argv) > 3:
+    dtype = sys.argv[3]
+if len(sys.argv) > 4:
+    repeats = int(sys.argv[4])
+
+raw = numpy.random.randint(
+    0, numpy.iinfo(dtype).max, (height, width)).astype(dtype)
+out = numpy.empty((height, width, 3), dtype=dtype)
+
+print("{}x{} {} {} cpus".format(width, height, dtype, os.cpu_count()))
+for method in demosaic.methods:
+    for threads in (1, None):
+        demosaic.demosaic(raw, 'RGGB', method, out=out, threads=threads)
+        t0 = time.time()
+        for _ in range(repeats):
+            demosaic.demosaic(raw, 'RGGB', method, out=out, threads=threads)
+        dt = (time.time() - t0) / repeats
+        print("{:<10} {:>8} {:>8.1f} ms/frame".format(
+            method, threads or 'all', dt * 1E3))
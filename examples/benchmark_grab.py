@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Measure the python side throughput of PointGrey.grab using the simulated
+backend (the simulated camera produces frames as fast as they are
+retrieved so only the time spent in python and copies is measured)
+
+    python benchmark_grab.py [width] [height] [pixel_format] [seconds]
+"""
+
+import sys
+import time
+
+import numpy
+
+from flycapture2 import oo, raw, sim, structs
+
+
+width = 2448
+height = 2048
+pixel_format = 'MONO8'
+duration = 2.
+if len(sys.argv) > 1:
+    width = int(sys.argv[1])
+if len(sys.argv) > 2:
+    height = int(sys.argv[2])
+if len(sys.argv) > 3:
+    pixel_format = sys.argv[3]
+if len(sys.argv) > 4:
+    duration = float(sys.argv[4])
+
+# name, grab keyword arguments
+modes = [
+    ('copy', {}),
+    ('zero-copy', {'copy': False}),
+    ('RGB8', {'pixel_format': 'RGB8'}),
+    ('decimate 4', {'decimate': 4}),
+    ('bin 2', {'binning': 2}),
+    ('4 rois', {'roi': [(0, 0, 64, 64), (64, 64, 64, 64),
+                        (128, 128, 64, 64), (192, 192, 64, 64)]}),
+]
+
+raw.load(sim.Library([sim.Camera(
+    width=width, height=height, pixel_format=pixel_format, frame_rate=0)]))
+
+c = oo.PointGrey()
+c.start_capture()
+a, _ = c.grab(stop=False)
+modes.append(('out', {'out': numpy.empty_like(a)}))
+print("{}x{} {}".format(width, height, pixel_format))
+for (name, kwargs) in modes:
+    n = 0
+    t0 = time.time()
+    while time.time() - t0 < duration:
+        c.grab(stop=False, **kwargs)
+        n += 1
+    dt = time.time() - t0
+    print("{:<12} {:>6} frames {:>8.1f} fps {:>8.3f} ms/frame".format(
+        name, n, n / dt, dt / n * 1E3))
+c.stop_capture()
+c.disconnect()
+print("image pool: {}".format(structs.FCImage.stats()))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Compare the time to import flycapture2.raw with eager and lazy binding
+of the library functions (see raw.lazy / FLYCAPTURE2_LAZY) and the
+generated flycapture2.raw_static (which does not import raw, see codegen).
+
+Each import is done in a fresh interpreter, the time reported is the
+median of several runs. The time of the first few calls (which pay for
+the deferred binding when lazy) is reported separately (if no library
+can be loaded, only imports are timed).
+
+Run this against libflycapture-c: the simulator (FLYCAPTURE2_LIBRARY=sim)
+is built on raw so raw_static imports raw to use it.
+"""
+
+import os
+import subprocess
+import sys
+
+
+n_runs = 20
+if len(sys.argv) > 1:
+    n_runs = int(sys.argv[1])
+
+
+# numpy is imported first so its (large) import time is not counted
+script = """
+import time
+import numpy
+t0 = time.perf_counter()
+import flycapture2.{module} as raw
+t1 = time.perf_counter()
+from flycapture2 import raw_types
+try:
+    c = raw_types.fc2Context()
+    raw.fc2CreateContext(c)
+    n = raw_types.ctypes.c_uint(0)
+    raw.fc2GetNumOfCameras(c, n)
+    raw_types.fc2Error[0]
+    raw.fc2DestroyContext(c)
+    t2 = time.perf_counter()
+except Exception:
+    # no library
+    t2 = float('nan')
+print(t1 - t0, t2 - t1)
+"""
+
+
+def run(module, lazy):
+    env = os.environ.copy()
+    env['FLYCAPTURE2_LAZY'] = '1' if lazy else '0'
+    imports = []
+    calls = []
+    for _ in range(n_runs):
+        out = subprocess.check_output(
+            [sys.executable, '-c', script.format(module=module)], env=env)
+        ti, tc = [float(v) for v in out.split()]
+        imports.append(ti)
+        calls.append(tc)
+    imports.sort()
+    calls.sort()
+    return imports[len(imports) // 2], calls[len(calls) // 2]
+
+
+print("{:<8} {:>12} {:>12}".format("mode", "import", "first calls"))
+for (name, module, lazy) in (
+        ('eager', 'raw', False), ('lazy', 'raw', True),
+        ('static', 'raw_static', True)):
+    ti, tc = run(module, lazy)
+    print("{:<8} {:>10.2f}ms {:>10.2f}ms".format(name, ti * 1E3, tc * 1E3))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Compare the total frame rate of n simulated cameras (grabbing as fast as
+possible, binned 2x2) acquired by threads in one process
+(PointGrey.start_acquisition) and by a process per camera
+(processes.ProcessAcquisition) as n grows
+
+    python benchmark_processes.py [max_cameras] [seconds] [width] [height]
+
+With one process per camera the total rate should grow with n up to the
+number of cores, with threads it is limited by the GIL.
+"""
+
+import os
+import sys
+import time
+
+width = 1280
+height = 960
+max_cameras = os.cpu_count() or 1
+seconds = 2.
+if len(sys.argv) > 1:
+    max_cameras = int(sys.argv[1])
+if len(sys.argv) > 2:
+    seconds = float(sys.argv[2])
+if len(sys.argv) > 3:
+    width = int(sys.argv[3])
+if len(sys.argv) > 4:
+    height = int(sys.argv[4])
+
+# the worker processes configure their simulator from the environment
+os.environ['FLYCAPTURE2_LIBRARY'] = 'sim'
+os.environ['FLYCAPTURE2_SIM'] = (
+    'n_cameras=%s,width=%s,height=%s,frame_rate=0' % (
+        max_cameras, width, height))
+
+from flycapture2 import oo, processes  # noqa: E402
+
+
+def run_threads(n):
+    cameras = [oo.PointGrey(i) for i in range(n)]
+    acqs = [c.start_acquisition(4, binning=2) for c in cameras]
+    t0 = time.time()
+    while time.time() - t0 < seconds:
+        for acq in acqs:
+            acq.latest(timeout=0.01)
+    dt = time.time() - t0
+    produced = sum(acq.counters()['produced'] for acq in acqs)
+    for (acq, c) in zip(acqs, cameras):
+        acq.stop()
+        c.disconnect()
+    return produced / dt
+
+
+def run_processes(n):
+    with processes.ProcessAcquisition(
+            range(n), n_frames=4, binning=2) as acq:
+        start = sum(c['grabbed'] for c in acq.counters())
+        t0 = time.time()
+        while time.time() - t0 < seconds:
+            for i in range(n):
+                acq.latest(i)
+            time.sleep(0.001)
+        dt = time.time() - t0
+        produced = sum(c['grabbed'] for c in acq.counters()) - start
+    return produced / dt
+
+
+def main():
+    print("{} cores, {}x{} frames".format(os.cpu_count(), width, height))
+    print("{:>8} {:>16} {:>16}".format(
+        'cameras', 'threads fps', 'processes fps'))
+    for n in range(1, max_cameras + 1):
+        print("{:>8} {:>16.1f} {:>16.1f}".format(
+            n, run_threads(n), run_processes(n)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Measure the python side overhead of calling into libflycapture-c through
+raw.Function for the functions used in a capture loop.
+
+Five ways of calling each function are timed:
+    native: the bare ctypes foreign function (lower bound)
+    legacy: one converter lambda per argument (the old __call__)
+    fast: raw.Function.__call__
+    timed: raw.Function.__call__ with call statistics (see raw.instrument)
+    static: the generated raw_static module (see codegen)
+
+A connected camera is needed, to run without one use the simulated
+backend (with no frame rate limit):
+    FLYCAPTURE2_LIBRARY=sim FLYCAPTURE2_SIM=frame_rate=0 \\
+        python benchmark_raw_calls.py
+"""
+
+import ctypes
+import sys
+import timeit
+
+from flycapture2 import raw
+from flycapture2 import raw_static
+
+
+n_calls = 100000
+if len(sys.argv) > 1:
+    n_calls = int(sys.argv[1])
+
+
+def legacy_caller(f):
+    converter = []
+    for (_, vt), byref in zip(f.args, f.converter):
+        converter.append(
+            lambda v, a=vt, b=byref: raw.arg_type_convert(v, a, b))
+
+    def call(*args):
+        if len(converter) != len(args):
+            raise Exception(
+                "Invalid number of args {} != {}".format(
+                    len(args), len(converter)))
+        return f.func(*[c(a) for (c, a) in zip(converter, args)])
+    return call
+
+
+def time_call(f, args):
+    t = timeit.timeit(lambda: f(*args), number=n_calls)
+    return t / n_calls * 1E6
+
+
+context = raw.fc2Context()
+raw.fc2CreateContext(context)
+guid = raw.fc2PGRGuid()
+raw.fc2GetCameraFromIndex(context, 0, guid)
+raw.fc2Connect(context, guid)
+
+image = raw.fc2Image()
+raw.fc2CreateImage(image)
+prop = raw.fc2Property()
+prop.type = raw.fc2PropertyType['FC2_SHUTTER']
+mode = ctypes.c_uint(0)
+frame_rate = ctypes.c_uint(0)
+config = raw.fc2Config()
+
+calls = [
+    (raw.fc2RetrieveBuffer, (context, image)),
+    (raw.fc2GetProperty, (context, prop)),
+    (raw.fc2GetVideoModeAndFrameRate, (context, mode, frame_rate)),
+    (raw.fc2GetConfiguration, (context, config)),
+]
+
+raw.fc2StartCapture(context)
+print("{:<32} {:>10} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+    "function", "native", "legacy", "fast", "saved", "timed", "static"))
+for f, args in calls:
+    f.bind()
+    native = time_call(f.func, args)
+    legacy = time_call(legacy_caller(f), args)
+    fast = time_call(f, args)
+    f.set_instrumented(True)
+    timed = time_call(f, args)
+    f.set_instrumented(False)
+    static = time_call(getattr(raw_static, f.name), args)
+    print((
+        "{:<32} {:>8.3f}us {:>8.3f}us {:>8.3f}us {:>8.3f}us {:>8.3f}us "
+        "{:>8.3f}us").format(
+            f.name, native, legacy, fast, legacy - fast, timed, static))
+
+raw.fc2StopCapture(context)
+raw.fc2DestroyImage(image)
+raw.fc2Disconnect(context)
+raw.fc2DestroyContext(context)
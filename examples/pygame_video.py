@@ -148,11 +148,14 @@ while not quit:
     #print "\tQueuing buffer"
     #c.buffers.queue()
     #im = c.capture()
-    im, _ = c.grab('rgb8', stop=False)
     if has_cv2 and recording and video is not None:
+        im, _ = c.grab('rgb8', stop=False)
         video.write(im[:, :, ::-1])
+        im = im[::scale, ::scale, :]
+    else:
+        # only copy the pixels that are displayed
+        im, _ = c.grab('rgb8', stop=False, decimate=scale)
     #print im.min(), im.max(), im.mean(), im.std()
-    im = im[::scale, ::scale, :]
     im = numpy.swapaxes(im, 0, 1)
     #print "\tCapture: %s" % r
     #print(im[0, 0])
@@ -168,9 +171,7 @@ while not quit:
     #    clip = clip - clip.min()
     #    clip *= (255. / clip.max())
     #sim = pygame.surfarray.map_array(screen, im)
-    pygame.surfarray.blit_array(
-        screen,
-        im.astype('uint32'))
+    pygame.surfarray.blit_array(screen, im)
     #pygame.surfarray.blit_array(
     #    screen,
     #    im.astype('uint32'))
@@ -1,8 +1,17 @@
 #!/usr/bin/env python
 
-from . import raw
-from . import oo
-
-from .oo import PointGrey
+import importlib
 
 __all__ = ['raw', 'oo', 'PointGrey']
+
+
+def __getattr__(name):
+    # raw and oo are imported on first use, so importing a module that
+    # does not need them (such as raw_static) does not load the library
+    # through raw
+    if name in ('raw', 'oo'):
+        return importlib.import_module('.' + name, __name__)
+    if name == 'PointGrey':
+        return importlib.import_module('.oo', __name__).PointGrey
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
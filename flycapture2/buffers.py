@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""
+Memory for capture buffers set with fc2SetUserBuffers (see
+PointGrey.allocate_buffers)
+
+The n buffers of size bytes are one contiguous allocation:
+    numpy: a numpy array
+    mmap: an anonymous memory map
+    shm: a multiprocessing.shared_memory block (other processes can
+        attach to it by name, see attach)
+
+The driver writes frames directly into these buffers, frames retrieved
+while they are set point into them (so zero-copy grabs are views of this
+memory, valid until the driver comes back around to the same buffer).
+"""
+
+import ctypes
+import mmap
+import weakref
+
+import numpy
+
+
+kinds = ('numpy', 'mmap', 'shm')
+
+
+class UserBuffers(object):
+    # live (not closed) buffers by address, see owner
+    instances = weakref.WeakValueDictionary()
+
+    def __init__(self, n, size, kind='numpy', name=None, shm=None):
+        if kind not in kinds:
+            raise ValueError("Invalid kind %s not in %s" % (kind, kinds))
+        self.n = int(n)
+        self.size = int(size)
+        self.kind = kind
+        total = self.n * self.size
+        self.shm = None
+        if kind == 'numpy':
+            mem = numpy.empty(total, dtype=numpy.uint8)
+        elif kind == 'mmap':
+            mem = mmap.mmap(-1, total)
+        else:
+            from multiprocessing import shared_memory
+            if shm is None:
+                shm = shared_memory.SharedMemory(
+                    name=name, create=True, size=total)
+            self.shm = shm
+            mem = shm.buf
+        self._mem = mem
+        # (n, size) bytes, each row is a buffer
+        self.array = numpy.frombuffer(
+            mem, dtype=numpy.uint8, count=total).reshape(self.n, self.size)
+        self.address = self.array.ctypes.data
+        # structs.ImageViews of frames in these buffers (which keep the
+        # buffers alive), close refuses to run while there are any
+        self.views = 0
+        UserBuffers.instances[self.address] = self
+
+    @classmethod
+    def attach(cls, name, n, size):
+        """
+        Attach to shared memory buffers created (kind 'shm') in another
+        process
+        """
+        from multiprocessing import shared_memory
+        return cls(
+            n, size, 'shm', shm=shared_memory.SharedMemory(name=name))
+
+    @classmethod
+    def owner(cls, address):
+        """
+        The live buffers holding address, None if no buffers hold it
+        """
+        for b in list(cls.instances.values()):
+            if 0 <= address - b.address < b.n * b.size:
+                return b
+        return None
+
+    @property
+    def name(self):
+        if self.shm is None:
+            return None
+        return self.shm.name
+
+    @property
+    def pointer(self):
+        return ctypes.cast(self.address, ctypes.POINTER(ctypes.c_ubyte))
+
+    def index(self, im):
+        """
+        Index of the buffer holding the data of im (an fc2Image or an
+        array from a zero-copy grab), None if the data is not in these
+        buffers
+        """
+        if isinstance(im, numpy.ndarray):
+            address = im.__array_interface__['data'][0]
+        else:
+            address = ctypes.cast(im.pData, ctypes.c_void_p).value
+        if address is None:
+            return None
+        offset = address - self.address
+        if offset < 0 or offset >= self.n * self.size:
+            return None
+        return offset // self.size
+
+    def frames(self, shape, dtype='u1', strides=None):
+        """
+        View the buffers as an (n, ) + shape array of frames
+        """
+        dtype = numpy.dtype(dtype)
+        if strides is None:
+            strides = numpy.empty(shape, dtype=dtype).strides
+        return numpy.ndarray(
+            (self.n, ) + tuple(shape), dtype, self.array,
+            strides=(self.size, ) + tuple(strides))
+
+    def __del__(self):
+        # drop the views of shared memory before it closes itself
+        self.array = None
+        self._mem = None
+
+    def close(self, unlink=True):
+        """
+        Release the memory (views of it must be deleted first), only
+        call this once the buffers are no longer set on a camera
+        """
+        if self.views:
+            raise ValueError(
+                "Can't close buffers with %s frame views alive" % self.views)
+        UserBuffers.instances.pop(self.address, None)
+        self.array = None
+        if self.kind == 'mmap':
+            self._mem.close()
+        elif self.kind == 'shm':
+            self._mem = None
+            self.shm.close()
+            if unlink:
+                self.shm.unlink()
+        self._mem = None
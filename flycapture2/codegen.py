@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+"""
+Generate a flat binding module (raw_static) from the raw.Function specs
+
+The generated module assigns restype, argtypes and errcheck directly on
+the library functions and wraps each in a plain python function with the
+real argument names and a docstring. It only imports raw_types (and
+errors) and opens the library itself, so importing it does not import
+raw, create any raw.Function objects or generate specs. The library
+functions are looked up with lib[name] so they are separate objects from
+the ones used by raw (and setting errcheck, etc in one does not affect
+the other).
+
+raw.py is itself derived from the libflycapture-c headers so rerun this
+(and check the output) whenever raw.py changes:
+
+    python -m flycapture2.codegen [output_filename]
+    python -m flycapture2.codegen --check
+"""
+
+import ctypes
+import inspect
+import keyword
+import os
+import sys
+
+from . import raw
+from . import raw_types
+
+
+default_filename = os.path.join(os.path.dirname(__file__), 'raw_static.py')
+
+header = '''#!/usr/bin/env python
+"""
+Flat libflycapture-c binding generated by flycapture2.codegen from the
+specs in flycapture2.raw, do not edit (rerun the generator instead)
+
+This does not import raw. At import, functions are bound to the library
+raw loaded (if raw is imported) or to the library opened by
+raw_types.open_library, call load (or bind) to use a different library.
+"""
+
+import ctypes
+import os
+import sys
+
+from . import errors
+from . import raw_types
+'''
+
+footer = '''
+
+def load(library=None):
+    """
+    Open library (see raw_types.open_library) and bind the functions to it
+    """
+    lib = raw_types.open_library(library)
+    bind(lib)
+    return lib
+
+
+# share the library raw loaded (if raw was imported first)
+_raw = sys.modules.get(__package__ + '.raw', None)
+if _raw is not None and _raw._lib is not None:
+    bind(_raw._lib)
+elif 'FLYCAPTURE2_LIBRARY' in os.environ:
+    load()
+else:
+    try:
+        load()
+    except OSError:
+        # no sdk, functions raise until a library is loaded with load
+        pass
+'''
+
+
+def type_source(t, namespace=raw_types):
+    """
+    Source that evaluates to the ctypes type t in the generated module
+    """
+    if t is None:
+        return 'None'
+    if getattr(ctypes, t.__name__, None) is t:
+        return 'ctypes.%s' % t.__name__
+    if type(t).__name__ == 'PyCPointerType':
+        return 'ctypes.POINTER(%s)' % type_source(t._type_, namespace)
+    for name in sorted(vars(namespace)):
+        if name[0] != '_' and getattr(namespace, name) is t:
+            return '%s.%s' % (namespace.__name__.split('.')[-1], name)
+    raise ValueError("Unknown type %s" % t)
+
+
+def arg_name(name):
+    if keyword.iskeyword(name):
+        return name + '_'
+    return name
+
+
+def binding_source(f, indent='    '):
+    """
+    Source (for inside bind) assigning the library function for f
+    """
+    lines = [
+        '_%s = lib[%r]' % (f.name, f.name),
+        '_%s.restype = %s' % (f.name, type_source(f.restype)),
+        '_%s.argtypes = [%s]' % (
+            f.name, ', '.join(type_source(t) for (_, t) in f.args)),
+    ]
+    if f.check:
+        lines.append(
+            '_%s.errcheck = errors.make_errcheck(%r)' % (f.name, f.name))
+    return ''.join(indent + l + '\n' for l in lines)
+
+
+def wrapper_source(f):
+    """
+    Source of the python function wrapping the library function for f
+    """
+    names = [arg_name(n) for (n, _) in f.args]
+    lines = ['def %s(%s):' % (f.name, ', '.join(names)), '    """']
+    lines.append('    %s(%s)' % (f.name, ', '.join(names)))
+    lines.append('')
+    for (n, (_, t)) in zip(names, f.args):
+        lines.append('    %s: %s' % (n, type_source(t)))
+    returns = '    returns: %s' % type_source(f.restype)
+    if f.check:
+        returns += ', raises errors.FlyCapture2Error on failure'
+    lines.append(returns)
+    lines.append('    """')
+    lines.append('    return _%s(%s)' % (f.name, ', '.join(names)))
+    return '\n'.join(lines) + '\n'
+
+
+def generate(functions=None):
+    """
+    Generate the source of the flat binding module for functions (a list
+    of raw.Function, defaults to all functions in raw.Function.registry)
+    """
+    if functions is None:
+        functions = list(raw.Function.registry.values())
+    names = ['_%s' % f.name for f in functions]
+    source = [header]
+    source.append('\n__all__ = [\n')
+    source.extend('    %r,\n' % f.name for f in functions)
+    source.append('    \'bind\',\n    \'load\',\n]\n')
+    source.append('\n')
+    source.extend('%s = None\n' % n for n in names)
+    source.append('\n\ndef bind(lib):\n')
+    source.append('    global %s\n' % names[0])
+    source.extend('    global %s\n' % n for n in names[1:])
+    for f in functions:
+        source.append('\n')
+        source.append(binding_source(f))
+    for f in functions:
+        source.append('\n\n')
+        source.append(wrapper_source(f))
+    source.append(footer)
+    return ''.join(source)
+
+
+def write(filename=None, functions=None):
+    if filename is None:
+        filename = default_filename
+    with open(filename, 'w') as f:
+        f.write(generate(functions))
+    return filename
+
+
+class _Stub(object):
+    pass
+
+
+class _RecordingLib(object):
+    # records the restype, argtypes and errcheck assigned by bind
+    def __init__(self):
+        self.stubs = {}
+
+    def __getitem__(self, name):
+        return self.stubs.setdefault(name, _Stub())
+
+
+def check(module=None, functions=None):
+    """
+    Check the generated module is equivalent to the dynamic (raw.Function)
+    binding: same functions, argument names, argtypes, restype and error
+    checking. Returns a list of differences (empty if equivalent)
+    """
+    if module is None:
+        from . import raw_static as module
+    if functions is None:
+        functions = list(raw.Function.registry.values())
+    lib = _RecordingLib()
+    module.bind(lib)
+    differences = []
+    for f in functions:
+        wrapper = getattr(module, f.name, None)
+        if wrapper is None:
+            differences.append('%s: missing' % f.name)
+            continue
+        names = list(inspect.signature(wrapper).parameters)
+        if names != [arg_name(n) for (n, _) in f.args]:
+            differences.append('%s: args %s' % (f.name, names))
+        stub = lib[f.name]
+        if stub.restype is not f.restype:
+            differences.append('%s: restype %s' % (f.name, stub.restype))
+        argtypes = [t for (_, t) in f.args]
+        if len(stub.argtypes) != len(argtypes) or any(
+                a is not b for (a, b) in zip(stub.argtypes, argtypes)):
+            differences.append('%s: argtypes %s' % (f.name, stub.argtypes))
+        if hasattr(stub, 'errcheck') != bool(f.check):
+            differences.append('%s: errcheck' % f.name)
+    extra = set(module.__all__) - set(f.name for f in functions) - {
+        'bind', 'load'}
+    for name in sorted(extra):
+        differences.append('%s: not in raw' % name)
+    if raw._lib is not None:
+        module.bind(raw._lib)
+    return differences
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--check':
+        differences = check()
+        for d in differences:
+            print(d)
+        sys.exit(1 if differences else 0)
+    filename = None
+    if len(sys.argv) > 1:
+        filename = sys.argv[1]
+    print("Wrote %s" % write(filename))
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
-from . import raw
+import collections
+
+from . import raw_types
 
 
 def to_dict(e):
@@ -8,24 +10,53 @@ def to_dict(e):
     r.update(e)
     return r
 
-error_codes = to_dict(raw.fc2Error)
+error_codes = to_dict(raw_types.fc2Error)
 # bus callback
-grab_modes = to_dict(raw.fc2GrabMode)
-# grab timeout
+grab_modes = to_dict(raw_types.fc2GrabMode)
+grab_timeouts = to_dict(raw_types.fc2GrabTimeout)
 # bandwith allocation
 # interface type
 # driver type
-property_types = to_dict(raw.fc2PropertyType)
-frame_rates = to_dict(raw.fc2FrameRate)
-video_modes = to_dict(raw.fc2VideoMode)
-modes = to_dict(raw.fc2Mode)
-pixel_formats = to_dict(raw.fc2PixelFormat)
+property_types = to_dict(raw_types.fc2PropertyType)
+frame_rates = to_dict(raw_types.fc2FrameRate)
+video_modes = to_dict(raw_types.fc2VideoMode)
+modes = to_dict(raw_types.fc2Mode)
+pixel_formats = to_dict(raw_types.fc2PixelFormat)
 # bus speed
 # pci bus speed
 # color processing algorithm
-bayer_tile_formats = to_dict(raw.fc2BayerTileFormat)
+bayer_tile_formats = to_dict(raw_types.fc2BayerTileFormat)
 # image file format
 # gige property type
 # statistics channel
 # os type
 # byte order
+
+# numpy typestr, channels and bits per pixel for each pixel format
+# 16 bit formats are little endian (the byte order of images returned by
+# the SDK on x86/arm hosts), packed formats (12 bit and YUV411) have
+# channels None and are viewed as rows of bytes
+PixelFormatInfo = collections.namedtuple(
+    'PixelFormatInfo', ('typestr', 'channels', 'bits'))
+pixel_format_info = {}
+for (_name, _typestr, _channels, _bits) in [
+        ('MONO8', '|u1', 1, 8),
+        ('411YUV8', '|u1', None, 12),
+        ('422YUV8', '|u1', 2, 16),
+        ('444YUV8', '|u1', 3, 24),
+        ('RGB8', '|u1', 3, 24),
+        ('MONO16', '<u2', 1, 16),
+        ('RGB16', '<u2', 3, 48),
+        ('S_MONO16', '<i2', 1, 16),
+        ('S_RGB16', '<i2', 3, 48),
+        ('RAW8', '|u1', 1, 8),
+        ('RAW16', '<u2', 1, 16),
+        ('MONO12', '|u1', None, 12),
+        ('RAW12', '|u1', None, 12),
+        ('BGR', '|u1', 3, 24),
+        ('BGRU', '|u1', 4, 32),
+        ('RGBU', '|u1', 4, 32),
+        ('BGR16', '<u2', 3, 48),
+        ('BGRU16', '<u2', 4, 64)]:
+    _format = raw_types.fc2PixelFormat['FC2_PIXEL_FORMAT_%s' % _name]
+    pixel_format_info[_format] = PixelFormatInfo(_typestr, _channels, _bits)
@@ -2,7 +2,6 @@
 
 import atexit
 
-from . import errors
 from . import raw
 
 
@@ -18,7 +17,7 @@ class Context(object):
     @classmethod
     def new(cls):
         c = raw.fc2Context()
-        errors.check_return(raw.fc2CreateContext, c)
+        raw.fc2CreateContext(c)
         cls.instances.append(c)
         return c
 
@@ -26,7 +25,7 @@ class Context(object):
     def dispose(cls):
         for instance in cls.instances:
             #print "disposing of context %s" % hex(id(instance))
-            errors.check_return(raw.fc2DestroyContext, instance)
+            raw.fc2DestroyContext(instance)
         cls.instances = []
 
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Decode embedded image info from the first pixels of frames
+
+With embedded image info enabled (see PointGrey.set_embedded_info) the
+camera overwrites the first bytes of each frame with a big endian 32 bit
+word for each enabled field, in the order of fields.
+
+    camera.set_embedded_info(timestamp=True, frameCounter=True)
+    enabled = camera.get_embedded_info()
+    ...
+    frames = numpy.stack([...])  # or a single frame
+    info = embedded.decode(frames, enabled, zero=True)
+    dropped = embedded.dropped(info['frameCounter'])
+    t = embedded.unwrap_timestamps(info['timestamp'])
+"""
+
+import numpy
+
+from . import raw
+
+
+fields = tuple(n for (n, _) in raw.fc2EmbeddedImageInfo._fields_)
+
+
+def enabled_fields(enabled=None):
+    """
+    Names of the enabled fields (in the order they are embedded)
+
+    enabled can be an fc2EmbeddedImageInfo, a dict of name: on/off (as
+    returned by PointGrey.get_embedded_info), a list of names or None
+    (all fields)
+    """
+    if enabled is None:
+        return fields
+    if isinstance(enabled, raw.fc2EmbeddedImageInfo):
+        return tuple(n for n in fields if getattr(enabled, n).onOff)
+    if isinstance(enabled, dict):
+        return tuple(n for n in fields if enabled.get(n, False))
+    for n in enabled:
+        if n not in fields:
+            raise ValueError("Unknown embedded field %s" % n)
+    return tuple(n for n in fields if n in enabled)
+
+
+def dtype(enabled=None):
+    return numpy.dtype([(n, 'u4') for n in enabled_fields(enabled)])
+
+
+def decode(frames, enabled=None, zero=False, batch=None, out=None):
+    """
+    Decode the embedded fields of a frame (rows, cols[, channels]) or a
+    batch of frames (n, rows, cols[, channels]) to a structured array
+    (of shape () or (n, )), see dtype
+
+    batch defaults to True for 4d arrays and 3d arrays with more than 4
+    columns (so not a single colour frame). If zero, the pixels holding
+    the embedded info are set to 0 (in place)
+    """
+    names = enabled_fields(enabled)
+    frames = numpy.asarray(frames)
+    if batch is None:
+        batch = frames.ndim == 4 or (
+            frames.ndim == 3 and frames.shape[-1] > 4)
+    lead = frames.shape[:1] if batch else ()
+    # first row of each frame, only this is copied (as bytes)
+    first = frames[:, 0] if batch else frames[0]
+    pixels = first.shape[len(lead)]
+    row = numpy.ascontiguousarray(first).view(numpy.uint8).reshape(
+        lead + (-1, ))
+    n_bytes = 4 * len(names)
+    if row.shape[-1] < n_bytes:
+        raise ValueError(
+            "Frame rows ({} bytes) are too short for {} fields".format(
+                row.shape[-1], len(names)))
+    words = row[..., :n_bytes].view('>u4')
+    if out is None:
+        out = numpy.empty(lead, dtype=dtype(names))
+    for (i, n) in enumerate(names):
+        out[n] = words[..., i]
+    if zero:
+        pixel_size = row.shape[-1] // pixels
+        if batch:
+            first[:, :-(-n_bytes // pixel_size)] = 0
+        else:
+            first[:-(-n_bytes // pixel_size)] = 0
+    return out
+
+
+def timestamp_to_seconds(timestamp):
+    """
+    Convert embedded (1394 cycle time) timestamps to seconds (0-128)
+
+    bits 31-25 are seconds, 24-12 the cycle count (8000 per second) and
+    11-0 the cycle offset (3072 per cycle)
+    """
+    timestamp = numpy.asarray(timestamp, dtype='u4')
+    return (
+        (timestamp >> 25) + ((timestamp >> 12) & 0x1FFF) / 8000. +
+        (timestamp & 0xFFF) / (8000. * 3072.))
+
+
+def unwrap_timestamps(timestamp):
+    """
+    Seconds since the first of a sequence of embedded timestamps (with the
+    128 second wrap around of the cycle time removed)
+    """
+    t = timestamp_to_seconds(timestamp)
+    if t.size == 0:
+        return t
+    dt = numpy.diff(t) % 128.
+    return numpy.concatenate(([0.], numpy.cumsum(dt)))
+
+
+def dropped(frame_counter):
+    """
+    Number of frames missing before each frame of a sequence of embedded
+    frame counters (0 for the first frame)
+
+    Steps are taken modulo 2 ** 32 (so the counter wrapping around is
+    handled) as signed 32 bit values: where the counter did not advance
+    the result is negative (-1 for a repeated counter, less for a step
+    back, as when the camera is restarted).
+    """
+    frame_counter = numpy.asarray(frame_counter, dtype='u4')
+    d = numpy.zeros(frame_counter.shape, dtype='i8')
+    step = (frame_counter[1:] - frame_counter[:-1]).view('i4')
+    d[1:] = step.astype('i8') - 1
+    return d
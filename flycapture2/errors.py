@@ -1,18 +1,69 @@
 #!/usr/bin/env python
 
-from . import consts
+from . import raw_types
 
 
 class FlyCapture2Error(Exception):
-    pass
+    # the fc2Error code, set for the per code subclasses (see error_classes)
+    code = None
 
 
 class FlyCapture2ConfigError(FlyCapture2Error):
     pass
 
 
+class FlyCapture2GrabError(FlyCapture2Error):
+    # no complete frame was retrieved within the allowed retries
+    pass
+
+
+def _class_name(name):
+    # FC2_ERROR_NOT_CONNECTED -> FlyCapture2NotConnectedError
+    words = name[len('FC2_ERROR_'):].split('_')
+    return 'FlyCapture2%sError' % ''.join(w.capitalize() for w in words)
+
+
+# fc2Error code -> FlyCapture2Error subclass, for example:
+#   FC2_ERROR_TIMEOUT -> FlyCapture2TimeoutError
+#   FC2_ERROR_NOT_CONNECTED -> FlyCapture2NotConnectedError
+error_classes = {}
+for _name, _code in sorted(raw_types.fc2Error.items(), key=lambda i: i[1]):
+    if _name in ('FC2_ERROR_OK', 'FC2_ERROR_FORCE_32BITS'):
+        continue
+    _cls = type(_class_name(_name), (FlyCapture2Error, ), {
+        'code': _code, '__module__': __name__})
+    globals()[_cls.__name__] = _cls
+    error_classes[_code] = _cls
+    if _code < 0:
+        # error codes are returned as unsigned ints
+        error_classes[_code & 0xFFFFFFFF] = _cls
+
+
+def from_code(code, function_name=None):
+    """
+    Make the FlyCapture2Error (subclass) instance for an error code
+    """
+    cls = error_classes.get(code, FlyCapture2Error)
+    if cls.code is not None:
+        code_name = raw_types.fc2Error[cls.code]
+    else:
+        code_name = 'unknown'
+    return cls("%s returned error %s[%s]" % (function_name, code, code_name))
+
+
+def make_errcheck(function_name):
+    """
+    Make an errcheck (see ctypes) for function_name that raises
+    a FlyCapture2Error (subclass) for non-zero return values
+    """
+    def errcheck(result, func, args):
+        if result:
+            raise from_code(result, function_name)
+        return result
+    return errcheck
+
+
 def check_return(f, *args, **kwargs):
     r = f(*args, **kwargs)
     if r != 0:
-        raise FlyCapture2Error(
-            "%s returned error %s[%s]" % (f.name, r, consts.error_codes[r]))
+        raise from_code(r, f.name)
@@ -1,13 +1,19 @@
 #!/usr/bin/env python
 
+import concurrent.futures
 import ctypes
+import threading
+import time
 
 import numpy
 
+from . import buffers
 from . import consts
 from . import ctx
+from . import embedded
 from . import errors
 from . import raw
+from . import ring
 from . import structs
 
 
@@ -18,25 +24,24 @@ def as_dict(obj):
 def get_n_cameras(context=None):
     if context is None:
         context = ctx.get()
-    n = ctypes.c_int(0)
-    errors.check_return(raw.fc2GetNumOfCameras, context, n)
+    n = ctypes.c_uint(0)
+    raw.fc2GetNumOfCameras(context, n)
     return n.value
 
 
 def get_n_devices(context=None):
     if context is None:
         context = ctx.get()
-    n = ctypes.c_int(0)
-    errors.check_return(raw.fc2GetNumOfDevices, context, n)
+    n = ctypes.c_uint(0)
+    raw.fc2GetNumOfDevices(context, n)
     return n.value
 
 
 def get_serial_number(index, context=None):
     if context is None:
         context = ctx.get()
-    sn = ctypes.c_int(0)
-    errors.check_return(
-        raw.fc2GetCameraSerialNumberFromIndex, context, index, sn)
+    sn = ctypes.c_uint(0)
+    raw.fc2GetCameraSerialNumberFromIndex(context, index, sn)
     return sn.value
 
 
@@ -45,25 +50,42 @@ def get_camera_handle(identifier, context=None):
         context = ctx.get()
     g = raw.fc2PGRGuid()
     if isinstance(identifier, str):
-        errors.check_return(
-            raw.fc2GetCameraFromSerialNumber, context, int(identifier), g)
+        raw.fc2GetCameraFromSerialNumber(context, int(identifier), g)
     else:
-        errors.check_return(
-            raw.fc2GetCameraFromIndex, context, int(identifier), g)
+        raw.fc2GetCameraFromIndex(context, int(identifier), g)
     return g
 
 
-def convert_format(im, pixel_format=None):
-    if pixel_format is None:
-        return im
+def resolve_pixel_format(pixel_format):
     if pixel_format not in consts.pixel_formats:
         pixel_format = 'FC2_PIXEL_FORMAT_%s' % pixel_format.upper()
     if isinstance(pixel_format, str):
         pixel_format = consts.pixel_formats[pixel_format]
+    return pixel_format
+
+
+def convert_format(im, pixel_format=None, out=None):
+    """
+    Convert im to pixel_format (returns im if no conversion is needed)
+
+    The result is written to out (an fc2Image) if provided, otherwise to
+    an image acquired from the structs.FCImage pool
+    """
+    if pixel_format is None:
+        return im
+    pixel_format = resolve_pixel_format(pixel_format)
     if im.format == pixel_format:
         return im
-    imo = structs.FCImage.get()
-    errors.check_return(raw.fc2ConvertImageTo, pixel_format, im, imo)
+    if out is not None:
+        raw.fc2ConvertImageTo(pixel_format, im, out)
+        return out
+    # prefer a pooled image the conversion already fits
+    imo = structs.FCImage.acquire((im.rows, im.cols, pixel_format))
+    try:
+        raw.fc2ConvertImageTo(pixel_format, im, imo)
+    except Exception:
+        structs.FCImage.release(imo)
+        raise
     return imo
 
 
@@ -75,7 +97,7 @@ def resolve_property_name(name):
     return name
 
 
-def resolve_video_mode(self, mode):
+def resolve_video_mode(mode):
     if mode not in consts.video_modes:
         mode = 'FC2_VIDEOMODE_%s' % mode
     if isinstance(mode, str):
@@ -83,7 +105,7 @@ def resolve_video_mode(self, mode):
     return mode
 
 
-def resolve_frame_rate(self, frame_rate):
+def resolve_frame_rate(frame_rate):
     if frame_rate not in consts.frame_rates:
         frame_rate = 'FC2_FRAMERATE_%s' % frame_rate
     if isinstance(frame_rate, str):
@@ -91,23 +113,502 @@ def resolve_frame_rate(self, frame_rate):
     return frame_rate
 
 
-def image_to_array(im, pixel_format=None):
-    imo = convert_format(im, pixel_format)
-    meta = as_dict(imo)
-    del meta['pData']
-    meta['bayerFormat'] = consts.bayer_tile_formats[meta['bayerFormat']]
-    meta['format'] = consts.pixel_formats[meta['format']]
-    # what about rgb?
-    depth = imo.dataSize / (imo.cols * imo.rows)
-    if depth == 1:
-        a = numpy.ctypeslib.as_array(imo.pData, (imo.rows, imo.cols)).copy()
+def resolve_grab_mode(mode):
+    if mode not in consts.grab_modes:
+        mode = 'FC2_%s' % mode.upper()
+    if isinstance(mode, str):
+        mode = consts.grab_modes[mode]
+    return mode
+
+
+def resolve_grab_timeout(timeout):
+    # ms or a fc2GrabTimeout name ('INFINITE', 'NONE')
+    if isinstance(timeout, str):
+        if timeout not in consts.grab_timeouts:
+            timeout = 'FC2_TIMEOUT_%s' % timeout.upper()
+        timeout = consts.grab_timeouts[timeout]
+    return int(timeout)
+
+
+def array_layout(im):
+    """
+    Shape, numpy typestr and strides of an array viewing the data of im
+
+    The dtype, channels and byte order come from consts.pixel_format_info
+    and rows are im.stride bytes apart (so row padding is skipped).
+    Packed formats (and unknown formats) are viewed as rows of bytes.
+    """
+    info = consts.pixel_format_info.get(im.format, None)
+    if info is None or info.channels is None:
+        if info is None:
+            row_size = im.stride
+        else:
+            row_size = im.cols * info.bits // 8
+        return (im.rows, row_size), '|u1', (im.stride, 1)
+    itemsize = numpy.dtype(info.typestr).itemsize
+    if info.channels == 1:
+        return (im.rows, im.cols), info.typestr, (im.stride, itemsize)
+    return (
+        (im.rows, im.cols, info.channels), info.typestr,
+        (im.stride, itemsize * info.channels, itemsize))
+
+
+def check_out(out, shape, dtype):
+    """
+    Check out (a caller supplied array) can hold an image of shape and dtype
+    """
+    if not isinstance(out, numpy.ndarray):
+        raise TypeError(
+            "out must be a numpy array not {}".format(type(out).__name__))
+    if out.shape != shape or out.dtype != dtype:
+        raise ValueError(
+            "out {} {} does not match image {} {}".format(
+                out.shape, out.dtype, shape, numpy.dtype(dtype)))
+    if not out.flags.writeable:
+        raise ValueError("out is not writeable")
+
+
+def check_stream_kwargs(kwargs):
+    """
+    Check grab keyword arguments for frames grabbed while capturing
+    continuously (capture is started once and left running, so no stop)
+    """
+    if 'stop' in kwargs:
+        raise ValueError("stop is not allowed, capture is left running")
+
+
+def check_ring_kwargs(kwargs):
+    """
+    Check grab keyword arguments for frames grabbed into the slots of a
+    ring (one array per frame, so no out and no list of rois, and no stop)
+    """
+    check_stream_kwargs(kwargs)
+    if 'out' in kwargs:
+        raise ValueError("out is not allowed, frames go to the ring slots")
+    roi = kwargs.get('roi', None)
+    if roi is not None and len(roi) and isinstance(roi[0], (tuple, list)):
+        raise ValueError(
+            "A list of rois is not allowed, frames are one array (use a "
+            "single roi)")
+
+
+def reduce_array(a, decimate=None, binning=None, bin_mode='mean'):
+    """
+    Decimate (keep every decimate-th row and column) and/or bin (sum or
+    average binning x binning blocks) the first two axes of a
+
+    Decimation returns a view of a. Binning only reads a (rows and
+    columns that do not fill a block are dropped) and returns a new array
+    of the accumulator dtype (uint32 for 8 and 16 bit unsigned data,
+    uint64 for wider unsigned, int64 for signed and float64 for floating
+    point data) for bin_mode 'sum' or of the dtype of a for 'mean'.
+    """
+    if decimate is not None and decimate > 1:
+        a = a[::decimate, ::decimate]
+    if binning is None or binning < 2:
+        return a
+    if bin_mode not in ('sum', 'mean'):
+        raise ValueError("Invalid bin_mode %s not sum or mean" % bin_mode)
+    if a.dtype.kind == 'i':
+        acc = 'i8'
+    elif a.dtype.kind == 'f':
+        acc = 'f8'
+    elif a.dtype.itemsize <= 2:
+        acc = 'u4'
+    else:
+        acc = 'u8'
+    rows = a.shape[0] // binning * binning
+    cols = a.shape[1] // binning * binning
+    # accumulate the strided views of each position in the blocks
+    # (much faster than summing over the axes of a reshaped view)
+    s = numpy.zeros(
+        (rows // binning, cols // binning) + a.shape[2:], dtype=acc)
+    for i in range(binning):
+        for j in range(binning):
+            s += a[i:rows:binning, j:cols:binning]
+    if bin_mode == 'sum':
+        return s
+    n = binning * binning
+    if a.dtype.kind == 'f':
+        s /= n
     else:
-        a = numpy.ctypeslib.as_array(
-            imo.pData, (imo.rows, imo.cols, depth)).copy()
-    if imo is not im:
-        structs.FCImage.destroy(imo)
-        raw.fc2DestroyImage(imo)
-    return a, meta
+        s += n // 2
+        s //= n
+    return s.astype(a.dtype)
+
+
+def roi_windows(a, roi):
+    """
+    Views of the windows of a (the first two axes) in roi, a (y0, x0,
+    height, width) tuple or a list of them
+    """
+    rois = roi
+    if len(roi) and not isinstance(roi[0], (tuple, list)):
+        rois = [roi, ]
+    windows = []
+    for r in rois:
+        if len(r) != 4:
+            raise ValueError("Invalid roi %s not (y0, x0, height, width)" % (
+                r, ))
+        y0, x0, h, w = [int(v) for v in r]
+        if (
+                y0 < 0 or x0 < 0 or h < 1 or w < 1 or
+                y0 + h > a.shape[0] or x0 + w > a.shape[1]):
+            raise ValueError("roi %s outside of image %s" % (
+                r, a.shape[:2]))
+        windows.append(a[y0:y0 + h, x0:x0 + w])
+    return windows
+
+
+def image_to_array(
+        im, pixel_format=None, copy=True, release=False, out=None,
+        converted=None, decimate=None, binning=None, bin_mode='mean',
+        roi=None):
+    """
+    Convert an fc2Image to a numpy array (and a structs.FrameMeta)
+
+    If out is provided, the image is copied into it (and out is returned).
+    out can be any writeable array (or view, such as one frame of a larger
+    stack) with the image shape and dtype.
+
+    If copy is False, the array is a view of the image data that keeps
+    the image alive. If release is True, the image is returned to the
+    structs.FCImage pool when it is no longer needed (after copying, or
+    for views when the array is garbage collected).
+
+    If converted (an fc2Image) is provided, conversions are written to it
+    instead of an image from the pool and it is never released (so with
+    copy False, the array is overwritten by the next conversion).
+
+    decimate and binning reduce the image as it is read from the image
+    data (so the full frame is never copied), see reduce_array.
+
+    roi, a (y0, x0, height, width) tuple, selects a window of the image
+    (before any decimation or binning) and only that window is copied.
+    If roi is a list of tuples, a list of arrays is returned (and out,
+    if provided, must be a list of arrays).
+    """
+    try:
+        imo = convert_format(im, pixel_format, out=converted)
+    except Exception:
+        if release:
+            structs.FCImage.release(im)
+        raise
+    # release the converted image when done with it
+    temporary = imo is not im and imo is not converted
+    # release of imo (and im if it is imo) is left to the view
+    owned = False
+    try:
+        meta = structs.FrameMeta(imo, im)
+        shape, typestr, strides = array_layout(imo)
+        info = consts.pixel_format_info.get(imo.format, None)
+        if (decimate or binning or roi is not None) and (
+                info is None or info.channels is None):
+            raise ValueError(
+                "Packed pixel format %s cannot be decimated, binned or "
+                "windowed" % (meta['format'], ))
+        single = roi is None or (
+            len(roi) and not isinstance(roi[0], (tuple, list)))
+        if not copy and out is None and not binning:
+            # converted belongs to the caller, so the view never owns it
+            owned = temporary or (release and imo is im)
+            a = numpy.asarray(structs.ImageView(
+                imo, shape, typestr, strides, release=owned))
+            if roi is None:
+                return reduce_array(a, decimate), meta
+            a = [reduce_array(w, decimate) for w in roi_windows(a, roi)]
+            return (a[0] if single else a), meta
+        view = numpy.asarray(structs.ImageView(
+            imo, shape, typestr, strides, release=False))
+        windows = [view] if roi is None else roi_windows(view, roi)
+        if out is not None and single:
+            out = [out, ]
+        if out is not None and len(out) != len(windows):
+            raise ValueError("out has %s arrays for %s rois" % (
+                len(out), len(windows)))
+        arrays = []
+        for (i, w) in enumerate(windows):
+            a = reduce_array(w, decimate, binning, bin_mode)
+            if out is not None:
+                check_out(out[i], a.shape, a.dtype)
+                numpy.copyto(out[i], a)
+                a = out[i]
+            elif a.base is not None:
+                a = a.copy()
+            arrays.append(a)
+        return (arrays[0] if single else arrays), meta
+    finally:
+        if temporary and not owned:
+            structs.FCImage.release(imo)
+        if release and not (owned and imo is im):
+            structs.FCImage.release(im)
+
+
+class Stream(object):
+    """
+    Grab frames continuously (capture is started once), see
+    PointGrey.stream
+
+    Iterating yields (array, metadata) from PointGrey.grab (called with
+    the grab keyword arguments) until n_frames frames are grabbed (or
+    forever). Capture is stopped (and the configuration restored) on
+    exit of the with block or, outside of one, when iteration ends (or
+    raises).
+    """
+    def __init__(
+            self, camera, n_frames=None, buffers=None, grab_mode=None,
+            timeout=None, **kwargs):
+        check_stream_kwargs(kwargs)
+        self.camera = camera
+        self.n_frames = n_frames
+        self.config = {}
+        if buffers is not None:
+            self.config['numBuffers'] = int(buffers)
+        if grab_mode is not None:
+            self.config['grabMode'] = resolve_grab_mode(grab_mode)
+        if timeout is not None:
+            self.config['grabTimeout'] = resolve_grab_timeout(timeout)
+        self.grab_kwargs = kwargs
+        self.n = 0
+        self.running = False
+        self._saved_config = None
+        # in a with block, capture stops on exit (not when a loop ends)
+        self._entered = False
+
+    def start(self):
+        if self.running:
+            return
+        if self.config:
+            # the number of buffers can only change while not capturing
+            self.camera.stop_capture()
+            saved = self.camera.get_config()
+            self._saved_config = {k: saved[k] for k in self.config}
+            self.camera.set_config(**self.config)
+        self.camera.start_capture()
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self.camera.stop_capture()
+        if self._saved_config is not None:
+            self.camera.set_config(**self._saved_config)
+            self._saved_config = None
+
+    def grab(self):
+        self.start()
+        r = self.camera.grab(stop=False, **self.grab_kwargs)
+        self.n += 1
+        return r
+
+    def __enter__(self):
+        self._entered = True
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._entered = False
+        self.stop()
+
+    def __iter__(self):
+        try:
+            while self.n_frames is None or self.n < self.n_frames:
+                yield self.grab()
+        finally:
+            if not self._entered:
+                self.stop()
+
+
+class Acquisition(object):
+    """
+    Grab frames on a background thread into a ring.FrameRing, see
+    PointGrey.start_acquisition
+
+    The thread calls grab (with the grab keyword arguments) copying each
+    frame straight into the next ring slot. Consumers take the next frame
+    in order (get) or the newest frame (latest). When the ring is full,
+    policy 'drop' overwrites the oldest frame and 'block' waits for a
+    consumer (and the driver drops frames instead).
+    """
+    def __init__(self, camera, n_frames=8, policy='drop', **kwargs):
+        check_ring_kwargs(kwargs)
+        self.camera = camera
+        self.grab_kwargs = kwargs
+        self.camera.start_capture()
+        # grab a frame for the shape and dtype of the ring
+        a, _ = camera.grab(stop=False, **kwargs)
+        self.ring = ring.FrameRing(n_frames, a.shape, a.dtype, policy)
+        self.error = None
+        self.timeouts = 0
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self.camera.start_capture()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=1.):
+        self.ring.close()
+        if self._thread is not None:
+            # let the thread finish the frame it is grabbing, if no
+            # frame comes, stopping capture aborts fc2RetrieveBuffer
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                self.camera.stop_capture()
+                self._thread.join()
+            self._thread = None
+        self.camera.stop_capture()
+
+    def _run(self):
+        r = self.ring
+        while True:
+            slot = r.reserve()
+            if slot is None:
+                return
+            try:
+                _, meta = self.camera.grab(
+                    stop=False, out=r.frames[slot], **self.grab_kwargs)
+            except errors.FlyCapture2TimeoutError:
+                self.timeouts += 1
+                continue
+            except Exception as e:
+                if r.closed:
+                    # stopped while grabbing
+                    return
+                # consumers see the ring closed, the error is kept
+                self.error = e
+                r.close()
+                return
+            r.commit(meta)
+
+    def get(self, timeout=None, out=None):
+        """
+        Next frame in order as (array, meta), None after timeout seconds
+        """
+        return self.ring.get(timeout, out)
+
+    def latest(self, timeout=None, out=None):
+        """
+        Newest frame as (array, meta) discarding older frames
+        """
+        return self.ring.latest(timeout, out)
+
+    def counters(self):
+        c = self.ring.counters()
+        c['timeouts'] = self.timeouts
+        return c
+
+    def __iter__(self):
+        while True:
+            r = self.get()
+            if r is None:
+                if self.error is not None:
+                    raise self.error
+                return
+            yield r
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class CallbackCapture(object):
+    """
+    Capture with fc2StartCaptureCallback delivering frames to a handler,
+    see PointGrey.start_callback_capture
+
+    The image event callback (on the driver thread) only copies the frame
+    (converted and reduced by the grab keyword arguments) into the next
+    slot of a ring.FrameRing (dropping the oldest frame when full, so it
+    never waits). A dispatch thread calls handler(array, meta) for each
+    frame in order, so a slow handler cannot block the driver.
+    """
+    def __init__(self, camera, handler, n_frames=8, **kwargs):
+        check_ring_kwargs(kwargs)
+        self.camera = camera
+        self.handler = handler
+        self.grab_kwargs = kwargs
+        # grab a frame (polling) for the shape and dtype of the ring
+        a, _ = camera.grab(stop=True, **kwargs)
+        self.ring = ring.FrameRing(n_frames, a.shape, a.dtype, 'drop')
+        self.callback_errors = 0
+        self.handler_errors = 0
+        self.error = None
+        # the ctypes callback must outlive the capture
+        self._callback = raw.fc2ImageEventCallback(self._on_image)
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _on_image(self, pImage, pCallbackData):
+        # runs on the driver thread, exceptions can't propagate
+        try:
+            slot = self.ring.reserve()
+            if slot is None:
+                return
+            _, meta = image_to_array(
+                pImage.contents, out=self.ring.frames[slot],
+                **self.grab_kwargs)
+            self.ring.commit(meta)
+        except Exception as e:
+            self.callback_errors += 1
+            self.error = e
+
+    def _dispatch(self):
+        while True:
+            r = self.ring.get()
+            if r is None:
+                return
+            try:
+                self.handler(*r)
+            except Exception as e:
+                self.handler_errors += 1
+                self.error = e
+
+    def start(self):
+        if self.running:
+            return
+        self.camera.connect()
+        self.camera.stop_capture()
+        self._thread = threading.Thread(target=self._dispatch)
+        self._thread.daemon = True
+        self._thread.start()
+        raw.fc2StartCaptureCallback(self.camera._c, self._callback, None)
+        self.camera.capturing = True
+
+    def stop(self):
+        # no callbacks after fc2StopCapture returns
+        self.camera.stop_capture()
+        self.ring.close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def counters(self):
+        c = self.ring.counters()
+        c['callback_errors'] = self.callback_errors
+        c['handler_errors'] = self.handler_errors
+        return c
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
 
 
 class PointGrey(object):
@@ -125,22 +626,53 @@ class PointGrey(object):
         self._g = get_camera_handle(identifier, context=self._c)
         self.connected = False
         self.capturing = False
+        # key (see structs.FCImage.key) of the last retrieved image
+        self._image_key = None
+        # conversion destination images by pixel format
+        self._converted = {}
+        # set by allocate_buffers
+        self.user_buffers = None
+        # regrabs of empty (and incomplete) frames, see grab
+        self.max_retries = 10
+        self.retry_backoff = 0.
+        self.accept_incomplete = False
+        self.reset_grab_counters()
 
     def get_config(self, as_dictionary=True):
         self.connect()
         c = raw.fc2Config()
-        errors.check_return(raw.fc2GetConfiguration, self._c, c)
+        raw.fc2GetConfiguration(self._c, c)
         if not as_dictionary:
             return c
         return as_dict(c)
 
     def set_config(self, **kwargs):
-        pass
+        """
+        Set fc2Config fields, for example:
+            set_config(numBuffers=20, grabMode='BUFFER_FRAMES',
+                       grabTimeout=1000)
+        grabMode and grabTimeout (ms) can also be names
+        """
+        if len(kwargs) == 0:
+            return
+        self.connect()
+        c = self.get_config(as_dictionary=False)
+        names = [n for (n, _) in c._fields_]
+        for k in kwargs:
+            if k not in names:
+                raise ValueError("Unknown config field: %s" % k)
+            v = kwargs[k]
+            if k == 'grabMode':
+                v = resolve_grab_mode(v)
+            elif k == 'grabTimeout':
+                v = resolve_grab_timeout(v)
+            setattr(c, k, v)
+        raw.fc2SetConfiguration(self._c, c)
 
     def get_camera_info(self, as_dictionary=True):
         self.connect()
         ci = raw.fc2CameraInfo()
-        errors.check_return(raw.fc2GetCameraInfo, self._c, ci)
+        raw.fc2GetCameraInfo(self._c, ci)
         if not as_dictionary:
             return ci
         return as_dict(ci)
@@ -150,7 +682,7 @@ class PointGrey(object):
         name = resolve_property_name(name)
         p = raw.fc2Property()
         p.type = name
-        errors.check_return(raw.fc2GetProperty, self._c, p)
+        raw.fc2GetProperty(self._c, p)
         if not as_dictionary:
             return p
         return as_dict(p)
@@ -163,25 +695,53 @@ class PointGrey(object):
         p = self.get_property(name, as_dictionary=False)
         for k in kwargs:
             setattr(p, k, kwargs[k])
-        errors.check_return(raw.fc2SetProperty, self._c, p)
+        raw.fc2SetProperty(self._c, p)
 
     def get_property_info(self, name, as_dictionary=True):
         self.connect()
         name = resolve_property_name(name)
         i = raw.fc2PropertyInfo()
         i.type = name
-        errors.check_return(raw.fc2GetPropertyInfo, self._c, i)
+        raw.fc2GetPropertyInfo(self._c, i)
         if not as_dictionary:
             return i
         return as_dict(i)
 
+    def get_embedded_info(self, as_dictionary=True):
+        """
+        Get the embedded image info fields as a dict of name: on/off
+        (see embedded.decode)
+        """
+        self.connect()
+        i = raw.fc2EmbeddedImageInfo()
+        raw.fc2GetEmbeddedImageInfo(self._c, i)
+        if not as_dictionary:
+            return i
+        return {n: bool(getattr(i, n).onOff) for (n, _) in i._fields_}
+
+    def set_embedded_info(self, **kwargs):
+        """
+        Turn embedded image info fields on/off, for example:
+            set_embedded_info(timestamp=True, frameCounter=True)
+        """
+        if len(kwargs) == 0:
+            return
+        i = self.get_embedded_info(as_dictionary=False)
+        for k in kwargs:
+            if k not in embedded.fields:
+                raise ValueError("Unknown embedded image info field: %s" % k)
+            p = getattr(i, k)
+            if kwargs[k] and not p.available:
+                raise errors.FlyCapture2ConfigError(
+                    "Embedded image info field not available: %s" % k)
+            p.onOff = int(bool(kwargs[k]))
+        raw.fc2SetEmbeddedImageInfo(self._c, i)
+
     def get_video_mode(self):
         self.connect()
         mode = ctypes.c_uint(0)
         frame_rate = ctypes.c_uint(0)
-        errors.check_return(
-            raw.fc2GetVideoModeAndFrameRate, self._c,
-            mode, frame_rate)
+        raw.fc2GetVideoModeAndFrameRate(self._c, mode, frame_rate)
         return (
             consts.video_modes[mode.value],
             consts.frame_rates[frame_rate.value])
@@ -193,25 +753,22 @@ class PointGrey(object):
         if not self.validate_video_mode(mode, frame_rate):
             raise errors.FlyCapture2ConfigError(
                 "Invalid video mode: %s, %s" % (mode, frame_rate))
-        errors.check_return(
-            raw.fc2GetVideoModeAndFrameRateInfo, self._c,
-            mode, frame_rate)
+        raw.fc2SetVideoModeAndFrameRate(self._c, mode, frame_rate)
 
     def validate_video_mode(self, mode, frame_rate):
         self.connect()
         mode = resolve_video_mode(mode)
         frame_rate = resolve_frame_rate(frame_rate)
         supported = ctypes.c_int(0)
-        errors.check_return(
-            raw.fc2GetVideoModeAndFrameRateInfo, self._c,
-            mode, frame_rate, supported)
+        raw.fc2GetVideoModeAndFrameRateInfo(
+            self._c, mode, frame_rate, supported)
         return supported.value
 
     def get_format7_info(self, as_dictionary=True):
         self.connect()
         fi = raw.fc2Format7Info()
         supported = ctypes.c_int(0)
-        errors.check_return(raw.fc2GetFormat7Info, self._c, fi, supported)
+        raw.fc2GetFormat7Info(self._c, fi, supported)
         if not as_dictionary:
             return fi, supported.value
         return as_dict(fi), supported.value
@@ -221,9 +778,8 @@ class PointGrey(object):
         settings = raw.fc2Format7ImageSettings()
         packet_size = ctypes.c_uint()
         percent = ctypes.c_float()
-        errors.check_return(
-            raw.fc2GetFormat7Configuration, self._c, settings,
-            packet_size, percent)
+        raw.fc2GetFormat7Configuration(
+            self._c, settings, packet_size, percent)
         return (
             structs.Format7Settings(settings), packet_size.value,
             percent.value)
@@ -234,9 +790,8 @@ class PointGrey(object):
             settings = settings.unwrap()
         packet_info = raw.fc2Format7PacketInfo()
         valid = ctypes.c_int(0)
-        errors.check_return(
-            raw.fc2ValidateFormat7Settings, self._c, settings,
-            valid, packet_info)
+        raw.fc2ValidateFormat7Settings(
+            self._c, settings, valid, packet_info)
         return bool(valid.value)
 
     def set_format7_settings(self, settings, percent=100.):
@@ -247,73 +802,400 @@ class PointGrey(object):
             raise errors.FlyCapture2ConfigError(
                 "Invalid settings: %s" % as_dict(settings))
         percent = ctypes.c_float(percent)
-        errors.check_return(
-            raw.fc2SetFormat7Configuration, self._c, settings, percent)
+        raw.fc2SetFormat7Configuration(self._c, settings, percent)
 
     def connect(self):
         if self.connected:
             return
-        errors.check_return(raw.fc2Connect, self._c, self._g)
+        raw.fc2Connect(self._c, self._g)
         self.connected = True
 
+    def conversion_image(self, pixel_format):
+        """
+        Get the fc2Image that frames grabbed (and copied) with pixel_format
+        are converted to, it is reused for every frame until
+        destroy_conversion_images (or disconnect) is called
+        """
+        pixel_format = resolve_pixel_format(pixel_format)
+        if pixel_format not in self._converted:
+            self._converted[pixel_format] = structs.FCImage.new()
+        return self._converted[pixel_format]
+
+    def destroy_conversion_images(self):
+        for im in self._converted.values():
+            structs.FCImage.destroy(im)
+        self._converted = {}
+
     def disconnect(self):
+        self.destroy_conversion_images()
         if not self.connected:
             return
-        errors.check_return(raw.fc2Disconnect, self._c)
+        raw.fc2Disconnect(self._c)
         self.connected = False
 
-    def allocate_buffers(self, s=3932160, n=10):
-        # I'm not sure what this is for or even if it's necessary
-        return
-        #im = self.raw_grab(stop=False)
-        #im = structs.FCImage.get()
-        #errors.check_return(raw.fc2RetrieveBuffer, self._c, im)
-        #size = int(im.dataSize)
-        #errors.check_return(raw.fc2DestroyImage, im)
-        size = int(s)
-        #buffers = (ctypes.c_ubyte * (size * n))()
-        self._buffers = numpy.empty(size * (n + 1), dtype='uint8')
-        buffers = self._buffers.ctypes.data_as(
-            ctypes.POINTER(ctypes.c_ubyte))
-        #buffers = ctypes.create_string_buffer(0, size * n)
-        # config has number of buffers?
-        # unsigned char * buffers
-        # int size
-        # int n_buffers
-        errors.check_return(
-            raw.fc2SetUserBuffers, self._c, buffers, size, n)
+    def frame_size(self):
+        """
+        Bytes per frame for the current format7 settings
+        """
+        settings, _, _ = self.get_format7_settings()
+        info = consts.pixel_format_info[settings.pixelFormat]
+        return settings.width * settings.height * info.bits // 8
+
+    def allocate_buffers(self, n=10, kind='numpy', size=None, name=None):
+        """
+        Allocate n capture buffers (of size bytes, defaults to the frame
+        size of the current format7 settings) and set them as the buffers
+        the driver captures into (fc2SetUserBuffers)
+
+        kind is 'numpy', 'mmap' or 'shm' (shared memory, optionally with
+        name), see buffers.UserBuffers. Retrieved images point into these
+        buffers so zero-copy grabs (copy=False) are views of them (which
+        keep the buffers alive, even after new buffers are set). Capture
+        is stopped (buffers can only be set while stopped).
+        """
+        if size is None:
+            size = self.frame_size()
+        b = buffers.UserBuffers(n, size, kind, name=name)
+        self.stop_capture()
+        raw.fc2SetUserBuffers(self._c, b.pointer, b.size, b.n)
+        self.user_buffers = b
+        return b
 
     def start_capture(self):
         if self.capturing:
             return
         self.connect()
-        # TODO setup user buffers
-        #self.allocate_buffers()
-        errors.check_return(raw.fc2StartCapture, self._c)
+        raw.fc2StartCapture(self._c)
         self.capturing = True
 
     def stop_capture(self):
         if not self.capturing:
             return
-        errors.check_return(raw.fc2StopCapture, self._c)
+        raw.fc2StopCapture(self._c)
         self.capturing = False
 
+    def stream(
+            self, n_frames=None, buffers=None, grab_mode=None, timeout=None,
+            **kwargs):
+        """
+        Grab frames without stopping capture between them
+
+            with camera.stream(buffers=20, grab_mode='BUFFER_FRAMES') as s:
+                for (a, meta) in s:
+                    ...
+
+        or just iterate (capture stops when the loop ends):
+
+            for (a, meta) in camera.stream(100):
+                ...
+
+        buffers, grab_mode and timeout (ms) set the capture configuration
+        while streaming, other keyword arguments are passed to grab (but
+        not stop, see check_stream_kwargs)
+        """
+        return Stream(
+            self, n_frames, buffers=buffers, grab_mode=grab_mode,
+            timeout=timeout, **kwargs)
+
+    def start_acquisition(self, n_frames=8, policy='drop', **kwargs):
+        """
+        Grab frames on a background thread into a ring of n_frames
+        preallocated arrays, returns the (started) Acquisition
+
+            with camera.start_acquisition(16, 'drop') as acq:
+                a, meta = acq.latest()
+
+        Keyword arguments are passed to grab (pixel_format, roi, etc, but
+        not stop, out or a list of rois, see check_ring_kwargs)
+        """
+        acq = Acquisition(self, n_frames, policy, **kwargs)
+        acq.start()
+        return acq
+
+    def start_callback_capture(self, handler, n_frames=8, **kwargs):
+        """
+        Capture with the driver calling back for each frame, frames are
+        queued (in a ring of n_frames) and passed to handler(array, meta)
+        on a separate thread. Returns the (started) CallbackCapture, call
+        stop on it (or use it in a with block) to stop capturing.
+
+        Keyword arguments are passed to image_to_array (pixel_format, roi,
+        decimate, etc, but not stop, out or a list of rois, see
+        check_ring_kwargs)
+        """
+        cap = CallbackCapture(self, handler, n_frames, **kwargs)
+        cap.start()
+        return cap
+
     def raw_grab(self, stop=True):
         self.start_capture()
-        im = structs.FCImage.get()
-        errors.check_return(raw.fc2RetrieveBuffer, self._c, im)
-        if stop:
-            self.stop_capture()
+        im = structs.FCImage.acquire(self._image_key)
+        try:
+            raw.fc2RetrieveBuffer(self._c, im)
+        except Exception:
+            structs.FCImage.release(im)
+            raise
+        finally:
+            if stop:
+                self.stop_capture()
+        self._image_key = structs.FCImage.key(im)
         return im
 
-    def grab(self, pixel_format=None, stop=True):
-        im = self.raw_grab(stop=False)
-        if im.receivedDataSize == 0:
-            # this is an empty frame, regrab
-            # to avoid these, don't start/stop grab so often
-            return self.grab(pixel_format=pixel_format, stop=stop)
-        a, meta = image_to_array(im, pixel_format)
-        structs.FCImage.destroy(im)
-        if stop:
-            self.stop_capture()
-        return a, meta
+    def reset_grab_counters(self):
+        self._grab_counters = {
+            'frames': 0, 'empty': 0, 'incomplete': 0, 'retries': 0,
+            'failed': 0, 'retry_time': 0.}
+
+    def get_grab_counters(self, reset=False):
+        """
+        Counts of frames returned by grab, empty and incomplete frames
+        retrieved, retries, grabs that ran out of retries and the time
+        (seconds) spent on frames that were regrabbed
+        """
+        counters = dict(self._grab_counters)
+        if reset:
+            self.reset_grab_counters()
+        return counters
+
+    def retrieve_frame(self, stop=True):
+        """
+        Retrieve a complete frame (an fc2Image to release with
+        structs.FCImage.release), regrabbing empty frames (no data
+        received) and incomplete frames (receivedDataSize < dataSize,
+        returned if accept_incomplete) up to max_retries times
+
+        The wait before each retry starts at retry_backoff seconds and
+        doubles with each retry. Raises errors.FlyCapture2GrabError
+        when the retries run out. If stop, capture is stopped on return
+        and on errors.
+        """
+        counters = self._grab_counters
+        retries = 0
+        try:
+            while True:
+                t0 = time.time()
+                im = self.raw_grab(stop=False)
+                if im.receivedDataSize == 0:
+                    # to avoid these, don't start/stop grab so often
+                    problem = 'empty'
+                elif im.receivedDataSize < im.dataSize:
+                    problem = 'incomplete'
+                else:
+                    problem = None
+                if problem is not None:
+                    counters[problem] += 1
+                if problem is None or (
+                        problem == 'incomplete' and self.accept_incomplete):
+                    counters['frames'] += 1
+                    return im
+                structs.FCImage.release(im)
+                counters['retry_time'] += time.time() - t0
+                if retries >= self.max_retries:
+                    counters['failed'] += 1
+                    raise errors.FlyCapture2GrabError(
+                        "No complete frame after %s retries (last was %s)"
+                        % (retries, problem))
+                if self.retry_backoff > 0:
+                    delay = self.retry_backoff * 2 ** retries
+                    time.sleep(delay)
+                    counters['retry_time'] += delay
+                retries += 1
+                counters['retries'] += 1
+        finally:
+            # also when the retries run out (or retrieving fails)
+            if stop:
+                self.stop_capture()
+
+    def grab(
+            self, pixel_format=None, stop=True, copy=True, out=None,
+            decimate=None, binning=None, bin_mode='mean', roi=None):
+        """
+        Grab a frame returning an array and a structs.FrameMeta
+
+        If copy is False, the array is a view of the grabbed image (which
+        is released when the array is garbage collected). If out is
+        provided the frame is copied into it. decimate and binning
+        reduce the frame as it is copied and roi selects windows (a list
+        of arrays is returned for a list of rois), see image_to_array
+
+        Empty frames (and incomplete frames unless accept_incomplete) are
+        regrabbed up to max_retries times, see retrieve_frame
+        """
+        try:
+            im = self.retrieve_frame(stop=False)
+            converted = None
+            if pixel_format is not None and (
+                    copy or out is not None or binning):
+                converted = self.conversion_image(pixel_format)
+            # image_to_array releases im (also on errors)
+            return image_to_array(
+                im, pixel_format, copy=copy, release=True, out=out,
+                converted=converted, decimate=decimate, binning=binning,
+                bin_mode=bin_mode, roi=roi)
+        finally:
+            # a one-shot grab never leaves the camera capturing
+            if stop:
+                self.stop_capture()
+
+
+class CameraGroup(object):
+    """
+    Synchronized capture (fc2StartSyncCapture) on several cameras yielding
+    aligned bundles of one frame per camera
+
+        with CameraGroup([0, 1], pixel_format='RGB8') as group:
+            for (frames, metas) in group:
+                ...
+
+    Each camera's frame is retrieved on its own thread. Frames are matched
+    on timestamp (within tolerance seconds) or frameCounter (which needs
+    the embedded frame counter, see PointGrey.set_embedded_info, the
+    offsets between the cameras' counters are taken from the first,
+    timestamp matched, bundle). Cameras that are behind (the driver
+    dropped the frame the others have) are regrabbed up to max_skip
+    times.
+
+    With stack, bundles are (array of n frames, list of metas) otherwise
+    ({serial: frame}, {serial: meta}). Other keyword arguments are passed
+    to PointGrey.grab (but not stop, see check_stream_kwargs, or out, see
+    grab).
+    """
+    def __init__(
+            self, cameras, match='timestamp', tolerance=0.001, stack=True,
+            max_skip=10, n_frames=None, **kwargs):
+        if match not in ('timestamp', 'frameCounter'):
+            raise ValueError(
+                "Invalid match %s not in ('timestamp', 'frameCounter')" %
+                match)
+        check_stream_kwargs(kwargs)
+        if 'out' in kwargs:
+            raise ValueError("out is not allowed, pass out to grab")
+        self.cameras = [
+            c if isinstance(c, PointGrey) else PointGrey(c) for c in cameras]
+        if len(self.cameras) == 0:
+            raise ValueError("A camera group needs at least 1 camera")
+        self.serials = [
+            c.get_camera_info()['serialNumber'] for c in self.cameras]
+        self.match = match
+        self.tolerance = tolerance
+        self.stack = stack
+        self.max_skip = max_skip
+        self.n_frames = n_frames
+        self.grab_kwargs = kwargs
+        self.n = 0
+        self.running = False
+        # per camera frames regrabbed to align bundles
+        self.skipped = [0] * len(self.cameras)
+        self.max_skew = 0.
+        self._offsets = None
+        self._pool = None
+        self._entered = False
+
+    def start(self):
+        if self.running:
+            return
+        for c in self.cameras:
+            c.connect()
+            c.stop_capture()
+        contexts = (raw.fc2Context * len(self.cameras))(
+            *[c._c for c in self.cameras])
+        raw.fc2StartSyncCapture(len(self.cameras), contexts)
+        for c in self.cameras:
+            c.capturing = True
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                len(self.cameras))
+        self._offsets = None
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        for c in self.cameras:
+            c.stop_capture()
+
+    def close(self):
+        self.stop()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def counters(self):
+        return {
+            'bundles': self.n,
+            'skipped': dict(zip(self.serials, self.skipped)),
+            'max_skew': self.max_skew,
+        }
+
+    def _grab(self, indices, out):
+        # grab (in parallel) a frame from each camera in indices
+        def grab(i):
+            kwargs = self.grab_kwargs
+            if out is not None:
+                kwargs = dict(kwargs, out=out[i])
+            return self.cameras[i].grab(stop=False, **kwargs)
+        return list(self._pool.map(grab, indices))
+
+    def _keys(self, metas):
+        if self.match == 'timestamp' or self._offsets is None:
+            return [m.timestamp for m in metas]
+        return [
+            m.frameCounter - o for (m, o) in zip(metas, self._offsets)]
+
+    def grab(self, out=None):
+        """
+        Grab an aligned bundle, with stack, frames can be grabbed into out
+        (an array of n frames)
+        """
+        self.start()
+        indices = list(range(len(self.cameras)))
+        frames = self._grab(indices, out)
+        tolerance = self.tolerance
+        if self.match == 'frameCounter' and self._offsets is not None:
+            tolerance = 0
+        regrabs = 0
+        while True:
+            keys = self._keys([m for (_, m) in frames])
+            newest = max(keys)
+            behind = [i for i in indices if newest - keys[i] > tolerance]
+            if not behind:
+                break
+            if regrabs >= self.max_skip:
+                raise errors.FlyCapture2GrabError(
+                    "Frames not aligned after %s regrabs" % regrabs)
+            regrabs += 1
+            for (i, r) in zip(behind, self._grab(behind, out)):
+                self.skipped[i] += 1
+                frames[i] = r
+        metas = [m for (_, m) in frames]
+        if self.match == 'frameCounter' and self._offsets is None:
+            self._offsets = [
+                m.frameCounter - metas[0].frameCounter for m in metas]
+        timestamps = [m.timestamp for m in metas]
+        self.max_skew = max(self.max_skew, max(timestamps) - min(timestamps))
+        self.n += 1
+        if not self.stack:
+            return (
+                {s: a for (s, (a, _)) in zip(self.serials, frames)},
+                dict(zip(self.serials, metas)))
+        if out is None:
+            out = numpy.stack([a for (a, _) in frames])
+        return out, metas
+
+    def __enter__(self):
+        self._entered = True
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._entered = False
+        self.close()
+
+    def __iter__(self):
+        try:
+            while self.n_frames is None or self.n < self.n_frames:
+                yield self.grab()
+        finally:
+            if not self._entered:
+                self.stop()
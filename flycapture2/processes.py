@@ -0,0 +1,437 @@
+#!/usr/bin/env python
+"""
+Acquisition with a process per camera writing frames into shared memory
+
+    acq = ProcessAcquisition([0, 1, 2, 3], pixel_format='RGB8')
+    with acq:
+        while True:
+            for i in range(len(acq)):
+                r = acq.get(i, timeout=1.)
+                if r is None:
+                    continue
+                frame, meta, index = r
+                ...
+                if not acq.valid(i, index):
+                    # overwritten while in use, drop the result
+                    ...
+
+Each worker process opens one camera (by identifier), grabs frames
+(with the grab keyword arguments) straight into the next slot of a
+SharedRing and updates a heartbeat. The parent (or any process that
+attaches to a ring by name) reads zero-copy views of the frames. Rings
+drop the oldest frame when full, so views are only valid until the
+worker comes back around to their slot (see SharedRing.valid).
+
+Workers are started with the 'spawn' start method by default (so no
+driver state is inherited), the library they load can be set with
+library (see raw.load), otherwise FLYCAPTURE2_LIBRARY (and for the
+simulator FLYCAPTURE2_SIM) are used.
+"""
+
+import multiprocessing
+import os
+import queue
+import time
+
+import numpy
+
+from . import errors
+from . import oo
+from . import raw
+from . import structs
+
+
+header_dtype = numpy.dtype([
+    ('head', 'i8'), ('heartbeat', 'f8'), ('pid', 'i8'), ('state', 'i8'),
+    ('grabbed', 'i8'), ('errors', 'i8'), ('timeouts', 'i8')])
+
+# worker states (header state)
+states = ('starting', 'running', 'stopped', 'error')
+
+
+def _align(n, alignment=64):
+    return -(-n // alignment) * alignment
+
+
+class SharedRing(object):
+    """
+    A ring of n frames in a multiprocessing.shared_memory block written by
+    one producer process and read (without locks) by others
+
+    The block holds a header (see header_dtype), the index of the frame
+    in each slot (-1 while it is written), a structs.FrameMeta record for
+    each slot and the frames. Frame index i is in slot i % n.
+    """
+    def __init__(self, n, shape, dtype, name=None, create=True):
+        from multiprocessing import shared_memory
+        self.n = int(n)
+        self.shape = tuple(shape)
+        self.dtype = numpy.dtype(dtype)
+        frame_size = int(numpy.prod(self.shape)) * self.dtype.itemsize
+        offsets = []
+        size = 0
+        for s in (
+                header_dtype.itemsize, 8 * self.n,
+                structs.FrameMeta.dtype.itemsize * self.n,
+                frame_size * self.n):
+            offsets.append(size)
+            size += _align(s)
+        if create:
+            self.shm = shared_memory.SharedMemory(
+                name=name, create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        buf = self.shm.buf
+        self.header = numpy.ndarray((), header_dtype, buf, offsets[0])
+        self.index = numpy.ndarray((self.n, ), 'i8', buf, offsets[1])
+        self.meta = numpy.ndarray(
+            (self.n, ), structs.FrameMeta.dtype, buf, offsets[2])
+        self.frames = numpy.ndarray(
+            (self.n, ) + self.shape, self.dtype, buf, offsets[3])
+        if create:
+            self.header.fill(0)
+            self.index[:] = -1
+
+    @classmethod
+    def attach(cls, name, n, shape, dtype):
+        return cls(n, shape, dtype, name=name, create=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def head(self):
+        # index of the next frame to be written
+        return int(self.header['head'])
+
+    # ----- producer -----
+    def reserve(self):
+        """
+        Frame (array) the producer should write the next frame to
+        """
+        slot = self.head % self.n
+        self.index[slot] = -1
+        return self.frames[slot]
+
+    def commit(self, meta=None):
+        head = self.head
+        slot = head % self.n
+        if meta is not None:
+            self.meta[slot] = meta.as_record()
+        self.index[slot] = head
+        self.header['head'] = head + 1
+        self.header['grabbed'] += 1
+
+    def beat(self):
+        self.header['heartbeat'] = time.time()
+
+    # ----- consumers -----
+    def valid(self, index):
+        """
+        True if frame index is (still) in the ring
+        """
+        return index >= 0 and int(self.index[index % self.n]) == index
+
+    def get(self, index, copy=False):
+        """
+        Frame index as (array, meta record), None if it is not in the ring
+
+        Without copy the array is a view that is overwritten once the
+        producer comes back around to it (check valid after using it).
+        With copy, the frame is copied out and checked.
+        """
+        slot = index % self.n
+        if not self.valid(index):
+            return None
+        frame = self.frames[slot]
+        meta = self.meta[slot].copy()
+        if copy:
+            frame = frame.copy()
+        if not self.valid(index):
+            return None
+        return frame, meta
+
+    def close(self, unlink=False):
+        """
+        Release this process' mapping (views of it must be deleted first)
+        """
+        self.header = self.index = self.meta = self.frames = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # views handed out are still alive, the memory is released
+            # (unmapped) once they are
+            pass
+        if unlink:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _worker(
+        index, identifier, library, n_frames, grab_timeout, kwargs, stop,
+        messages):
+    # runs in the worker process
+    if library is not None:
+        raw.load(library)
+    ring = None
+    camera = None
+    try:
+        camera = oo.PointGrey(identifier)
+        # grabs return (at least) every grab_timeout ms to check for stop
+        camera.set_config(grabTimeout=grab_timeout)
+        camera.start_capture()
+        a, _ = camera.grab(stop=False, **kwargs)
+        ring = SharedRing(n_frames, a.shape, a.dtype)
+        ring.header['pid'] = os.getpid()
+        ring.header['state'] = states.index('running')
+        ring.beat()
+        messages.put(('ready', index, ring.name, a.shape, a.dtype.str))
+        while not stop.is_set():
+            frame = ring.reserve()
+            try:
+                _, meta = camera.grab(stop=False, out=frame, **kwargs)
+            except errors.FlyCapture2TimeoutError:
+                ring.header['timeouts'] += 1
+                ring.beat()
+                continue
+            except errors.FlyCapture2GrabError:
+                ring.header['errors'] += 1
+                ring.beat()
+                continue
+            ring.commit(meta)
+            ring.beat()
+        ring.header['state'] = states.index('stopped')
+    except Exception as e:
+        if ring is not None:
+            ring.header['state'] = states.index('error')
+        messages.put(('error', index, '%s: %s' % (type(e).__name__, e)))
+    finally:
+        if camera is not None:
+            try:
+                camera.stop_capture()
+                camera.disconnect()
+            except Exception:
+                pass
+        if ring is not None:
+            # the parent unlinks the ring
+            ring.close()
+        messages.put(('stopped', index))
+
+
+class ProcessAcquisition(object):
+    """
+    Acquire from each camera (by identifier) in its own worker process
+    into a SharedRing of n_frames, see the module docstring
+
+    Workers are alive while their process runs and their heartbeat is
+    less than heartbeat seconds old. grab_timeout (ms) bounds how long a
+    worker waits for a frame (so how long it takes to notice stop).
+    Other keyword arguments are passed to PointGrey.grab in the workers.
+    """
+    def __init__(
+            self, identifiers, n_frames=8, library=None, grab_timeout=500,
+            heartbeat=2., start_method='spawn', start_timeout=30.,
+            **kwargs):
+        # frames are grabbed into ring slots (checked here for a clear
+        # error in the parent rather than in each worker)
+        oo.check_ring_kwargs(kwargs)
+        self.identifiers = list(identifiers)
+        self.n_frames = n_frames
+        self.library = library
+        self.grab_timeout = int(grab_timeout)
+        self.heartbeat = heartbeat
+        self.start_timeout = start_timeout
+        self.grab_kwargs = kwargs
+        self._mp = multiprocessing.get_context(start_method)
+        self.processes = []
+        self.rings = []
+        # next frame index get returns for each camera
+        self.next_index = []
+        self.skipped = []
+        self.errors = {}
+        self._stop = None
+        self._messages = None
+
+    def __len__(self):
+        return len(self.identifiers)
+
+    @property
+    def running(self):
+        return len(self.processes) != 0
+
+    def start(self):
+        if self.running:
+            return
+        n = len(self.identifiers)
+        self._stop = self._mp.Event()
+        self._messages = self._mp.Queue()
+        self.errors = {}
+        self.rings = [None] * n
+        self.next_index = [0] * n
+        self.skipped = [0] * n
+        for (i, identifier) in enumerate(self.identifiers):
+            p = self._mp.Process(target=_worker, args=(
+                i, identifier, self.library, self.n_frames,
+                self.grab_timeout, self.grab_kwargs, self._stop,
+                self._messages))
+            p.daemon = True
+            p.start()
+            self.processes.append(p)
+        try:
+            end = time.time() + self.start_timeout
+            while any(r is None for r in self.rings):
+                remaining = end - time.time()
+                if remaining <= 0 or not self._poll(remaining):
+                    raise errors.FlyCapture2Error(
+                        "Workers failed to start: %s" % (
+                            self.errors or 'timed out'))
+                if self.errors:
+                    raise errors.FlyCapture2Error(
+                        "Workers failed to start: %s" % self.errors)
+        except Exception:
+            self.stop()
+            raise
+
+    def _poll(self, timeout=0.):
+        # handle one message from the workers, False if there were none
+        try:
+            m = self._messages.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        if m[0] == 'ready':
+            _, i, name, shape, dtype = m
+            self.rings[i] = SharedRing.attach(
+                name, self.n_frames, shape, dtype)
+        elif m[0] == 'error':
+            self.errors[m[1]] = m[2]
+        return True
+
+    def alive(self):
+        """
+        For each worker, True if its process is running and its heartbeat
+        is recent
+        """
+        now = time.time()
+        return [
+            p.is_alive() and r is not None and
+            now - float(r.header['heartbeat']) < self.heartbeat
+            for (p, r) in zip(self.processes, self.rings)]
+
+    def check(self):
+        """
+        Raise an error if a worker reported an error or is not alive
+        """
+        while self._poll():
+            pass
+        if self.errors:
+            raise errors.FlyCapture2Error("Worker errors: %s" % self.errors)
+        dead = [i for (i, a) in enumerate(self.alive()) if not a]
+        if dead:
+            raise errors.FlyCapture2Error("Workers not alive: %s" % dead)
+
+    def get(self, i, timeout=None, copy=False):
+        """
+        Next frame from camera i as (array, meta record, frame index),
+        waiting (polling) up to timeout seconds (None: forever, checking
+        the workers are alive) for it, None on timeout
+
+        If the consumer fell a full ring behind, frames are skipped
+        """
+        r = self.rings[i]
+        if timeout is not None:
+            end = time.time() + timeout
+        last_check = time.time()
+        while True:
+            head = r.head
+            index = self.next_index[i]
+            if head - index > r.n - 1:
+                # the oldest frame could be written now, skip it too
+                self.skipped[i] += head - index - (r.n - 1)
+                index = head - (r.n - 1)
+            if index < head:
+                got = r.get(index, copy=copy)
+                if got is not None:
+                    self.next_index[i] = index + 1
+                    return got + (index, )
+                # overwritten while reading, try the next
+                self.skipped[i] += 1
+                self.next_index[i] = index + 1
+                continue
+            now = time.time()
+            if timeout is not None and now >= end:
+                return None
+            if now - last_check > self.heartbeat:
+                self.check()
+                last_check = now
+            time.sleep(0.0005)
+
+    def latest(self, i, copy=False):
+        """
+        Newest frame from camera i as (array, meta record, frame index),
+        None if there are none
+        """
+        r = self.rings[i]
+        index = r.head - 1
+        got = r.get(index, copy=copy)
+        if got is None:
+            return None
+        self.next_index[i] = index + 1
+        return got + (index, )
+
+    def valid(self, i, index):
+        return self.rings[i].valid(index)
+
+    def counters(self):
+        alive = self.alive()
+        now = time.time()
+        c = []
+        for (i, r) in enumerate(self.rings):
+            h = r.header
+            c.append({
+                'grabbed': int(h['grabbed']),
+                'errors': int(h['errors']),
+                'timeouts': int(h['timeouts']),
+                'skipped': self.skipped[i],
+                'state': states[int(h['state'])],
+                'heartbeat_age': now - float(h['heartbeat']),
+                'alive': alive[i],
+            })
+        return c
+
+    def stop(self, timeout=None):
+        """
+        Signal the workers to stop and wait for them (terminating workers
+        that take longer than timeout seconds, default a few grab
+        timeouts), then unlink the rings
+        """
+        if not self.running:
+            return
+        if timeout is None:
+            timeout = 3. * self.grab_timeout / 1000. + 1.
+        self._stop.set()
+        end = time.time() + timeout
+        for p in self.processes:
+            p.join(max(end - time.time(), 0.))
+            if p.is_alive():
+                p.terminate()
+                p.join()
+        # rings of workers that became ready after start gave up
+        while self._poll():
+            pass
+        for r in self.rings:
+            if r is not None:
+                r.close(unlink=True)
+        self.rings = []
+        self.processes = []
+        self._messages.close()
+        self._messages = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
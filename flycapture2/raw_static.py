@@ -0,0 +1,3443 @@
+#!/usr/bin/env python
+"""
+Flat libflycapture-c binding generated by flycapture2.codegen from the
+specs in flycapture2.raw, do not edit (rerun the generator instead)
+
+This does not import raw. At import, functions are bound to the library
+raw loaded (if raw is imported) or to the library opened by
+raw_types.open_library, call load (or bind) to use a different library.
+"""
+
+import ctypes
+import os
+import sys
+
+from . import errors
+from . import raw_types
+
+__all__ = [
+    'fc2CreateContext',
+    'fc2CreateGigEContext',
+    'fc2DestroyContext',
+    'fc2FireBusReset',
+    'fc2GetNumOfCameras',
+    'fc2GetCameraFromIPAddress',
+    'fc2GetCameraFromIndex',
+    'fc2GetCameraFromSerialNumber',
+    'fc2GetCameraSerialNumberFromIndex',
+    'fc2GetInterfaceTypeFromGuid',
+    'fc2GetNumOfDevices',
+    'fc2GetDeviceFromIndex',
+    'fc2ReadPhyRegister',
+    'fc2WritePhyRegister',
+    'fc2GetUsbLinkInfo',
+    'fc2GetUsbPortStatus',
+    'fc2GetTopology',
+    'fc2RegisterCallback',
+    'fc2UnregisterCallback',
+    'fc2RescanBus',
+    'fc2ForceIPAddressToCamera',
+    'fc2ForceAllIPAddressesAutomatically',
+    'fc2ForceIPAddressAutomatically',
+    'fc2DiscoverGigECameras',
+    'fc2IsCameraControlable',
+    'fc2Connect',
+    'fc2Disconnect',
+    'fc2IsConnected',
+    'fc2SetCallback',
+    'fc2StartCapture',
+    'fc2StartCaptureCallback',
+    'fc2StartSyncCapture',
+    'fc2StartSyncCaptureCallback',
+    'fc2RetrieveBuffer',
+    'fc2StopCapture',
+    'fc2WaitForBufferEvent',
+    'fc2SetUserBuffers',
+    'fc2GetConfiguration',
+    'fc2SetConfiguration',
+    'fc2GetCameraInfo',
+    'fc2GetPropertyInfo',
+    'fc2GetProperty',
+    'fc2SetProperty',
+    'fc2SetPropertyBroadcast',
+    'fc2GetGPIOPinDirection',
+    'fc2SetGPIOPinDirection',
+    'fc2SetGPIOPinDirectionBroadcast',
+    'fc2GetTriggerModeInfo',
+    'fc2GetTriggerMode',
+    'fc2SetTriggerMode',
+    'fc2SetTriggerModeBroadcast',
+    'fc2FireSoftwareTrigger',
+    'fc2FireSoftwareTriggerBroadcast',
+    'fc2GetTriggerDelayInfo',
+    'fc2GetTriggerDelay',
+    'fc2SetTriggerDelay',
+    'fc2SetTriggerDelayBroadcast',
+    'fc2GetStrobeInfo',
+    'fc2GetStrobe',
+    'fc2SetStrobe',
+    'fc2SetStrobeBroadcast',
+    'fc2GetLUTInfo',
+    'fc2GetLUTBankInfo',
+    'fc2GetActiveLUTBank',
+    'fc2SetActiveLUTBank',
+    'fc2EnableLUT',
+    'fc2GetLUTChannel',
+    'fc2SetLUTChannel',
+    'fc2GetMemoryChannel',
+    'fc2SaveToMemoryChannel',
+    'fc2RestoreFromMemoryChannel',
+    'fc2GetMemoryChannelInfo',
+    'fc2GetEmbeddedImageInfo',
+    'fc2SetEmbeddedImageInfo',
+    'fc2WriteRegister',
+    'fc2ReadRegister',
+    'fc2WriteRegisterBroadcast',
+    'fc2WriteRegisterBlock',
+    'fc2ReadRegisterBlock',
+    'fc2GetRegisterString',
+    'fc2GetCycleTime',
+    'fc2GetStats',
+    'fc2RegisterEvent',
+    'fc2DeregisterEvent',
+    'fc2RegisterAllEvents',
+    'fc2DeregisterAllEvents',
+    'fc2GetVideoModeAndFrameRateInfo',
+    'fc2GetVideoModeAndFrameRate',
+    'fc2SetVideoModeAndFrameRate',
+    'fc2GetFormat7Info',
+    'fc2ValidateFormat7Settings',
+    'fc2GetFormat7Configuration',
+    'fc2SetFormat7ConfigurationPacket',
+    'fc2SetFormat7Configuration',
+    'fc2WriteGVCPRegister',
+    'fc2WriteGVCPRegisterBroadcast',
+    'fc2ReadGVCPRegister',
+    'fc2WriteGVCPRegisterBlock',
+    'fc2ReadGVCPRegisterBlock',
+    'fc2WriteGVCPMemory',
+    'fc2ReadGVCPMemory',
+    'fc2GetGigEProperty',
+    'fc2SetGigEProperty',
+    'fc2DiscoverGigEPacketSize',
+    'fc2QueryGigEImagingMode',
+    'fc2GetGigEImagingMode',
+    'fc2SetGigEImagingMode',
+    'fc2GetGigEImageSettingsInfo',
+    'fc2GetGigEImageSettings',
+    'fc2SetGigEImageSettings',
+    'fc2GetGigEImageBinningSettings',
+    'fc2SetGigEImageBinningSettings',
+    'fc2GetNumStreamChannels',
+    'fc2GetGigEStreamChannelInfo',
+    'fc2SetGigEStreamChannelInfo',
+    'fc2GetGigEConfig',
+    'fc2SetGigEConfig',
+    'fc2SetDefaultColorProcessing',
+    'fc2GetDefaultColorProcessing',
+    'fc2SetDefaultOutputFormat',
+    'fc2GetDefaultOutputFormat',
+    'fc2DetermineBitsPerPixel',
+    'fc2CreateImage',
+    'fc2DestroyImage',
+    'fc2SetImageDimensions',
+    'fc2GetImageDimensions',
+    'fc2SetImageColorProcessing',
+    'fc2GetImageColorProcessing',
+    'fc2SetImageData',
+    'fc2GetImageData',
+    'fc2GetImageMetadata',
+    'fc2GetImageTimeStamp',
+    'fc2SaveImage',
+    'fc2SaveImageWithOption',
+    'fc2ConvertImage',
+    'fc2ConvertImageTo',
+    'fc2CalculateImageStatistics',
+    'fc2CreateImageStatistics',
+    'fc2DestroyImageStatistics',
+    'fc2ImageStatisticsEnableAll',
+    'fc2ImageStatisticsDisableAll',
+    'fc2ImageStatisticsEnableGreyOnly',
+    'fc2ImageStatisticsEnableRGBOnly',
+    'fc2ImageStatisticsEnableHSLOnly',
+    'fc2GetChannelStatus',
+    'fc2SetChannelStatus',
+    'fc2GetChannelRange',
+    'fc2GetChannelPixelValueRange',
+    'fc2GetChannelNumPixelValues',
+    'fc2GetChannelMean',
+    'fc2GetChannelHistogram',
+    'fc2GetImageStatistics',
+    'fc2CreateTopologyNode',
+    'fc2TopologyNodeGetGuid',
+    'fc2TopologyNodeGetDeviceId',
+    'fc2TopologyNodeGetNodeType',
+    'fc2TopologyNodeGetInterfaceType',
+    'fc2TopologyNodeGetNumChildren',
+    'fc2TopologyNodeGetChild',
+    'fc2TopologyNodeAddChild',
+    'fc2TopologyNodeGetNumPorts',
+    'fc2TopologyNodeGetPortType',
+    'fc2TopologyNodeAddPortType',
+    'fc2TopologyNodeAssignGuidToNode',
+    'fc2TopologyNodeAssignGuidToNodeEx',
+    'fc2DestroyTopologyNode',
+    'fc2CheckDriver',
+    'fc2GetDriverDeviceName',
+    'fc2GetSystemInfo',
+    'fc2GetLibraryVersion',
+    'fc2LaunchBrowser',
+    'fc2LaunchHelp',
+    'fc2LaunchCommand',
+    'fc2LaunchCommandAsync',
+    'fc2ErrorToDescription',
+    'bind',
+    'load',
+]
+
+_fc2CreateContext = None
+_fc2CreateGigEContext = None
+_fc2DestroyContext = None
+_fc2FireBusReset = None
+_fc2GetNumOfCameras = None
+_fc2GetCameraFromIPAddress = None
+_fc2GetCameraFromIndex = None
+_fc2GetCameraFromSerialNumber = None
+_fc2GetCameraSerialNumberFromIndex = None
+_fc2GetInterfaceTypeFromGuid = None
+_fc2GetNumOfDevices = None
+_fc2GetDeviceFromIndex = None
+_fc2ReadPhyRegister = None
+_fc2WritePhyRegister = None
+_fc2GetUsbLinkInfo = None
+_fc2GetUsbPortStatus = None
+_fc2GetTopology = None
+_fc2RegisterCallback = None
+_fc2UnregisterCallback = None
+_fc2RescanBus = None
+_fc2ForceIPAddressToCamera = None
+_fc2ForceAllIPAddressesAutomatically = None
+_fc2ForceIPAddressAutomatically = None
+_fc2DiscoverGigECameras = None
+_fc2IsCameraControlable = None
+_fc2Connect = None
+_fc2Disconnect = None
+_fc2IsConnected = None
+_fc2SetCallback = None
+_fc2StartCapture = None
+_fc2StartCaptureCallback = None
+_fc2StartSyncCapture = None
+_fc2StartSyncCaptureCallback = None
+_fc2RetrieveBuffer = None
+_fc2StopCapture = None
+_fc2WaitForBufferEvent = None
+_fc2SetUserBuffers = None
+_fc2GetConfiguration = None
+_fc2SetConfiguration = None
+_fc2GetCameraInfo = None
+_fc2GetPropertyInfo = None
+_fc2GetProperty = None
+_fc2SetProperty = None
+_fc2SetPropertyBroadcast = None
+_fc2GetGPIOPinDirection = None
+_fc2SetGPIOPinDirection = None
+_fc2SetGPIOPinDirectionBroadcast = None
+_fc2GetTriggerModeInfo = None
+_fc2GetTriggerMode = None
+_fc2SetTriggerMode = None
+_fc2SetTriggerModeBroadcast = None
+_fc2FireSoftwareTrigger = None
+_fc2FireSoftwareTriggerBroadcast = None
+_fc2GetTriggerDelayInfo = None
+_fc2GetTriggerDelay = None
+_fc2SetTriggerDelay = None
+_fc2SetTriggerDelayBroadcast = None
+_fc2GetStrobeInfo = None
+_fc2GetStrobe = None
+_fc2SetStrobe = None
+_fc2SetStrobeBroadcast = None
+_fc2GetLUTInfo = None
+_fc2GetLUTBankInfo = None
+_fc2GetActiveLUTBank = None
+_fc2SetActiveLUTBank = None
+_fc2EnableLUT = None
+_fc2GetLUTChannel = None
+_fc2SetLUTChannel = None
+_fc2GetMemoryChannel = None
+_fc2SaveToMemoryChannel = None
+_fc2RestoreFromMemoryChannel = None
+_fc2GetMemoryChannelInfo = None
+_fc2GetEmbeddedImageInfo = None
+_fc2SetEmbeddedImageInfo = None
+_fc2WriteRegister = None
+_fc2ReadRegister = None
+_fc2WriteRegisterBroadcast = None
+_fc2WriteRegisterBlock = None
+_fc2ReadRegisterBlock = None
+_fc2GetRegisterString = None
+_fc2GetCycleTime = None
+_fc2GetStats = None
+_fc2RegisterEvent = None
+_fc2DeregisterEvent = None
+_fc2RegisterAllEvents = None
+_fc2DeregisterAllEvents = None
+_fc2GetVideoModeAndFrameRateInfo = None
+_fc2GetVideoModeAndFrameRate = None
+_fc2SetVideoModeAndFrameRate = None
+_fc2GetFormat7Info = None
+_fc2ValidateFormat7Settings = None
+_fc2GetFormat7Configuration = None
+_fc2SetFormat7ConfigurationPacket = None
+_fc2SetFormat7Configuration = None
+_fc2WriteGVCPRegister = None
+_fc2WriteGVCPRegisterBroadcast = None
+_fc2ReadGVCPRegister = None
+_fc2WriteGVCPRegisterBlock = None
+_fc2ReadGVCPRegisterBlock = None
+_fc2WriteGVCPMemory = None
+_fc2ReadGVCPMemory = None
+_fc2GetGigEProperty = None
+_fc2SetGigEProperty = None
+_fc2DiscoverGigEPacketSize = None
+_fc2QueryGigEImagingMode = None
+_fc2GetGigEImagingMode = None
+_fc2SetGigEImagingMode = None
+_fc2GetGigEImageSettingsInfo = None
+_fc2GetGigEImageSettings = None
+_fc2SetGigEImageSettings = None
+_fc2GetGigEImageBinningSettings = None
+_fc2SetGigEImageBinningSettings = None
+_fc2GetNumStreamChannels = None
+_fc2GetGigEStreamChannelInfo = None
+_fc2SetGigEStreamChannelInfo = None
+_fc2GetGigEConfig = None
+_fc2SetGigEConfig = None
+_fc2SetDefaultColorProcessing = None
+_fc2GetDefaultColorProcessing = None
+_fc2SetDefaultOutputFormat = None
+_fc2GetDefaultOutputFormat = None
+_fc2DetermineBitsPerPixel = None
+_fc2CreateImage = None
+_fc2DestroyImage = None
+_fc2SetImageDimensions = None
+_fc2GetImageDimensions = None
+_fc2SetImageColorProcessing = None
+_fc2GetImageColorProcessing = None
+_fc2SetImageData = None
+_fc2GetImageData = None
+_fc2GetImageMetadata = None
+_fc2GetImageTimeStamp = None
+_fc2SaveImage = None
+_fc2SaveImageWithOption = None
+_fc2ConvertImage = None
+_fc2ConvertImageTo = None
+_fc2CalculateImageStatistics = None
+_fc2CreateImageStatistics = None
+_fc2DestroyImageStatistics = None
+_fc2ImageStatisticsEnableAll = None
+_fc2ImageStatisticsDisableAll = None
+_fc2ImageStatisticsEnableGreyOnly = None
+_fc2ImageStatisticsEnableRGBOnly = None
+_fc2ImageStatisticsEnableHSLOnly = None
+_fc2GetChannelStatus = None
+_fc2SetChannelStatus = None
+_fc2GetChannelRange = None
+_fc2GetChannelPixelValueRange = None
+_fc2GetChannelNumPixelValues = None
+_fc2GetChannelMean = None
+_fc2GetChannelHistogram = None
+_fc2GetImageStatistics = None
+_fc2CreateTopologyNode = None
+_fc2TopologyNodeGetGuid = None
+_fc2TopologyNodeGetDeviceId = None
+_fc2TopologyNodeGetNodeType = None
+_fc2TopologyNodeGetInterfaceType = None
+_fc2TopologyNodeGetNumChildren = None
+_fc2TopologyNodeGetChild = None
+_fc2TopologyNodeAddChild = None
+_fc2TopologyNodeGetNumPorts = None
+_fc2TopologyNodeGetPortType = None
+_fc2TopologyNodeAddPortType = None
+_fc2TopologyNodeAssignGuidToNode = None
+_fc2TopologyNodeAssignGuidToNodeEx = None
+_fc2DestroyTopologyNode = None
+_fc2CheckDriver = None
+_fc2GetDriverDeviceName = None
+_fc2GetSystemInfo = None
+_fc2GetLibraryVersion = None
+_fc2LaunchBrowser = None
+_fc2LaunchHelp = None
+_fc2LaunchCommand = None
+_fc2LaunchCommandAsync = None
+_fc2ErrorToDescription = None
+
+
+def bind(lib):
+    global _fc2CreateContext
+    global _fc2CreateGigEContext
+    global _fc2DestroyContext
+    global _fc2FireBusReset
+    global _fc2GetNumOfCameras
+    global _fc2GetCameraFromIPAddress
+    global _fc2GetCameraFromIndex
+    global _fc2GetCameraFromSerialNumber
+    global _fc2GetCameraSerialNumberFromIndex
+    global _fc2GetInterfaceTypeFromGuid
+    global _fc2GetNumOfDevices
+    global _fc2GetDeviceFromIndex
+    global _fc2ReadPhyRegister
+    global _fc2WritePhyRegister
+    global _fc2GetUsbLinkInfo
+    global _fc2GetUsbPortStatus
+    global _fc2GetTopology
+    global _fc2RegisterCallback
+    global _fc2UnregisterCallback
+    global _fc2RescanBus
+    global _fc2ForceIPAddressToCamera
+    global _fc2ForceAllIPAddressesAutomatically
+    global _fc2ForceIPAddressAutomatically
+    global _fc2DiscoverGigECameras
+    global _fc2IsCameraControlable
+    global _fc2Connect
+    global _fc2Disconnect
+    global _fc2IsConnected
+    global _fc2SetCallback
+    global _fc2StartCapture
+    global _fc2StartCaptureCallback
+    global _fc2StartSyncCapture
+    global _fc2StartSyncCaptureCallback
+    global _fc2RetrieveBuffer
+    global _fc2StopCapture
+    global _fc2WaitForBufferEvent
+    global _fc2SetUserBuffers
+    global _fc2GetConfiguration
+    global _fc2SetConfiguration
+    global _fc2GetCameraInfo
+    global _fc2GetPropertyInfo
+    global _fc2GetProperty
+    global _fc2SetProperty
+    global _fc2SetPropertyBroadcast
+    global _fc2GetGPIOPinDirection
+    global _fc2SetGPIOPinDirection
+    global _fc2SetGPIOPinDirectionBroadcast
+    global _fc2GetTriggerModeInfo
+    global _fc2GetTriggerMode
+    global _fc2SetTriggerMode
+    global _fc2SetTriggerModeBroadcast
+    global _fc2FireSoftwareTrigger
+    global _fc2FireSoftwareTriggerBroadcast
+    global _fc2GetTriggerDelayInfo
+    global _fc2GetTriggerDelay
+    global _fc2SetTriggerDelay
+    global _fc2SetTriggerDelayBroadcast
+    global _fc2GetStrobeInfo
+    global _fc2GetStrobe
+    global _fc2SetStrobe
+    global _fc2SetStrobeBroadcast
+    global _fc2GetLUTInfo
+    global _fc2GetLUTBankInfo
+    global _fc2GetActiveLUTBank
+    global _fc2SetActiveLUTBank
+    global _fc2EnableLUT
+    global _fc2GetLUTChannel
+    global _fc2SetLUTChannel
+    global _fc2GetMemoryChannel
+    global _fc2SaveToMemoryChannel
+    global _fc2RestoreFromMemoryChannel
+    global _fc2GetMemoryChannelInfo
+    global _fc2GetEmbeddedImageInfo
+    global _fc2SetEmbeddedImageInfo
+    global _fc2WriteRegister
+    global _fc2ReadRegister
+    global _fc2WriteRegisterBroadcast
+    global _fc2WriteRegisterBlock
+    global _fc2ReadRegisterBlock
+    global _fc2GetRegisterString
+    global _fc2GetCycleTime
+    global _fc2GetStats
+    global _fc2RegisterEvent
+    global _fc2DeregisterEvent
+    global _fc2RegisterAllEvents
+    global _fc2DeregisterAllEvents
+    global _fc2GetVideoModeAndFrameRateInfo
+    global _fc2GetVideoModeAndFrameRate
+    global _fc2SetVideoModeAndFrameRate
+    global _fc2GetFormat7Info
+    global _fc2ValidateFormat7Settings
+    global _fc2GetFormat7Configuration
+    global _fc2SetFormat7ConfigurationPacket
+    global _fc2SetFormat7Configuration
+    global _fc2WriteGVCPRegister
+    global _fc2WriteGVCPRegisterBroadcast
+    global _fc2ReadGVCPRegister
+    global _fc2WriteGVCPRegisterBlock
+    global _fc2ReadGVCPRegisterBlock
+    global _fc2WriteGVCPMemory
+    global _fc2ReadGVCPMemory
+    global _fc2GetGigEProperty
+    global _fc2SetGigEProperty
+    global _fc2DiscoverGigEPacketSize
+    global _fc2QueryGigEImagingMode
+    global _fc2GetGigEImagingMode
+    global _fc2SetGigEImagingMode
+    global _fc2GetGigEImageSettingsInfo
+    global _fc2GetGigEImageSettings
+    global _fc2SetGigEImageSettings
+    global _fc2GetGigEImageBinningSettings
+    global _fc2SetGigEImageBinningSettings
+    global _fc2GetNumStreamChannels
+    global _fc2GetGigEStreamChannelInfo
+    global _fc2SetGigEStreamChannelInfo
+    global _fc2GetGigEConfig
+    global _fc2SetGigEConfig
+    global _fc2SetDefaultColorProcessing
+    global _fc2GetDefaultColorProcessing
+    global _fc2SetDefaultOutputFormat
+    global _fc2GetDefaultOutputFormat
+    global _fc2DetermineBitsPerPixel
+    global _fc2CreateImage
+    global _fc2DestroyImage
+    global _fc2SetImageDimensions
+    global _fc2GetImageDimensions
+    global _fc2SetImageColorProcessing
+    global _fc2GetImageColorProcessing
+    global _fc2SetImageData
+    global _fc2GetImageData
+    global _fc2GetImageMetadata
+    global _fc2GetImageTimeStamp
+    global _fc2SaveImage
+    global _fc2SaveImageWithOption
+    global _fc2ConvertImage
+    global _fc2ConvertImageTo
+    global _fc2CalculateImageStatistics
+    global _fc2CreateImageStatistics
+    global _fc2DestroyImageStatistics
+    global _fc2ImageStatisticsEnableAll
+    global _fc2ImageStatisticsDisableAll
+    global _fc2ImageStatisticsEnableGreyOnly
+    global _fc2ImageStatisticsEnableRGBOnly
+    global _fc2ImageStatisticsEnableHSLOnly
+    global _fc2GetChannelStatus
+    global _fc2SetChannelStatus
+    global _fc2GetChannelRange
+    global _fc2GetChannelPixelValueRange
+    global _fc2GetChannelNumPixelValues
+    global _fc2GetChannelMean
+    global _fc2GetChannelHistogram
+    global _fc2GetImageStatistics
+    global _fc2CreateTopologyNode
+    global _fc2TopologyNodeGetGuid
+    global _fc2TopologyNodeGetDeviceId
+    global _fc2TopologyNodeGetNodeType
+    global _fc2TopologyNodeGetInterfaceType
+    global _fc2TopologyNodeGetNumChildren
+    global _fc2TopologyNodeGetChild
+    global _fc2TopologyNodeAddChild
+    global _fc2TopologyNodeGetNumPorts
+    global _fc2TopologyNodeGetPortType
+    global _fc2TopologyNodeAddPortType
+    global _fc2TopologyNodeAssignGuidToNode
+    global _fc2TopologyNodeAssignGuidToNodeEx
+    global _fc2DestroyTopologyNode
+    global _fc2CheckDriver
+    global _fc2GetDriverDeviceName
+    global _fc2GetSystemInfo
+    global _fc2GetLibraryVersion
+    global _fc2LaunchBrowser
+    global _fc2LaunchHelp
+    global _fc2LaunchCommand
+    global _fc2LaunchCommandAsync
+    global _fc2ErrorToDescription
+
+    _fc2CreateContext = lib['fc2CreateContext']
+    _fc2CreateContext.restype = ctypes.c_uint
+    _fc2CreateContext.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    _fc2CreateContext.errcheck = errors.make_errcheck('fc2CreateContext')
+
+    _fc2CreateGigEContext = lib['fc2CreateGigEContext']
+    _fc2CreateGigEContext.restype = ctypes.c_uint
+    _fc2CreateGigEContext.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    _fc2CreateGigEContext.errcheck = errors.make_errcheck('fc2CreateGigEContext')
+
+    _fc2DestroyContext = lib['fc2DestroyContext']
+    _fc2DestroyContext.restype = ctypes.c_uint
+    _fc2DestroyContext.argtypes = [ctypes.c_void_p]
+    _fc2DestroyContext.errcheck = errors.make_errcheck('fc2DestroyContext')
+
+    _fc2FireBusReset = lib['fc2FireBusReset']
+    _fc2FireBusReset.restype = ctypes.c_uint
+    _fc2FireBusReset.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2PGRGuid)]
+    _fc2FireBusReset.errcheck = errors.make_errcheck('fc2FireBusReset')
+
+    _fc2GetNumOfCameras = lib['fc2GetNumOfCameras']
+    _fc2GetNumOfCameras.restype = ctypes.c_uint
+    _fc2GetNumOfCameras.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetNumOfCameras.errcheck = errors.make_errcheck('fc2GetNumOfCameras')
+
+    _fc2GetCameraFromIPAddress = lib['fc2GetCameraFromIPAddress']
+    _fc2GetCameraFromIPAddress.restype = ctypes.c_uint
+    _fc2GetCameraFromIPAddress.argtypes = [ctypes.c_void_p, raw_types.fc2IPAddress, ctypes.POINTER(raw_types.fc2PGRGuid)]
+    _fc2GetCameraFromIPAddress.errcheck = errors.make_errcheck('fc2GetCameraFromIPAddress')
+
+    _fc2GetCameraFromIndex = lib['fc2GetCameraFromIndex']
+    _fc2GetCameraFromIndex.restype = ctypes.c_uint
+    _fc2GetCameraFromIndex.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(raw_types.fc2PGRGuid)]
+    _fc2GetCameraFromIndex.errcheck = errors.make_errcheck('fc2GetCameraFromIndex')
+
+    _fc2GetCameraFromSerialNumber = lib['fc2GetCameraFromSerialNumber']
+    _fc2GetCameraFromSerialNumber.restype = ctypes.c_uint
+    _fc2GetCameraFromSerialNumber.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(raw_types.fc2PGRGuid)]
+    _fc2GetCameraFromSerialNumber.errcheck = errors.make_errcheck('fc2GetCameraFromSerialNumber')
+
+    _fc2GetCameraSerialNumberFromIndex = lib['fc2GetCameraSerialNumberFromIndex']
+    _fc2GetCameraSerialNumberFromIndex.restype = ctypes.c_uint
+    _fc2GetCameraSerialNumberFromIndex.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetCameraSerialNumberFromIndex.errcheck = errors.make_errcheck('fc2GetCameraSerialNumberFromIndex')
+
+    _fc2GetInterfaceTypeFromGuid = lib['fc2GetInterfaceTypeFromGuid']
+    _fc2GetInterfaceTypeFromGuid.restype = ctypes.c_uint
+    _fc2GetInterfaceTypeFromGuid.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2PGRGuid), ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetInterfaceTypeFromGuid.errcheck = errors.make_errcheck('fc2GetInterfaceTypeFromGuid')
+
+    _fc2GetNumOfDevices = lib['fc2GetNumOfDevices']
+    _fc2GetNumOfDevices.restype = ctypes.c_uint
+    _fc2GetNumOfDevices.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetNumOfDevices.errcheck = errors.make_errcheck('fc2GetNumOfDevices')
+
+    _fc2GetDeviceFromIndex = lib['fc2GetDeviceFromIndex']
+    _fc2GetDeviceFromIndex.restype = ctypes.c_uint
+    _fc2GetDeviceFromIndex.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(raw_types.fc2PGRGuid)]
+    _fc2GetDeviceFromIndex.errcheck = errors.make_errcheck('fc2GetDeviceFromIndex')
+
+    _fc2ReadPhyRegister = lib['fc2ReadPhyRegister']
+    _fc2ReadPhyRegister.restype = ctypes.c_uint
+    _fc2ReadPhyRegister.argtypes = [ctypes.c_void_p, raw_types.fc2PGRGuid, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2ReadPhyRegister.errcheck = errors.make_errcheck('fc2ReadPhyRegister')
+
+    _fc2WritePhyRegister = lib['fc2WritePhyRegister']
+    _fc2WritePhyRegister.restype = ctypes.c_uint
+    _fc2WritePhyRegister.argtypes = [ctypes.c_void_p, raw_types.fc2PGRGuid, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint]
+    _fc2WritePhyRegister.errcheck = errors.make_errcheck('fc2WritePhyRegister')
+
+    _fc2GetUsbLinkInfo = lib['fc2GetUsbLinkInfo']
+    _fc2GetUsbLinkInfo.restype = ctypes.c_uint
+    _fc2GetUsbLinkInfo.argtypes = [ctypes.c_void_p, raw_types.fc2PGRGuid, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetUsbLinkInfo.errcheck = errors.make_errcheck('fc2GetUsbLinkInfo')
+
+    _fc2GetUsbPortStatus = lib['fc2GetUsbPortStatus']
+    _fc2GetUsbPortStatus.restype = ctypes.c_uint
+    _fc2GetUsbPortStatus.argtypes = [ctypes.c_void_p, raw_types.fc2PGRGuid, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetUsbPortStatus.errcheck = errors.make_errcheck('fc2GetUsbPortStatus')
+
+    _fc2GetTopology = lib['fc2GetTopology']
+    _fc2GetTopology.restype = ctypes.c_uint
+    _fc2GetTopology.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
+    _fc2GetTopology.errcheck = errors.make_errcheck('fc2GetTopology')
+
+    _fc2RegisterCallback = lib['fc2RegisterCallback']
+    _fc2RegisterCallback.restype = ctypes.c_uint
+    _fc2RegisterCallback.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
+    _fc2RegisterCallback.errcheck = errors.make_errcheck('fc2RegisterCallback')
+
+    _fc2UnregisterCallback = lib['fc2UnregisterCallback']
+    _fc2UnregisterCallback.restype = ctypes.c_uint
+    _fc2UnregisterCallback.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    _fc2UnregisterCallback.errcheck = errors.make_errcheck('fc2UnregisterCallback')
+
+    _fc2RescanBus = lib['fc2RescanBus']
+    _fc2RescanBus.restype = ctypes.c_uint
+    _fc2RescanBus.argtypes = [ctypes.c_void_p]
+    _fc2RescanBus.errcheck = errors.make_errcheck('fc2RescanBus')
+
+    _fc2ForceIPAddressToCamera = lib['fc2ForceIPAddressToCamera']
+    _fc2ForceIPAddressToCamera.restype = ctypes.c_uint
+    _fc2ForceIPAddressToCamera.argtypes = [ctypes.c_void_p, raw_types.fc2MACAddress, raw_types.fc2IPAddress, raw_types.fc2IPAddress, raw_types.fc2IPAddress]
+    _fc2ForceIPAddressToCamera.errcheck = errors.make_errcheck('fc2ForceIPAddressToCamera')
+
+    _fc2ForceAllIPAddressesAutomatically = lib['fc2ForceAllIPAddressesAutomatically']
+    _fc2ForceAllIPAddressesAutomatically.restype = ctypes.c_uint
+    _fc2ForceAllIPAddressesAutomatically.argtypes = []
+    _fc2ForceAllIPAddressesAutomatically.errcheck = errors.make_errcheck('fc2ForceAllIPAddressesAutomatically')
+
+    _fc2ForceIPAddressAutomatically = lib['fc2ForceIPAddressAutomatically']
+    _fc2ForceIPAddressAutomatically.restype = ctypes.c_uint
+    _fc2ForceIPAddressAutomatically.argtypes = [ctypes.c_uint]
+    _fc2ForceIPAddressAutomatically.errcheck = errors.make_errcheck('fc2ForceIPAddressAutomatically')
+
+    _fc2DiscoverGigECameras = lib['fc2DiscoverGigECameras']
+    _fc2DiscoverGigECameras.restype = ctypes.c_uint
+    _fc2DiscoverGigECameras.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2CameraInfo), ctypes.POINTER(ctypes.c_uint)]
+    _fc2DiscoverGigECameras.errcheck = errors.make_errcheck('fc2DiscoverGigECameras')
+
+    _fc2IsCameraControlable = lib['fc2IsCameraControlable']
+    _fc2IsCameraControlable.restype = ctypes.c_uint
+    _fc2IsCameraControlable.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2PGRGuid), ctypes.POINTER(ctypes.c_int)]
+    _fc2IsCameraControlable.errcheck = errors.make_errcheck('fc2IsCameraControlable')
+
+    _fc2Connect = lib['fc2Connect']
+    _fc2Connect.restype = ctypes.c_uint
+    _fc2Connect.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2PGRGuid)]
+    _fc2Connect.errcheck = errors.make_errcheck('fc2Connect')
+
+    _fc2Disconnect = lib['fc2Disconnect']
+    _fc2Disconnect.restype = ctypes.c_uint
+    _fc2Disconnect.argtypes = [ctypes.c_void_p]
+    _fc2Disconnect.errcheck = errors.make_errcheck('fc2Disconnect')
+
+    _fc2IsConnected = lib['fc2IsConnected']
+    _fc2IsConnected.restype = ctypes.c_int
+    _fc2IsConnected.argtypes = [ctypes.c_void_p]
+
+    _fc2SetCallback = lib['fc2SetCallback']
+    _fc2SetCallback.restype = ctypes.c_uint
+    _fc2SetCallback.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p]
+    _fc2SetCallback.errcheck = errors.make_errcheck('fc2SetCallback')
+
+    _fc2StartCapture = lib['fc2StartCapture']
+    _fc2StartCapture.restype = ctypes.c_uint
+    _fc2StartCapture.argtypes = [ctypes.c_void_p]
+    _fc2StartCapture.errcheck = errors.make_errcheck('fc2StartCapture')
+
+    _fc2StartCaptureCallback = lib['fc2StartCaptureCallback']
+    _fc2StartCaptureCallback.restype = ctypes.c_uint
+    _fc2StartCaptureCallback.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p]
+    _fc2StartCaptureCallback.errcheck = errors.make_errcheck('fc2StartCaptureCallback')
+
+    _fc2StartSyncCapture = lib['fc2StartSyncCapture']
+    _fc2StartSyncCapture.restype = ctypes.c_uint
+    _fc2StartSyncCapture.argtypes = [ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p)]
+    _fc2StartSyncCapture.errcheck = errors.make_errcheck('fc2StartSyncCapture')
+
+    _fc2StartSyncCaptureCallback = lib['fc2StartSyncCaptureCallback']
+    _fc2StartSyncCaptureCallback.restype = ctypes.c_uint
+    _fc2StartSyncCaptureCallback.argtypes = [ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(raw_types.fc2BusEventCallback), ctypes.POINTER(ctypes.c_void_p)]
+    _fc2StartSyncCaptureCallback.errcheck = errors.make_errcheck('fc2StartSyncCaptureCallback')
+
+    _fc2RetrieveBuffer = lib['fc2RetrieveBuffer']
+    _fc2RetrieveBuffer.restype = ctypes.c_uint
+    _fc2RetrieveBuffer.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Image)]
+    _fc2RetrieveBuffer.errcheck = errors.make_errcheck('fc2RetrieveBuffer')
+
+    _fc2StopCapture = lib['fc2StopCapture']
+    _fc2StopCapture.restype = ctypes.c_uint
+    _fc2StopCapture.argtypes = [ctypes.c_void_p]
+    _fc2StopCapture.errcheck = errors.make_errcheck('fc2StopCapture')
+
+    _fc2WaitForBufferEvent = lib['fc2WaitForBufferEvent']
+    _fc2WaitForBufferEvent.restype = ctypes.c_uint
+    _fc2WaitForBufferEvent.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Image), ctypes.c_uint]
+    _fc2WaitForBufferEvent.errcheck = errors.make_errcheck('fc2WaitForBufferEvent')
+
+    _fc2SetUserBuffers = lib['fc2SetUserBuffers']
+    _fc2SetUserBuffers.restype = ctypes.c_uint
+    _fc2SetUserBuffers.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_int, ctypes.c_int]
+    _fc2SetUserBuffers.errcheck = errors.make_errcheck('fc2SetUserBuffers')
+
+    _fc2GetConfiguration = lib['fc2GetConfiguration']
+    _fc2GetConfiguration.restype = ctypes.c_uint
+    _fc2GetConfiguration.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Config)]
+    _fc2GetConfiguration.errcheck = errors.make_errcheck('fc2GetConfiguration')
+
+    _fc2SetConfiguration = lib['fc2SetConfiguration']
+    _fc2SetConfiguration.restype = ctypes.c_uint
+    _fc2SetConfiguration.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Config)]
+    _fc2SetConfiguration.errcheck = errors.make_errcheck('fc2SetConfiguration')
+
+    _fc2GetCameraInfo = lib['fc2GetCameraInfo']
+    _fc2GetCameraInfo.restype = ctypes.c_uint
+    _fc2GetCameraInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2CameraInfo)]
+    _fc2GetCameraInfo.errcheck = errors.make_errcheck('fc2GetCameraInfo')
+
+    _fc2GetPropertyInfo = lib['fc2GetPropertyInfo']
+    _fc2GetPropertyInfo.restype = ctypes.c_uint
+    _fc2GetPropertyInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2PropertyInfo)]
+    _fc2GetPropertyInfo.errcheck = errors.make_errcheck('fc2GetPropertyInfo')
+
+    _fc2GetProperty = lib['fc2GetProperty']
+    _fc2GetProperty.restype = ctypes.c_uint
+    _fc2GetProperty.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Property)]
+    _fc2GetProperty.errcheck = errors.make_errcheck('fc2GetProperty')
+
+    _fc2SetProperty = lib['fc2SetProperty']
+    _fc2SetProperty.restype = ctypes.c_uint
+    _fc2SetProperty.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Property)]
+    _fc2SetProperty.errcheck = errors.make_errcheck('fc2SetProperty')
+
+    _fc2SetPropertyBroadcast = lib['fc2SetPropertyBroadcast']
+    _fc2SetPropertyBroadcast.restype = ctypes.c_uint
+    _fc2SetPropertyBroadcast.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Property)]
+    _fc2SetPropertyBroadcast.errcheck = errors.make_errcheck('fc2SetPropertyBroadcast')
+
+    _fc2GetGPIOPinDirection = lib['fc2GetGPIOPinDirection']
+    _fc2GetGPIOPinDirection.restype = ctypes.c_uint
+    _fc2GetGPIOPinDirection.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetGPIOPinDirection.errcheck = errors.make_errcheck('fc2GetGPIOPinDirection')
+
+    _fc2SetGPIOPinDirection = lib['fc2SetGPIOPinDirection']
+    _fc2SetGPIOPinDirection.restype = ctypes.c_uint
+    _fc2SetGPIOPinDirection.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint]
+    _fc2SetGPIOPinDirection.errcheck = errors.make_errcheck('fc2SetGPIOPinDirection')
+
+    _fc2SetGPIOPinDirectionBroadcast = lib['fc2SetGPIOPinDirectionBroadcast']
+    _fc2SetGPIOPinDirectionBroadcast.restype = ctypes.c_uint
+    _fc2SetGPIOPinDirectionBroadcast.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint]
+    _fc2SetGPIOPinDirectionBroadcast.errcheck = errors.make_errcheck('fc2SetGPIOPinDirectionBroadcast')
+
+    _fc2GetTriggerModeInfo = lib['fc2GetTriggerModeInfo']
+    _fc2GetTriggerModeInfo.restype = ctypes.c_uint
+    _fc2GetTriggerModeInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2TriggerModeInfo)]
+    _fc2GetTriggerModeInfo.errcheck = errors.make_errcheck('fc2GetTriggerModeInfo')
+
+    _fc2GetTriggerMode = lib['fc2GetTriggerMode']
+    _fc2GetTriggerMode.restype = ctypes.c_uint
+    _fc2GetTriggerMode.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2TriggerMode)]
+    _fc2GetTriggerMode.errcheck = errors.make_errcheck('fc2GetTriggerMode')
+
+    _fc2SetTriggerMode = lib['fc2SetTriggerMode']
+    _fc2SetTriggerMode.restype = ctypes.c_uint
+    _fc2SetTriggerMode.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2TriggerMode)]
+    _fc2SetTriggerMode.errcheck = errors.make_errcheck('fc2SetTriggerMode')
+
+    _fc2SetTriggerModeBroadcast = lib['fc2SetTriggerModeBroadcast']
+    _fc2SetTriggerModeBroadcast.restype = ctypes.c_uint
+    _fc2SetTriggerModeBroadcast.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2TriggerMode)]
+    _fc2SetTriggerModeBroadcast.errcheck = errors.make_errcheck('fc2SetTriggerModeBroadcast')
+
+    _fc2FireSoftwareTrigger = lib['fc2FireSoftwareTrigger']
+    _fc2FireSoftwareTrigger.restype = ctypes.c_uint
+    _fc2FireSoftwareTrigger.argtypes = [ctypes.c_void_p]
+    _fc2FireSoftwareTrigger.errcheck = errors.make_errcheck('fc2FireSoftwareTrigger')
+
+    _fc2FireSoftwareTriggerBroadcast = lib['fc2FireSoftwareTriggerBroadcast']
+    _fc2FireSoftwareTriggerBroadcast.restype = ctypes.c_uint
+    _fc2FireSoftwareTriggerBroadcast.argtypes = [ctypes.c_void_p]
+    _fc2FireSoftwareTriggerBroadcast.errcheck = errors.make_errcheck('fc2FireSoftwareTriggerBroadcast')
+
+    _fc2GetTriggerDelayInfo = lib['fc2GetTriggerDelayInfo']
+    _fc2GetTriggerDelayInfo.restype = ctypes.c_uint
+    _fc2GetTriggerDelayInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2PropertyInfo)]
+    _fc2GetTriggerDelayInfo.errcheck = errors.make_errcheck('fc2GetTriggerDelayInfo')
+
+    _fc2GetTriggerDelay = lib['fc2GetTriggerDelay']
+    _fc2GetTriggerDelay.restype = ctypes.c_uint
+    _fc2GetTriggerDelay.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Property)]
+    _fc2GetTriggerDelay.errcheck = errors.make_errcheck('fc2GetTriggerDelay')
+
+    _fc2SetTriggerDelay = lib['fc2SetTriggerDelay']
+    _fc2SetTriggerDelay.restype = ctypes.c_uint
+    _fc2SetTriggerDelay.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Property)]
+    _fc2SetTriggerDelay.errcheck = errors.make_errcheck('fc2SetTriggerDelay')
+
+    _fc2SetTriggerDelayBroadcast = lib['fc2SetTriggerDelayBroadcast']
+    _fc2SetTriggerDelayBroadcast.restype = ctypes.c_uint
+    _fc2SetTriggerDelayBroadcast.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Property)]
+    _fc2SetTriggerDelayBroadcast.errcheck = errors.make_errcheck('fc2SetTriggerDelayBroadcast')
+
+    _fc2GetStrobeInfo = lib['fc2GetStrobeInfo']
+    _fc2GetStrobeInfo.restype = ctypes.c_uint
+    _fc2GetStrobeInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2StrobeInfo)]
+    _fc2GetStrobeInfo.errcheck = errors.make_errcheck('fc2GetStrobeInfo')
+
+    _fc2GetStrobe = lib['fc2GetStrobe']
+    _fc2GetStrobe.restype = ctypes.c_uint
+    _fc2GetStrobe.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2StrobeControl)]
+    _fc2GetStrobe.errcheck = errors.make_errcheck('fc2GetStrobe')
+
+    _fc2SetStrobe = lib['fc2SetStrobe']
+    _fc2SetStrobe.restype = ctypes.c_uint
+    _fc2SetStrobe.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2StrobeControl)]
+    _fc2SetStrobe.errcheck = errors.make_errcheck('fc2SetStrobe')
+
+    _fc2SetStrobeBroadcast = lib['fc2SetStrobeBroadcast']
+    _fc2SetStrobeBroadcast.restype = ctypes.c_uint
+    _fc2SetStrobeBroadcast.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2StrobeControl)]
+    _fc2SetStrobeBroadcast.errcheck = errors.make_errcheck('fc2SetStrobeBroadcast')
+
+    _fc2GetLUTInfo = lib['fc2GetLUTInfo']
+    _fc2GetLUTInfo.restype = ctypes.c_uint
+    _fc2GetLUTInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2LUTData)]
+    _fc2GetLUTInfo.errcheck = errors.make_errcheck('fc2GetLUTInfo')
+
+    _fc2GetLUTBankInfo = lib['fc2GetLUTBankInfo']
+    _fc2GetLUTBankInfo.restype = ctypes.c_uint
+    _fc2GetLUTBankInfo.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
+    _fc2GetLUTBankInfo.errcheck = errors.make_errcheck('fc2GetLUTBankInfo')
+
+    _fc2GetActiveLUTBank = lib['fc2GetActiveLUTBank']
+    _fc2GetActiveLUTBank.restype = ctypes.c_uint
+    _fc2GetActiveLUTBank.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetActiveLUTBank.errcheck = errors.make_errcheck('fc2GetActiveLUTBank')
+
+    _fc2SetActiveLUTBank = lib['fc2SetActiveLUTBank']
+    _fc2SetActiveLUTBank.restype = ctypes.c_uint
+    _fc2SetActiveLUTBank.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    _fc2SetActiveLUTBank.errcheck = errors.make_errcheck('fc2SetActiveLUTBank')
+
+    _fc2EnableLUT = lib['fc2EnableLUT']
+    _fc2EnableLUT.restype = ctypes.c_uint
+    _fc2EnableLUT.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    _fc2EnableLUT.errcheck = errors.make_errcheck('fc2EnableLUT')
+
+    _fc2GetLUTChannel = lib['fc2GetLUTChannel']
+    _fc2GetLUTChannel.restype = ctypes.c_uint
+    _fc2GetLUTChannel.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetLUTChannel.errcheck = errors.make_errcheck('fc2GetLUTChannel')
+
+    _fc2SetLUTChannel = lib['fc2SetLUTChannel']
+    _fc2SetLUTChannel.restype = ctypes.c_uint
+    _fc2SetLUTChannel.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2SetLUTChannel.errcheck = errors.make_errcheck('fc2SetLUTChannel')
+
+    _fc2GetMemoryChannel = lib['fc2GetMemoryChannel']
+    _fc2GetMemoryChannel.restype = ctypes.c_uint
+    _fc2GetMemoryChannel.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetMemoryChannel.errcheck = errors.make_errcheck('fc2GetMemoryChannel')
+
+    _fc2SaveToMemoryChannel = lib['fc2SaveToMemoryChannel']
+    _fc2SaveToMemoryChannel.restype = ctypes.c_uint
+    _fc2SaveToMemoryChannel.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    _fc2SaveToMemoryChannel.errcheck = errors.make_errcheck('fc2SaveToMemoryChannel')
+
+    _fc2RestoreFromMemoryChannel = lib['fc2RestoreFromMemoryChannel']
+    _fc2RestoreFromMemoryChannel.restype = ctypes.c_uint
+    _fc2RestoreFromMemoryChannel.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    _fc2RestoreFromMemoryChannel.errcheck = errors.make_errcheck('fc2RestoreFromMemoryChannel')
+
+    _fc2GetMemoryChannelInfo = lib['fc2GetMemoryChannelInfo']
+    _fc2GetMemoryChannelInfo.restype = ctypes.c_uint
+    _fc2GetMemoryChannelInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetMemoryChannelInfo.errcheck = errors.make_errcheck('fc2GetMemoryChannelInfo')
+
+    _fc2GetEmbeddedImageInfo = lib['fc2GetEmbeddedImageInfo']
+    _fc2GetEmbeddedImageInfo.restype = ctypes.c_uint
+    _fc2GetEmbeddedImageInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2EmbeddedImageInfo)]
+    _fc2GetEmbeddedImageInfo.errcheck = errors.make_errcheck('fc2GetEmbeddedImageInfo')
+
+    _fc2SetEmbeddedImageInfo = lib['fc2SetEmbeddedImageInfo']
+    _fc2SetEmbeddedImageInfo.restype = ctypes.c_uint
+    _fc2SetEmbeddedImageInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2EmbeddedImageInfo)]
+    _fc2SetEmbeddedImageInfo.errcheck = errors.make_errcheck('fc2SetEmbeddedImageInfo')
+
+    _fc2WriteRegister = lib['fc2WriteRegister']
+    _fc2WriteRegister.restype = ctypes.c_uint
+    _fc2WriteRegister.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint]
+    _fc2WriteRegister.errcheck = errors.make_errcheck('fc2WriteRegister')
+
+    _fc2ReadRegister = lib['fc2ReadRegister']
+    _fc2ReadRegister.restype = ctypes.c_uint
+    _fc2ReadRegister.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2ReadRegister.errcheck = errors.make_errcheck('fc2ReadRegister')
+
+    _fc2WriteRegisterBroadcast = lib['fc2WriteRegisterBroadcast']
+    _fc2WriteRegisterBroadcast.restype = ctypes.c_uint
+    _fc2WriteRegisterBroadcast.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint]
+    _fc2WriteRegisterBroadcast.errcheck = errors.make_errcheck('fc2WriteRegisterBroadcast')
+
+    _fc2WriteRegisterBlock = lib['fc2WriteRegisterBlock']
+    _fc2WriteRegisterBlock.restype = ctypes.c_uint
+    _fc2WriteRegisterBlock.argtypes = [ctypes.c_void_p, ctypes.c_ushort, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint), ctypes.c_uint]
+    _fc2WriteRegisterBlock.errcheck = errors.make_errcheck('fc2WriteRegisterBlock')
+
+    _fc2ReadRegisterBlock = lib['fc2ReadRegisterBlock']
+    _fc2ReadRegisterBlock.restype = ctypes.c_uint
+    _fc2ReadRegisterBlock.argtypes = [ctypes.c_void_p, ctypes.c_ushort, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint), ctypes.c_uint]
+    _fc2ReadRegisterBlock.errcheck = errors.make_errcheck('fc2ReadRegisterBlock')
+
+    _fc2GetRegisterString = lib['fc2GetRegisterString']
+    _fc2GetRegisterString.restype = ctypes.c_char_p
+    _fc2GetRegisterString.argtypes = [ctypes.c_uint]
+
+    _fc2GetCycleTime = lib['fc2GetCycleTime']
+    _fc2GetCycleTime.restype = ctypes.c_uint
+    _fc2GetCycleTime.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2TimeStamp)]
+    _fc2GetCycleTime.errcheck = errors.make_errcheck('fc2GetCycleTime')
+
+    _fc2GetStats = lib['fc2GetStats']
+    _fc2GetStats.restype = ctypes.c_uint
+    _fc2GetStats.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2CameraStats)]
+    _fc2GetStats.errcheck = errors.make_errcheck('fc2GetStats')
+
+    _fc2RegisterEvent = lib['fc2RegisterEvent']
+    _fc2RegisterEvent.restype = ctypes.c_uint
+    _fc2RegisterEvent.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2EventOptions)]
+    _fc2RegisterEvent.errcheck = errors.make_errcheck('fc2RegisterEvent')
+
+    _fc2DeregisterEvent = lib['fc2DeregisterEvent']
+    _fc2DeregisterEvent.restype = ctypes.c_uint
+    _fc2DeregisterEvent.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2EventOptions)]
+    _fc2DeregisterEvent.errcheck = errors.make_errcheck('fc2DeregisterEvent')
+
+    _fc2RegisterAllEvents = lib['fc2RegisterAllEvents']
+    _fc2RegisterAllEvents.restype = ctypes.c_uint
+    _fc2RegisterAllEvents.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2EventOptions)]
+    _fc2RegisterAllEvents.errcheck = errors.make_errcheck('fc2RegisterAllEvents')
+
+    _fc2DeregisterAllEvents = lib['fc2DeregisterAllEvents']
+    _fc2DeregisterAllEvents.restype = ctypes.c_uint
+    _fc2DeregisterAllEvents.argtypes = [ctypes.c_void_p]
+    _fc2DeregisterAllEvents.errcheck = errors.make_errcheck('fc2DeregisterAllEvents')
+
+    _fc2GetVideoModeAndFrameRateInfo = lib['fc2GetVideoModeAndFrameRateInfo']
+    _fc2GetVideoModeAndFrameRateInfo.restype = ctypes.c_uint
+    _fc2GetVideoModeAndFrameRateInfo.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint, ctypes.POINTER(ctypes.c_int)]
+    _fc2GetVideoModeAndFrameRateInfo.errcheck = errors.make_errcheck('fc2GetVideoModeAndFrameRateInfo')
+
+    _fc2GetVideoModeAndFrameRate = lib['fc2GetVideoModeAndFrameRate']
+    _fc2GetVideoModeAndFrameRate.restype = ctypes.c_uint
+    _fc2GetVideoModeAndFrameRate.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetVideoModeAndFrameRate.errcheck = errors.make_errcheck('fc2GetVideoModeAndFrameRate')
+
+    _fc2SetVideoModeAndFrameRate = lib['fc2SetVideoModeAndFrameRate']
+    _fc2SetVideoModeAndFrameRate.restype = ctypes.c_uint
+    _fc2SetVideoModeAndFrameRate.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint]
+    _fc2SetVideoModeAndFrameRate.errcheck = errors.make_errcheck('fc2SetVideoModeAndFrameRate')
+
+    _fc2GetFormat7Info = lib['fc2GetFormat7Info']
+    _fc2GetFormat7Info.restype = ctypes.c_uint
+    _fc2GetFormat7Info.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Format7Info), ctypes.POINTER(ctypes.c_int)]
+    _fc2GetFormat7Info.errcheck = errors.make_errcheck('fc2GetFormat7Info')
+
+    _fc2ValidateFormat7Settings = lib['fc2ValidateFormat7Settings']
+    _fc2ValidateFormat7Settings.restype = ctypes.c_uint
+    _fc2ValidateFormat7Settings.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Format7ImageSettings), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(raw_types.fc2Format7PacketInfo)]
+    _fc2ValidateFormat7Settings.errcheck = errors.make_errcheck('fc2ValidateFormat7Settings')
+
+    _fc2GetFormat7Configuration = lib['fc2GetFormat7Configuration']
+    _fc2GetFormat7Configuration.restype = ctypes.c_uint
+    _fc2GetFormat7Configuration.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Format7ImageSettings), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_float)]
+    _fc2GetFormat7Configuration.errcheck = errors.make_errcheck('fc2GetFormat7Configuration')
+
+    _fc2SetFormat7ConfigurationPacket = lib['fc2SetFormat7ConfigurationPacket']
+    _fc2SetFormat7ConfigurationPacket.restype = ctypes.c_uint
+    _fc2SetFormat7ConfigurationPacket.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Format7ImageSettings), ctypes.c_uint]
+    _fc2SetFormat7ConfigurationPacket.errcheck = errors.make_errcheck('fc2SetFormat7ConfigurationPacket')
+
+    _fc2SetFormat7Configuration = lib['fc2SetFormat7Configuration']
+    _fc2SetFormat7Configuration.restype = ctypes.c_uint
+    _fc2SetFormat7Configuration.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2Format7ImageSettings), ctypes.c_float]
+    _fc2SetFormat7Configuration.errcheck = errors.make_errcheck('fc2SetFormat7Configuration')
+
+    _fc2WriteGVCPRegister = lib['fc2WriteGVCPRegister']
+    _fc2WriteGVCPRegister.restype = ctypes.c_uint
+    _fc2WriteGVCPRegister.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint]
+    _fc2WriteGVCPRegister.errcheck = errors.make_errcheck('fc2WriteGVCPRegister')
+
+    _fc2WriteGVCPRegisterBroadcast = lib['fc2WriteGVCPRegisterBroadcast']
+    _fc2WriteGVCPRegisterBroadcast.restype = ctypes.c_uint
+    _fc2WriteGVCPRegisterBroadcast.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint]
+    _fc2WriteGVCPRegisterBroadcast.errcheck = errors.make_errcheck('fc2WriteGVCPRegisterBroadcast')
+
+    _fc2ReadGVCPRegister = lib['fc2ReadGVCPRegister']
+    _fc2ReadGVCPRegister.restype = ctypes.c_uint
+    _fc2ReadGVCPRegister.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2ReadGVCPRegister.errcheck = errors.make_errcheck('fc2ReadGVCPRegister')
+
+    _fc2WriteGVCPRegisterBlock = lib['fc2WriteGVCPRegisterBlock']
+    _fc2WriteGVCPRegisterBlock.restype = ctypes.c_uint
+    _fc2WriteGVCPRegisterBlock.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint), ctypes.c_uint]
+    _fc2WriteGVCPRegisterBlock.errcheck = errors.make_errcheck('fc2WriteGVCPRegisterBlock')
+
+    _fc2ReadGVCPRegisterBlock = lib['fc2ReadGVCPRegisterBlock']
+    _fc2ReadGVCPRegisterBlock.restype = ctypes.c_uint
+    _fc2ReadGVCPRegisterBlock.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint), ctypes.c_uint]
+    _fc2ReadGVCPRegisterBlock.errcheck = errors.make_errcheck('fc2ReadGVCPRegisterBlock')
+
+    _fc2WriteGVCPMemory = lib['fc2WriteGVCPMemory']
+    _fc2WriteGVCPMemory.restype = ctypes.c_uint
+    _fc2WriteGVCPMemory.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_uint]
+    _fc2WriteGVCPMemory.errcheck = errors.make_errcheck('fc2WriteGVCPMemory')
+
+    _fc2ReadGVCPMemory = lib['fc2ReadGVCPMemory']
+    _fc2ReadGVCPMemory.restype = ctypes.c_uint
+    _fc2ReadGVCPMemory.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_uint]
+    _fc2ReadGVCPMemory.errcheck = errors.make_errcheck('fc2ReadGVCPMemory')
+
+    _fc2GetGigEProperty = lib['fc2GetGigEProperty']
+    _fc2GetGigEProperty.restype = ctypes.c_uint
+    _fc2GetGigEProperty.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2GigEProperty)]
+    _fc2GetGigEProperty.errcheck = errors.make_errcheck('fc2GetGigEProperty')
+
+    _fc2SetGigEProperty = lib['fc2SetGigEProperty']
+    _fc2SetGigEProperty.restype = ctypes.c_uint
+    _fc2SetGigEProperty.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2GigEProperty)]
+    _fc2SetGigEProperty.errcheck = errors.make_errcheck('fc2SetGigEProperty')
+
+    _fc2DiscoverGigEPacketSize = lib['fc2DiscoverGigEPacketSize']
+    _fc2DiscoverGigEPacketSize.restype = ctypes.c_uint
+    _fc2DiscoverGigEPacketSize.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2DiscoverGigEPacketSize.errcheck = errors.make_errcheck('fc2DiscoverGigEPacketSize')
+
+    _fc2QueryGigEImagingMode = lib['fc2QueryGigEImagingMode']
+    _fc2QueryGigEImagingMode.restype = ctypes.c_uint
+    _fc2QueryGigEImagingMode.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_int)]
+    _fc2QueryGigEImagingMode.errcheck = errors.make_errcheck('fc2QueryGigEImagingMode')
+
+    _fc2GetGigEImagingMode = lib['fc2GetGigEImagingMode']
+    _fc2GetGigEImagingMode.restype = ctypes.c_uint
+    _fc2GetGigEImagingMode.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetGigEImagingMode.errcheck = errors.make_errcheck('fc2GetGigEImagingMode')
+
+    _fc2SetGigEImagingMode = lib['fc2SetGigEImagingMode']
+    _fc2SetGigEImagingMode.restype = ctypes.c_uint
+    _fc2SetGigEImagingMode.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    _fc2SetGigEImagingMode.errcheck = errors.make_errcheck('fc2SetGigEImagingMode')
+
+    _fc2GetGigEImageSettingsInfo = lib['fc2GetGigEImageSettingsInfo']
+    _fc2GetGigEImageSettingsInfo.restype = ctypes.c_uint
+    _fc2GetGigEImageSettingsInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2GigEImageSettingsInfo)]
+    _fc2GetGigEImageSettingsInfo.errcheck = errors.make_errcheck('fc2GetGigEImageSettingsInfo')
+
+    _fc2GetGigEImageSettings = lib['fc2GetGigEImageSettings']
+    _fc2GetGigEImageSettings.restype = ctypes.c_uint
+    _fc2GetGigEImageSettings.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2GigEImageSettings)]
+    _fc2GetGigEImageSettings.errcheck = errors.make_errcheck('fc2GetGigEImageSettings')
+
+    _fc2SetGigEImageSettings = lib['fc2SetGigEImageSettings']
+    _fc2SetGigEImageSettings.restype = ctypes.c_uint
+    _fc2SetGigEImageSettings.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2GigEImageSettings)]
+    _fc2SetGigEImageSettings.errcheck = errors.make_errcheck('fc2SetGigEImageSettings')
+
+    _fc2GetGigEImageBinningSettings = lib['fc2GetGigEImageBinningSettings']
+    _fc2GetGigEImageBinningSettings.restype = ctypes.c_uint
+    _fc2GetGigEImageBinningSettings.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetGigEImageBinningSettings.errcheck = errors.make_errcheck('fc2GetGigEImageBinningSettings')
+
+    _fc2SetGigEImageBinningSettings = lib['fc2SetGigEImageBinningSettings']
+    _fc2SetGigEImageBinningSettings.restype = ctypes.c_uint
+    _fc2SetGigEImageBinningSettings.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint]
+    _fc2SetGigEImageBinningSettings.errcheck = errors.make_errcheck('fc2SetGigEImageBinningSettings')
+
+    _fc2GetNumStreamChannels = lib['fc2GetNumStreamChannels']
+    _fc2GetNumStreamChannels.restype = ctypes.c_uint
+    _fc2GetNumStreamChannels.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetNumStreamChannels.errcheck = errors.make_errcheck('fc2GetNumStreamChannels')
+
+    _fc2GetGigEStreamChannelInfo = lib['fc2GetGigEStreamChannelInfo']
+    _fc2GetGigEStreamChannelInfo.restype = ctypes.c_uint
+    _fc2GetGigEStreamChannelInfo.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(raw_types.fc2GigEStreamChannel)]
+    _fc2GetGigEStreamChannelInfo.errcheck = errors.make_errcheck('fc2GetGigEStreamChannelInfo')
+
+    _fc2SetGigEStreamChannelInfo = lib['fc2SetGigEStreamChannelInfo']
+    _fc2SetGigEStreamChannelInfo.restype = ctypes.c_uint
+    _fc2SetGigEStreamChannelInfo.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(raw_types.fc2GigEStreamChannel)]
+    _fc2SetGigEStreamChannelInfo.errcheck = errors.make_errcheck('fc2SetGigEStreamChannelInfo')
+
+    _fc2GetGigEConfig = lib['fc2GetGigEConfig']
+    _fc2GetGigEConfig.restype = ctypes.c_uint
+    _fc2GetGigEConfig.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2GigEConfig)]
+    _fc2GetGigEConfig.errcheck = errors.make_errcheck('fc2GetGigEConfig')
+
+    _fc2SetGigEConfig = lib['fc2SetGigEConfig']
+    _fc2SetGigEConfig.restype = ctypes.c_uint
+    _fc2SetGigEConfig.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2GigEConfig)]
+    _fc2SetGigEConfig.errcheck = errors.make_errcheck('fc2SetGigEConfig')
+
+    _fc2SetDefaultColorProcessing = lib['fc2SetDefaultColorProcessing']
+    _fc2SetDefaultColorProcessing.restype = ctypes.c_uint
+    _fc2SetDefaultColorProcessing.argtypes = [ctypes.c_uint]
+    _fc2SetDefaultColorProcessing.errcheck = errors.make_errcheck('fc2SetDefaultColorProcessing')
+
+    _fc2GetDefaultColorProcessing = lib['fc2GetDefaultColorProcessing']
+    _fc2GetDefaultColorProcessing.restype = ctypes.c_uint
+    _fc2GetDefaultColorProcessing.argtypes = [ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetDefaultColorProcessing.errcheck = errors.make_errcheck('fc2GetDefaultColorProcessing')
+
+    _fc2SetDefaultOutputFormat = lib['fc2SetDefaultOutputFormat']
+    _fc2SetDefaultOutputFormat.restype = ctypes.c_uint
+    _fc2SetDefaultOutputFormat.argtypes = [ctypes.c_uint]
+    _fc2SetDefaultOutputFormat.errcheck = errors.make_errcheck('fc2SetDefaultOutputFormat')
+
+    _fc2GetDefaultOutputFormat = lib['fc2GetDefaultOutputFormat']
+    _fc2GetDefaultOutputFormat.restype = ctypes.c_uint
+    _fc2GetDefaultOutputFormat.argtypes = [ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetDefaultOutputFormat.errcheck = errors.make_errcheck('fc2GetDefaultOutputFormat')
+
+    _fc2DetermineBitsPerPixel = lib['fc2DetermineBitsPerPixel']
+    _fc2DetermineBitsPerPixel.restype = ctypes.c_uint
+    _fc2DetermineBitsPerPixel.argtypes = [ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2DetermineBitsPerPixel.errcheck = errors.make_errcheck('fc2DetermineBitsPerPixel')
+
+    _fc2CreateImage = lib['fc2CreateImage']
+    _fc2CreateImage.restype = ctypes.c_uint
+    _fc2CreateImage.argtypes = [ctypes.POINTER(raw_types.fc2Image)]
+    _fc2CreateImage.errcheck = errors.make_errcheck('fc2CreateImage')
+
+    _fc2DestroyImage = lib['fc2DestroyImage']
+    _fc2DestroyImage.restype = ctypes.c_uint
+    _fc2DestroyImage.argtypes = [ctypes.POINTER(raw_types.fc2Image)]
+    _fc2DestroyImage.errcheck = errors.make_errcheck('fc2DestroyImage')
+
+    _fc2SetImageDimensions = lib['fc2SetImageDimensions']
+    _fc2SetImageDimensions.restype = ctypes.c_uint
+    _fc2SetImageDimensions.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.c_uint, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint]
+    _fc2SetImageDimensions.errcheck = errors.make_errcheck('fc2SetImageDimensions')
+
+    _fc2GetImageDimensions = lib['fc2GetImageDimensions']
+    _fc2GetImageDimensions.restype = ctypes.c_uint
+    _fc2GetImageDimensions.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetImageDimensions.errcheck = errors.make_errcheck('fc2GetImageDimensions')
+
+    _fc2SetImageColorProcessing = lib['fc2SetImageColorProcessing']
+    _fc2SetImageColorProcessing.restype = ctypes.c_uint
+    _fc2SetImageColorProcessing.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.c_uint]
+    _fc2SetImageColorProcessing.errcheck = errors.make_errcheck('fc2SetImageColorProcessing')
+
+    _fc2GetImageColorProcessing = lib['fc2GetImageColorProcessing']
+    _fc2GetImageColorProcessing.restype = ctypes.c_uint
+    _fc2GetImageColorProcessing.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetImageColorProcessing.errcheck = errors.make_errcheck('fc2GetImageColorProcessing')
+
+    _fc2SetImageData = lib['fc2SetImageData']
+    _fc2SetImageData.restype = ctypes.c_uint
+    _fc2SetImageData.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.POINTER(ctypes.c_ubyte), ctypes.c_uint]
+    _fc2SetImageData.errcheck = errors.make_errcheck('fc2SetImageData')
+
+    _fc2GetImageData = lib['fc2GetImageData']
+    _fc2GetImageData.restype = ctypes.c_uint
+    _fc2GetImageData.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.c_void_p]
+    _fc2GetImageData.errcheck = errors.make_errcheck('fc2GetImageData')
+
+    _fc2GetImageMetadata = lib['fc2GetImageMetadata']
+    _fc2GetImageMetadata.restype = ctypes.c_uint
+    _fc2GetImageMetadata.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.POINTER(raw_types.fc2ImageMetadata)]
+    _fc2GetImageMetadata.errcheck = errors.make_errcheck('fc2GetImageMetadata')
+
+    _fc2GetImageTimeStamp = lib['fc2GetImageTimeStamp']
+    _fc2GetImageTimeStamp.restype = raw_types.fc2TimeStamp
+    _fc2GetImageTimeStamp.argtypes = [ctypes.POINTER(raw_types.fc2Image)]
+
+    _fc2SaveImage = lib['fc2SaveImage']
+    _fc2SaveImage.restype = ctypes.c_uint
+    _fc2SaveImage.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.c_char_p, ctypes.c_uint]
+    _fc2SaveImage.errcheck = errors.make_errcheck('fc2SaveImage')
+
+    _fc2SaveImageWithOption = lib['fc2SaveImageWithOption']
+    _fc2SaveImageWithOption.restype = ctypes.c_uint
+    _fc2SaveImageWithOption.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.c_char_p, ctypes.c_uint, ctypes.c_void_p]
+    _fc2SaveImageWithOption.errcheck = errors.make_errcheck('fc2SaveImageWithOption')
+
+    _fc2ConvertImage = lib['fc2ConvertImage']
+    _fc2ConvertImage.restype = ctypes.c_uint
+    _fc2ConvertImage.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.POINTER(raw_types.fc2Image)]
+    _fc2ConvertImage.errcheck = errors.make_errcheck('fc2ConvertImage')
+
+    _fc2ConvertImageTo = lib['fc2ConvertImageTo']
+    _fc2ConvertImageTo.restype = ctypes.c_uint
+    _fc2ConvertImageTo.argtypes = [ctypes.c_uint, ctypes.POINTER(raw_types.fc2Image), ctypes.POINTER(raw_types.fc2Image)]
+    _fc2ConvertImageTo.errcheck = errors.make_errcheck('fc2ConvertImageTo')
+
+    _fc2CalculateImageStatistics = lib['fc2CalculateImageStatistics']
+    _fc2CalculateImageStatistics.restype = ctypes.c_uint
+    _fc2CalculateImageStatistics.argtypes = [ctypes.POINTER(raw_types.fc2Image), ctypes.POINTER(ctypes.c_void_p)]
+    _fc2CalculateImageStatistics.errcheck = errors.make_errcheck('fc2CalculateImageStatistics')
+
+    _fc2CreateImageStatistics = lib['fc2CreateImageStatistics']
+    _fc2CreateImageStatistics.restype = ctypes.c_uint
+    _fc2CreateImageStatistics.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    _fc2CreateImageStatistics.errcheck = errors.make_errcheck('fc2CreateImageStatistics')
+
+    _fc2DestroyImageStatistics = lib['fc2DestroyImageStatistics']
+    _fc2DestroyImageStatistics.restype = ctypes.c_uint
+    _fc2DestroyImageStatistics.argtypes = [ctypes.c_void_p]
+    _fc2DestroyImageStatistics.errcheck = errors.make_errcheck('fc2DestroyImageStatistics')
+
+    _fc2ImageStatisticsEnableAll = lib['fc2ImageStatisticsEnableAll']
+    _fc2ImageStatisticsEnableAll.restype = ctypes.c_uint
+    _fc2ImageStatisticsEnableAll.argtypes = [ctypes.c_void_p]
+    _fc2ImageStatisticsEnableAll.errcheck = errors.make_errcheck('fc2ImageStatisticsEnableAll')
+
+    _fc2ImageStatisticsDisableAll = lib['fc2ImageStatisticsDisableAll']
+    _fc2ImageStatisticsDisableAll.restype = ctypes.c_uint
+    _fc2ImageStatisticsDisableAll.argtypes = [ctypes.c_void_p]
+    _fc2ImageStatisticsDisableAll.errcheck = errors.make_errcheck('fc2ImageStatisticsDisableAll')
+
+    _fc2ImageStatisticsEnableGreyOnly = lib['fc2ImageStatisticsEnableGreyOnly']
+    _fc2ImageStatisticsEnableGreyOnly.restype = ctypes.c_uint
+    _fc2ImageStatisticsEnableGreyOnly.argtypes = [ctypes.c_void_p]
+    _fc2ImageStatisticsEnableGreyOnly.errcheck = errors.make_errcheck('fc2ImageStatisticsEnableGreyOnly')
+
+    _fc2ImageStatisticsEnableRGBOnly = lib['fc2ImageStatisticsEnableRGBOnly']
+    _fc2ImageStatisticsEnableRGBOnly.restype = ctypes.c_uint
+    _fc2ImageStatisticsEnableRGBOnly.argtypes = [ctypes.c_void_p]
+    _fc2ImageStatisticsEnableRGBOnly.errcheck = errors.make_errcheck('fc2ImageStatisticsEnableRGBOnly')
+
+    _fc2ImageStatisticsEnableHSLOnly = lib['fc2ImageStatisticsEnableHSLOnly']
+    _fc2ImageStatisticsEnableHSLOnly.restype = ctypes.c_uint
+    _fc2ImageStatisticsEnableHSLOnly.argtypes = [ctypes.c_void_p]
+    _fc2ImageStatisticsEnableHSLOnly.errcheck = errors.make_errcheck('fc2ImageStatisticsEnableHSLOnly')
+
+    _fc2GetChannelStatus = lib['fc2GetChannelStatus']
+    _fc2GetChannelStatus.restype = ctypes.c_uint
+    _fc2GetChannelStatus.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_int)]
+    _fc2GetChannelStatus.errcheck = errors.make_errcheck('fc2GetChannelStatus')
+
+    _fc2SetChannelStatus = lib['fc2SetChannelStatus']
+    _fc2SetChannelStatus.restype = ctypes.c_uint
+    _fc2SetChannelStatus.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    _fc2SetChannelStatus.errcheck = errors.make_errcheck('fc2SetChannelStatus')
+
+    _fc2GetChannelRange = lib['fc2GetChannelRange']
+    _fc2GetChannelRange.restype = ctypes.c_uint
+    _fc2GetChannelRange.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetChannelRange.errcheck = errors.make_errcheck('fc2GetChannelRange')
+
+    _fc2GetChannelPixelValueRange = lib['fc2GetChannelPixelValueRange']
+    _fc2GetChannelPixelValueRange.restype = ctypes.c_uint
+    _fc2GetChannelPixelValueRange.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetChannelPixelValueRange.errcheck = errors.make_errcheck('fc2GetChannelPixelValueRange')
+
+    _fc2GetChannelNumPixelValues = lib['fc2GetChannelNumPixelValues']
+    _fc2GetChannelNumPixelValues.restype = ctypes.c_uint
+    _fc2GetChannelNumPixelValues.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2GetChannelNumPixelValues.errcheck = errors.make_errcheck('fc2GetChannelNumPixelValues')
+
+    _fc2GetChannelMean = lib['fc2GetChannelMean']
+    _fc2GetChannelMean.restype = ctypes.c_uint
+    _fc2GetChannelMean.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_float)]
+    _fc2GetChannelMean.errcheck = errors.make_errcheck('fc2GetChannelMean')
+
+    _fc2GetChannelHistogram = lib['fc2GetChannelHistogram']
+    _fc2GetChannelHistogram.restype = ctypes.c_uint
+    _fc2GetChannelHistogram.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p]
+    _fc2GetChannelHistogram.errcheck = errors.make_errcheck('fc2GetChannelHistogram')
+
+    _fc2GetImageStatistics = lib['fc2GetImageStatistics']
+    _fc2GetImageStatistics.restype = ctypes.c_uint
+    _fc2GetImageStatistics.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_float), ctypes.c_void_p]
+    _fc2GetImageStatistics.errcheck = errors.make_errcheck('fc2GetImageStatistics')
+
+    _fc2CreateTopologyNode = lib['fc2CreateTopologyNode']
+    _fc2CreateTopologyNode.restype = ctypes.c_uint
+    _fc2CreateTopologyNode.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    _fc2CreateTopologyNode.errcheck = errors.make_errcheck('fc2CreateTopologyNode')
+
+    _fc2TopologyNodeGetGuid = lib['fc2TopologyNodeGetGuid']
+    _fc2TopologyNodeGetGuid.restype = ctypes.c_uint
+    _fc2TopologyNodeGetGuid.argtypes = [ctypes.c_void_p, ctypes.POINTER(raw_types.fc2PGRGuid)]
+    _fc2TopologyNodeGetGuid.errcheck = errors.make_errcheck('fc2TopologyNodeGetGuid')
+
+    _fc2TopologyNodeGetDeviceId = lib['fc2TopologyNodeGetDeviceId']
+    _fc2TopologyNodeGetDeviceId.restype = ctypes.c_uint
+    _fc2TopologyNodeGetDeviceId.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+    _fc2TopologyNodeGetDeviceId.errcheck = errors.make_errcheck('fc2TopologyNodeGetDeviceId')
+
+    _fc2TopologyNodeGetNodeType = lib['fc2TopologyNodeGetNodeType']
+    _fc2TopologyNodeGetNodeType.restype = ctypes.c_uint
+    _fc2TopologyNodeGetNodeType.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2TopologyNodeGetNodeType.errcheck = errors.make_errcheck('fc2TopologyNodeGetNodeType')
+
+    _fc2TopologyNodeGetInterfaceType = lib['fc2TopologyNodeGetInterfaceType']
+    _fc2TopologyNodeGetInterfaceType.restype = ctypes.c_uint
+    _fc2TopologyNodeGetInterfaceType.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2TopologyNodeGetInterfaceType.errcheck = errors.make_errcheck('fc2TopologyNodeGetInterfaceType')
+
+    _fc2TopologyNodeGetNumChildren = lib['fc2TopologyNodeGetNumChildren']
+    _fc2TopologyNodeGetNumChildren.restype = ctypes.c_uint
+    _fc2TopologyNodeGetNumChildren.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2TopologyNodeGetNumChildren.errcheck = errors.make_errcheck('fc2TopologyNodeGetNumChildren')
+
+    _fc2TopologyNodeGetChild = lib['fc2TopologyNodeGetChild']
+    _fc2TopologyNodeGetChild.restype = ctypes.c_uint
+    _fc2TopologyNodeGetChild.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p)]
+    _fc2TopologyNodeGetChild.errcheck = errors.make_errcheck('fc2TopologyNodeGetChild')
+
+    _fc2TopologyNodeAddChild = lib['fc2TopologyNodeAddChild']
+    _fc2TopologyNodeAddChild.restype = ctypes.c_uint
+    _fc2TopologyNodeAddChild.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    _fc2TopologyNodeAddChild.errcheck = errors.make_errcheck('fc2TopologyNodeAddChild')
+
+    _fc2TopologyNodeGetNumPorts = lib['fc2TopologyNodeGetNumPorts']
+    _fc2TopologyNodeGetNumPorts.restype = ctypes.c_uint
+    _fc2TopologyNodeGetNumPorts.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+    _fc2TopologyNodeGetNumPorts.errcheck = errors.make_errcheck('fc2TopologyNodeGetNumPorts')
+
+    _fc2TopologyNodeGetPortType = lib['fc2TopologyNodeGetPortType']
+    _fc2TopologyNodeGetPortType.restype = ctypes.c_uint
+    _fc2TopologyNodeGetPortType.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
+    _fc2TopologyNodeGetPortType.errcheck = errors.make_errcheck('fc2TopologyNodeGetPortType')
+
+    _fc2TopologyNodeAddPortType = lib['fc2TopologyNodeAddPortType']
+    _fc2TopologyNodeAddPortType.restype = ctypes.c_uint
+    _fc2TopologyNodeAddPortType.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    _fc2TopologyNodeAddPortType.errcheck = errors.make_errcheck('fc2TopologyNodeAddPortType')
+
+    _fc2TopologyNodeAssignGuidToNode = lib['fc2TopologyNodeAssignGuidToNode']
+    _fc2TopologyNodeAssignGuidToNode.restype = ctypes.c_int
+    _fc2TopologyNodeAssignGuidToNode.argtypes = [ctypes.c_void_p, raw_types.fc2PGRGuid, ctypes.c_int]
+
+    _fc2TopologyNodeAssignGuidToNodeEx = lib['fc2TopologyNodeAssignGuidToNodeEx']
+    _fc2TopologyNodeAssignGuidToNodeEx.restype = ctypes.c_int
+    _fc2TopologyNodeAssignGuidToNodeEx.argtypes = [ctypes.c_void_p, raw_types.fc2PGRGuid, ctypes.c_int, ctypes.c_uint]
+
+    _fc2DestroyTopologyNode = lib['fc2DestroyTopologyNode']
+    _fc2DestroyTopologyNode.restype = ctypes.c_uint
+    _fc2DestroyTopologyNode.argtypes = [ctypes.c_void_p]
+    _fc2DestroyTopologyNode.errcheck = errors.make_errcheck('fc2DestroyTopologyNode')
+
+    _fc2CheckDriver = lib['fc2CheckDriver']
+    _fc2CheckDriver.restype = ctypes.c_uint
+    _fc2CheckDriver.argtypes = [ctypes.POINTER(raw_types.fc2PGRGuid)]
+    _fc2CheckDriver.errcheck = errors.make_errcheck('fc2CheckDriver')
+
+    _fc2GetDriverDeviceName = lib['fc2GetDriverDeviceName']
+    _fc2GetDriverDeviceName.restype = ctypes.c_uint
+    _fc2GetDriverDeviceName.argtypes = [ctypes.POINTER(raw_types.fc2PGRGuid), ctypes.c_char_p, ctypes.POINTER(ctypes.c_ulong)]
+    _fc2GetDriverDeviceName.errcheck = errors.make_errcheck('fc2GetDriverDeviceName')
+
+    _fc2GetSystemInfo = lib['fc2GetSystemInfo']
+    _fc2GetSystemInfo.restype = ctypes.c_uint
+    _fc2GetSystemInfo.argtypes = [ctypes.POINTER(raw_types.fc2SystemInfo)]
+    _fc2GetSystemInfo.errcheck = errors.make_errcheck('fc2GetSystemInfo')
+
+    _fc2GetLibraryVersion = lib['fc2GetLibraryVersion']
+    _fc2GetLibraryVersion.restype = ctypes.c_uint
+    _fc2GetLibraryVersion.argtypes = [ctypes.POINTER(raw_types.fc2Version)]
+    _fc2GetLibraryVersion.errcheck = errors.make_errcheck('fc2GetLibraryVersion')
+
+    _fc2LaunchBrowser = lib['fc2LaunchBrowser']
+    _fc2LaunchBrowser.restype = ctypes.c_uint
+    _fc2LaunchBrowser.argtypes = [ctypes.c_char_p]
+    _fc2LaunchBrowser.errcheck = errors.make_errcheck('fc2LaunchBrowser')
+
+    _fc2LaunchHelp = lib['fc2LaunchHelp']
+    _fc2LaunchHelp.restype = ctypes.c_uint
+    _fc2LaunchHelp.argtypes = [ctypes.c_char_p]
+    _fc2LaunchHelp.errcheck = errors.make_errcheck('fc2LaunchHelp')
+
+    _fc2LaunchCommand = lib['fc2LaunchCommand']
+    _fc2LaunchCommand.restype = ctypes.c_uint
+    _fc2LaunchCommand.argtypes = [ctypes.c_char_p]
+    _fc2LaunchCommand.errcheck = errors.make_errcheck('fc2LaunchCommand')
+
+    _fc2LaunchCommandAsync = lib['fc2LaunchCommandAsync']
+    _fc2LaunchCommandAsync.restype = ctypes.c_uint
+    _fc2LaunchCommandAsync.argtypes = [ctypes.c_char_p, ctypes.c_void_p, ctypes.c_void_p]
+    _fc2LaunchCommandAsync.errcheck = errors.make_errcheck('fc2LaunchCommandAsync')
+
+    _fc2ErrorToDescription = lib['fc2ErrorToDescription']
+    _fc2ErrorToDescription.restype = ctypes.c_char_p
+    _fc2ErrorToDescription.argtypes = [ctypes.c_uint]
+
+
+def fc2CreateContext(pContext):
+    """
+    fc2CreateContext(pContext)
+
+    pContext: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2CreateContext(pContext)
+
+
+def fc2CreateGigEContext(pContext):
+    """
+    fc2CreateGigEContext(pContext)
+
+    pContext: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2CreateGigEContext(pContext)
+
+
+def fc2DestroyContext(context):
+    """
+    fc2DestroyContext(context)
+
+    context: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2DestroyContext(context)
+
+
+def fc2FireBusReset(context, pGuid):
+    """
+    fc2FireBusReset(context, pGuid)
+
+    context: ctypes.c_void_p
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2FireBusReset(context, pGuid)
+
+
+def fc2GetNumOfCameras(context, pNumCameras):
+    """
+    fc2GetNumOfCameras(context, pNumCameras)
+
+    context: ctypes.c_void_p
+    pNumCameras: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetNumOfCameras(context, pNumCameras)
+
+
+def fc2GetCameraFromIPAddress(context, ipAddress, pGuid):
+    """
+    fc2GetCameraFromIPAddress(context, ipAddress, pGuid)
+
+    context: ctypes.c_void_p
+    ipAddress: raw_types.fc2IPAddress
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetCameraFromIPAddress(context, ipAddress, pGuid)
+
+
+def fc2GetCameraFromIndex(context, index, pGuid):
+    """
+    fc2GetCameraFromIndex(context, index, pGuid)
+
+    context: ctypes.c_void_p
+    index: ctypes.c_uint
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetCameraFromIndex(context, index, pGuid)
+
+
+def fc2GetCameraFromSerialNumber(context, serialNumber, pGuid):
+    """
+    fc2GetCameraFromSerialNumber(context, serialNumber, pGuid)
+
+    context: ctypes.c_void_p
+    serialNumber: ctypes.c_uint
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetCameraFromSerialNumber(context, serialNumber, pGuid)
+
+
+def fc2GetCameraSerialNumberFromIndex(context, index, pSerialNumber):
+    """
+    fc2GetCameraSerialNumberFromIndex(context, index, pSerialNumber)
+
+    context: ctypes.c_void_p
+    index: ctypes.c_uint
+    pSerialNumber: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetCameraSerialNumberFromIndex(context, index, pSerialNumber)
+
+
+def fc2GetInterfaceTypeFromGuid(context, pGuid, pInterfaceType):
+    """
+    fc2GetInterfaceTypeFromGuid(context, pGuid, pInterfaceType)
+
+    context: ctypes.c_void_p
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    pInterfaceType: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetInterfaceTypeFromGuid(context, pGuid, pInterfaceType)
+
+
+def fc2GetNumOfDevices(context, pNumDevices):
+    """
+    fc2GetNumOfDevices(context, pNumDevices)
+
+    context: ctypes.c_void_p
+    pNumDevices: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetNumOfDevices(context, pNumDevices)
+
+
+def fc2GetDeviceFromIndex(context, index, pGuid):
+    """
+    fc2GetDeviceFromIndex(context, index, pGuid)
+
+    context: ctypes.c_void_p
+    index: ctypes.c_uint
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetDeviceFromIndex(context, index, pGuid)
+
+
+def fc2ReadPhyRegister(context, guid, page, port, address, pValue):
+    """
+    fc2ReadPhyRegister(context, guid, page, port, address, pValue)
+
+    context: ctypes.c_void_p
+    guid: raw_types.fc2PGRGuid
+    page: ctypes.c_uint
+    port: ctypes.c_uint
+    address: ctypes.c_uint
+    pValue: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ReadPhyRegister(context, guid, page, port, address, pValue)
+
+
+def fc2WritePhyRegister(context, guid, page, port, address, value):
+    """
+    fc2WritePhyRegister(context, guid, page, port, address, value)
+
+    context: ctypes.c_void_p
+    guid: raw_types.fc2PGRGuid
+    page: ctypes.c_uint
+    port: ctypes.c_uint
+    address: ctypes.c_uint
+    value: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2WritePhyRegister(context, guid, page, port, address, value)
+
+
+def fc2GetUsbLinkInfo(context, guid, pValue):
+    """
+    fc2GetUsbLinkInfo(context, guid, pValue)
+
+    context: ctypes.c_void_p
+    guid: raw_types.fc2PGRGuid
+    pValue: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetUsbLinkInfo(context, guid, pValue)
+
+
+def fc2GetUsbPortStatus(context, guid, pValue):
+    """
+    fc2GetUsbPortStatus(context, guid, pValue)
+
+    context: ctypes.c_void_p
+    guid: raw_types.fc2PGRGuid
+    pValue: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetUsbPortStatus(context, guid, pValue)
+
+
+def fc2GetTopology(context, pTopologyNodeContext):
+    """
+    fc2GetTopology(context, pTopologyNodeContext)
+
+    context: ctypes.c_void_p
+    pTopologyNodeContext: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetTopology(context, pTopologyNodeContext)
+
+
+def fc2RegisterCallback(context, enumCallback, callbackType, pParameter, pCallbackHandle):
+    """
+    fc2RegisterCallback(context, enumCallback, callbackType, pParameter, pCallbackHandle)
+
+    context: ctypes.c_void_p
+    enumCallback: ctypes.c_void_p
+    callbackType: ctypes.c_uint
+    pParameter: ctypes.c_void_p
+    pCallbackHandle: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2RegisterCallback(context, enumCallback, callbackType, pParameter, pCallbackHandle)
+
+
+def fc2UnregisterCallback(context, callbackHandle):
+    """
+    fc2UnregisterCallback(context, callbackHandle)
+
+    context: ctypes.c_void_p
+    callbackHandle: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2UnregisterCallback(context, callbackHandle)
+
+
+def fc2RescanBus(context):
+    """
+    fc2RescanBus(context)
+
+    context: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2RescanBus(context)
+
+
+def fc2ForceIPAddressToCamera(context, macAddress, ipAddress, subnetMask, defaultGateway):
+    """
+    fc2ForceIPAddressToCamera(context, macAddress, ipAddress, subnetMask, defaultGateway)
+
+    context: ctypes.c_void_p
+    macAddress: raw_types.fc2MACAddress
+    ipAddress: raw_types.fc2IPAddress
+    subnetMask: raw_types.fc2IPAddress
+    defaultGateway: raw_types.fc2IPAddress
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ForceIPAddressToCamera(context, macAddress, ipAddress, subnetMask, defaultGateway)
+
+
+def fc2ForceAllIPAddressesAutomatically():
+    """
+    fc2ForceAllIPAddressesAutomatically()
+
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ForceAllIPAddressesAutomatically()
+
+
+def fc2ForceIPAddressAutomatically(serialNumber):
+    """
+    fc2ForceIPAddressAutomatically(serialNumber)
+
+    serialNumber: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ForceIPAddressAutomatically(serialNumber)
+
+
+def fc2DiscoverGigECameras(context, gigECameras, arraySize):
+    """
+    fc2DiscoverGigECameras(context, gigECameras, arraySize)
+
+    context: ctypes.c_void_p
+    gigECameras: ctypes.POINTER(raw_types.fc2CameraInfo)
+    arraySize: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2DiscoverGigECameras(context, gigECameras, arraySize)
+
+
+def fc2IsCameraControlable(context, pGuid, pControlable):
+    """
+    fc2IsCameraControlable(context, pGuid, pControlable)
+
+    context: ctypes.c_void_p
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    pControlable: ctypes.POINTER(ctypes.c_int)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2IsCameraControlable(context, pGuid, pControlable)
+
+
+def fc2Connect(context, guid):
+    """
+    fc2Connect(context, guid)
+
+    context: ctypes.c_void_p
+    guid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2Connect(context, guid)
+
+
+def fc2Disconnect(context):
+    """
+    fc2Disconnect(context)
+
+    context: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2Disconnect(context)
+
+
+def fc2IsConnected(context):
+    """
+    fc2IsConnected(context)
+
+    context: ctypes.c_void_p
+    returns: ctypes.c_int
+    """
+    return _fc2IsConnected(context)
+
+
+def fc2SetCallback(context, pCallbackFn, pCallbackData):
+    """
+    fc2SetCallback(context, pCallbackFn, pCallbackData)
+
+    context: ctypes.c_void_p
+    pCallbackFn: ctypes.c_void_p
+    pCallbackData: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetCallback(context, pCallbackFn, pCallbackData)
+
+
+def fc2StartCapture(context):
+    """
+    fc2StartCapture(context)
+
+    context: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2StartCapture(context)
+
+
+def fc2StartCaptureCallback(context, pCallbackFn, pCallbackData):
+    """
+    fc2StartCaptureCallback(context, pCallbackFn, pCallbackData)
+
+    context: ctypes.c_void_p
+    pCallbackFn: ctypes.c_void_p
+    pCallbackData: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2StartCaptureCallback(context, pCallbackFn, pCallbackData)
+
+
+def fc2StartSyncCapture(numCameras, pContexts):
+    """
+    fc2StartSyncCapture(numCameras, pContexts)
+
+    numCameras: ctypes.c_uint
+    pContexts: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2StartSyncCapture(numCameras, pContexts)
+
+
+def fc2StartSyncCaptureCallback(numCameras, pContexts, pCallbackFns, pCallbackDataArray):
+    """
+    fc2StartSyncCaptureCallback(numCameras, pContexts, pCallbackFns, pCallbackDataArray)
+
+    numCameras: ctypes.c_uint
+    pContexts: ctypes.POINTER(ctypes.c_void_p)
+    pCallbackFns: ctypes.POINTER(raw_types.fc2BusEventCallback)
+    pCallbackDataArray: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2StartSyncCaptureCallback(numCameras, pContexts, pCallbackFns, pCallbackDataArray)
+
+
+def fc2RetrieveBuffer(context, pImage):
+    """
+    fc2RetrieveBuffer(context, pImage)
+
+    context: ctypes.c_void_p
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2RetrieveBuffer(context, pImage)
+
+
+def fc2StopCapture(context):
+    """
+    fc2StopCapture(context)
+
+    context: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2StopCapture(context)
+
+
+def fc2WaitForBufferEvent(context, pImage, eventNumber):
+    """
+    fc2WaitForBufferEvent(context, pImage, eventNumber)
+
+    context: ctypes.c_void_p
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    eventNumber: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2WaitForBufferEvent(context, pImage, eventNumber)
+
+
+def fc2SetUserBuffers(context, ppMemBuffers, size, nNumBuffers):
+    """
+    fc2SetUserBuffers(context, ppMemBuffers, size, nNumBuffers)
+
+    context: ctypes.c_void_p
+    ppMemBuffers: ctypes.POINTER(ctypes.c_ubyte)
+    size: ctypes.c_int
+    nNumBuffers: ctypes.c_int
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetUserBuffers(context, ppMemBuffers, size, nNumBuffers)
+
+
+def fc2GetConfiguration(context, config):
+    """
+    fc2GetConfiguration(context, config)
+
+    context: ctypes.c_void_p
+    config: ctypes.POINTER(raw_types.fc2Config)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetConfiguration(context, config)
+
+
+def fc2SetConfiguration(context, config):
+    """
+    fc2SetConfiguration(context, config)
+
+    context: ctypes.c_void_p
+    config: ctypes.POINTER(raw_types.fc2Config)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetConfiguration(context, config)
+
+
+def fc2GetCameraInfo(context, pCameraInfo):
+    """
+    fc2GetCameraInfo(context, pCameraInfo)
+
+    context: ctypes.c_void_p
+    pCameraInfo: ctypes.POINTER(raw_types.fc2CameraInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetCameraInfo(context, pCameraInfo)
+
+
+def fc2GetPropertyInfo(context, propInfo):
+    """
+    fc2GetPropertyInfo(context, propInfo)
+
+    context: ctypes.c_void_p
+    propInfo: ctypes.POINTER(raw_types.fc2PropertyInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetPropertyInfo(context, propInfo)
+
+
+def fc2GetProperty(context, prop):
+    """
+    fc2GetProperty(context, prop)
+
+    context: ctypes.c_void_p
+    prop: ctypes.POINTER(raw_types.fc2Property)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetProperty(context, prop)
+
+
+def fc2SetProperty(context, prop):
+    """
+    fc2SetProperty(context, prop)
+
+    context: ctypes.c_void_p
+    prop: ctypes.POINTER(raw_types.fc2Property)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetProperty(context, prop)
+
+
+def fc2SetPropertyBroadcast(context, prop):
+    """
+    fc2SetPropertyBroadcast(context, prop)
+
+    context: ctypes.c_void_p
+    prop: ctypes.POINTER(raw_types.fc2Property)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetPropertyBroadcast(context, prop)
+
+
+def fc2GetGPIOPinDirection(context, pin, pDirection):
+    """
+    fc2GetGPIOPinDirection(context, pin, pDirection)
+
+    context: ctypes.c_void_p
+    pin: ctypes.c_uint
+    pDirection: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetGPIOPinDirection(context, pin, pDirection)
+
+
+def fc2SetGPIOPinDirection(context, pin, direction):
+    """
+    fc2SetGPIOPinDirection(context, pin, direction)
+
+    context: ctypes.c_void_p
+    pin: ctypes.c_uint
+    direction: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetGPIOPinDirection(context, pin, direction)
+
+
+def fc2SetGPIOPinDirectionBroadcast(context, pin, direction):
+    """
+    fc2SetGPIOPinDirectionBroadcast(context, pin, direction)
+
+    context: ctypes.c_void_p
+    pin: ctypes.c_uint
+    direction: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetGPIOPinDirectionBroadcast(context, pin, direction)
+
+
+def fc2GetTriggerModeInfo(context, triggerModeInfo):
+    """
+    fc2GetTriggerModeInfo(context, triggerModeInfo)
+
+    context: ctypes.c_void_p
+    triggerModeInfo: ctypes.POINTER(raw_types.fc2TriggerModeInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetTriggerModeInfo(context, triggerModeInfo)
+
+
+def fc2GetTriggerMode(context, triggerMode):
+    """
+    fc2GetTriggerMode(context, triggerMode)
+
+    context: ctypes.c_void_p
+    triggerMode: ctypes.POINTER(raw_types.fc2TriggerMode)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetTriggerMode(context, triggerMode)
+
+
+def fc2SetTriggerMode(context, triggerMode):
+    """
+    fc2SetTriggerMode(context, triggerMode)
+
+    context: ctypes.c_void_p
+    triggerMode: ctypes.POINTER(raw_types.fc2TriggerMode)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetTriggerMode(context, triggerMode)
+
+
+def fc2SetTriggerModeBroadcast(context, triggerMode):
+    """
+    fc2SetTriggerModeBroadcast(context, triggerMode)
+
+    context: ctypes.c_void_p
+    triggerMode: ctypes.POINTER(raw_types.fc2TriggerMode)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetTriggerModeBroadcast(context, triggerMode)
+
+
+def fc2FireSoftwareTrigger(context):
+    """
+    fc2FireSoftwareTrigger(context)
+
+    context: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2FireSoftwareTrigger(context)
+
+
+def fc2FireSoftwareTriggerBroadcast(context):
+    """
+    fc2FireSoftwareTriggerBroadcast(context)
+
+    context: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2FireSoftwareTriggerBroadcast(context)
+
+
+def fc2GetTriggerDelayInfo(context, triggerDelayInfo):
+    """
+    fc2GetTriggerDelayInfo(context, triggerDelayInfo)
+
+    context: ctypes.c_void_p
+    triggerDelayInfo: ctypes.POINTER(raw_types.fc2PropertyInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetTriggerDelayInfo(context, triggerDelayInfo)
+
+
+def fc2GetTriggerDelay(context, triggerDelay):
+    """
+    fc2GetTriggerDelay(context, triggerDelay)
+
+    context: ctypes.c_void_p
+    triggerDelay: ctypes.POINTER(raw_types.fc2Property)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetTriggerDelay(context, triggerDelay)
+
+
+def fc2SetTriggerDelay(context, triggerDelay):
+    """
+    fc2SetTriggerDelay(context, triggerDelay)
+
+    context: ctypes.c_void_p
+    triggerDelay: ctypes.POINTER(raw_types.fc2Property)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetTriggerDelay(context, triggerDelay)
+
+
+def fc2SetTriggerDelayBroadcast(context, triggerDelay):
+    """
+    fc2SetTriggerDelayBroadcast(context, triggerDelay)
+
+    context: ctypes.c_void_p
+    triggerDelay: ctypes.POINTER(raw_types.fc2Property)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetTriggerDelayBroadcast(context, triggerDelay)
+
+
+def fc2GetStrobeInfo(context, strobeInfo):
+    """
+    fc2GetStrobeInfo(context, strobeInfo)
+
+    context: ctypes.c_void_p
+    strobeInfo: ctypes.POINTER(raw_types.fc2StrobeInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetStrobeInfo(context, strobeInfo)
+
+
+def fc2GetStrobe(context, strobeControl):
+    """
+    fc2GetStrobe(context, strobeControl)
+
+    context: ctypes.c_void_p
+    strobeControl: ctypes.POINTER(raw_types.fc2StrobeControl)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetStrobe(context, strobeControl)
+
+
+def fc2SetStrobe(context, strobeControl):
+    """
+    fc2SetStrobe(context, strobeControl)
+
+    context: ctypes.c_void_p
+    strobeControl: ctypes.POINTER(raw_types.fc2StrobeControl)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetStrobe(context, strobeControl)
+
+
+def fc2SetStrobeBroadcast(context, strobeControl):
+    """
+    fc2SetStrobeBroadcast(context, strobeControl)
+
+    context: ctypes.c_void_p
+    strobeControl: ctypes.POINTER(raw_types.fc2StrobeControl)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetStrobeBroadcast(context, strobeControl)
+
+
+def fc2GetLUTInfo(context, pData):
+    """
+    fc2GetLUTInfo(context, pData)
+
+    context: ctypes.c_void_p
+    pData: ctypes.POINTER(raw_types.fc2LUTData)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetLUTInfo(context, pData)
+
+
+def fc2GetLUTBankInfo(context, bank, pReadSupported, pWriteSupported):
+    """
+    fc2GetLUTBankInfo(context, bank, pReadSupported, pWriteSupported)
+
+    context: ctypes.c_void_p
+    bank: ctypes.c_uint
+    pReadSupported: ctypes.POINTER(ctypes.c_int)
+    pWriteSupported: ctypes.POINTER(ctypes.c_int)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetLUTBankInfo(context, bank, pReadSupported, pWriteSupported)
+
+
+def fc2GetActiveLUTBank(context, pActiveBank):
+    """
+    fc2GetActiveLUTBank(context, pActiveBank)
+
+    context: ctypes.c_void_p
+    pActiveBank: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetActiveLUTBank(context, pActiveBank)
+
+
+def fc2SetActiveLUTBank(context, activeBank):
+    """
+    fc2SetActiveLUTBank(context, activeBank)
+
+    context: ctypes.c_void_p
+    activeBank: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetActiveLUTBank(context, activeBank)
+
+
+def fc2EnableLUT(context, on):
+    """
+    fc2EnableLUT(context, on)
+
+    context: ctypes.c_void_p
+    on: ctypes.c_int
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2EnableLUT(context, on)
+
+
+def fc2GetLUTChannel(context, bank, channel, sizeEntries, pEntries):
+    """
+    fc2GetLUTChannel(context, bank, channel, sizeEntries, pEntries)
+
+    context: ctypes.c_void_p
+    bank: ctypes.c_uint
+    channel: ctypes.c_uint
+    sizeEntries: ctypes.c_uint
+    pEntries: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetLUTChannel(context, bank, channel, sizeEntries, pEntries)
+
+
+def fc2SetLUTChannel(context, bank, channel, sizeEntries, pEntries):
+    """
+    fc2SetLUTChannel(context, bank, channel, sizeEntries, pEntries)
+
+    context: ctypes.c_void_p
+    bank: ctypes.c_uint
+    channel: ctypes.c_uint
+    sizeEntries: ctypes.c_uint
+    pEntries: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetLUTChannel(context, bank, channel, sizeEntries, pEntries)
+
+
+def fc2GetMemoryChannel(context, pCurrentChannel):
+    """
+    fc2GetMemoryChannel(context, pCurrentChannel)
+
+    context: ctypes.c_void_p
+    pCurrentChannel: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetMemoryChannel(context, pCurrentChannel)
+
+
+def fc2SaveToMemoryChannel(context, channel):
+    """
+    fc2SaveToMemoryChannel(context, channel)
+
+    context: ctypes.c_void_p
+    channel: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SaveToMemoryChannel(context, channel)
+
+
+def fc2RestoreFromMemoryChannel(context, channel):
+    """
+    fc2RestoreFromMemoryChannel(context, channel)
+
+    context: ctypes.c_void_p
+    channel: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2RestoreFromMemoryChannel(context, channel)
+
+
+def fc2GetMemoryChannelInfo(context, pNumChannels):
+    """
+    fc2GetMemoryChannelInfo(context, pNumChannels)
+
+    context: ctypes.c_void_p
+    pNumChannels: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetMemoryChannelInfo(context, pNumChannels)
+
+
+def fc2GetEmbeddedImageInfo(context, pInfo):
+    """
+    fc2GetEmbeddedImageInfo(context, pInfo)
+
+    context: ctypes.c_void_p
+    pInfo: ctypes.POINTER(raw_types.fc2EmbeddedImageInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetEmbeddedImageInfo(context, pInfo)
+
+
+def fc2SetEmbeddedImageInfo(context, pInfo):
+    """
+    fc2SetEmbeddedImageInfo(context, pInfo)
+
+    context: ctypes.c_void_p
+    pInfo: ctypes.POINTER(raw_types.fc2EmbeddedImageInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetEmbeddedImageInfo(context, pInfo)
+
+
+def fc2WriteRegister(context, address, value):
+    """
+    fc2WriteRegister(context, address, value)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    value: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2WriteRegister(context, address, value)
+
+
+def fc2ReadRegister(context, address, pValue):
+    """
+    fc2ReadRegister(context, address, pValue)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    pValue: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ReadRegister(context, address, pValue)
+
+
+def fc2WriteRegisterBroadcast(context, address, value):
+    """
+    fc2WriteRegisterBroadcast(context, address, value)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    value: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2WriteRegisterBroadcast(context, address, value)
+
+
+def fc2WriteRegisterBlock(context, addressHigh, addressLow, pBuffer, length):
+    """
+    fc2WriteRegisterBlock(context, addressHigh, addressLow, pBuffer, length)
+
+    context: ctypes.c_void_p
+    addressHigh: ctypes.c_ushort
+    addressLow: ctypes.c_uint
+    pBuffer: ctypes.POINTER(ctypes.c_uint)
+    length: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2WriteRegisterBlock(context, addressHigh, addressLow, pBuffer, length)
+
+
+def fc2ReadRegisterBlock(context, addressHigh, addressLow, pBuffer, length):
+    """
+    fc2ReadRegisterBlock(context, addressHigh, addressLow, pBuffer, length)
+
+    context: ctypes.c_void_p
+    addressHigh: ctypes.c_ushort
+    addressLow: ctypes.c_uint
+    pBuffer: ctypes.POINTER(ctypes.c_uint)
+    length: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ReadRegisterBlock(context, addressHigh, addressLow, pBuffer, length)
+
+
+def fc2GetRegisterString(registerVal):
+    """
+    fc2GetRegisterString(registerVal)
+
+    registerVal: ctypes.c_uint
+    returns: ctypes.c_char_p
+    """
+    return _fc2GetRegisterString(registerVal)
+
+
+def fc2GetCycleTime(context, pTimeStamp):
+    """
+    fc2GetCycleTime(context, pTimeStamp)
+
+    context: ctypes.c_void_p
+    pTimeStamp: ctypes.POINTER(raw_types.fc2TimeStamp)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetCycleTime(context, pTimeStamp)
+
+
+def fc2GetStats(context, pCameraStats):
+    """
+    fc2GetStats(context, pCameraStats)
+
+    context: ctypes.c_void_p
+    pCameraStats: ctypes.POINTER(raw_types.fc2CameraStats)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetStats(context, pCameraStats)
+
+
+def fc2RegisterEvent(context, pOpts):
+    """
+    fc2RegisterEvent(context, pOpts)
+
+    context: ctypes.c_void_p
+    pOpts: ctypes.POINTER(raw_types.fc2EventOptions)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2RegisterEvent(context, pOpts)
+
+
+def fc2DeregisterEvent(context, pOpts):
+    """
+    fc2DeregisterEvent(context, pOpts)
+
+    context: ctypes.c_void_p
+    pOpts: ctypes.POINTER(raw_types.fc2EventOptions)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2DeregisterEvent(context, pOpts)
+
+
+def fc2RegisterAllEvents(context, pOpts):
+    """
+    fc2RegisterAllEvents(context, pOpts)
+
+    context: ctypes.c_void_p
+    pOpts: ctypes.POINTER(raw_types.fc2EventOptions)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2RegisterAllEvents(context, pOpts)
+
+
+def fc2DeregisterAllEvents(context):
+    """
+    fc2DeregisterAllEvents(context)
+
+    context: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2DeregisterAllEvents(context)
+
+
+def fc2GetVideoModeAndFrameRateInfo(context, videoMode, frameRate, pSupported):
+    """
+    fc2GetVideoModeAndFrameRateInfo(context, videoMode, frameRate, pSupported)
+
+    context: ctypes.c_void_p
+    videoMode: ctypes.c_uint
+    frameRate: ctypes.c_uint
+    pSupported: ctypes.POINTER(ctypes.c_int)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetVideoModeAndFrameRateInfo(context, videoMode, frameRate, pSupported)
+
+
+def fc2GetVideoModeAndFrameRate(context, videoMode, frameRate):
+    """
+    fc2GetVideoModeAndFrameRate(context, videoMode, frameRate)
+
+    context: ctypes.c_void_p
+    videoMode: ctypes.POINTER(ctypes.c_uint)
+    frameRate: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetVideoModeAndFrameRate(context, videoMode, frameRate)
+
+
+def fc2SetVideoModeAndFrameRate(context, videoMode, frameRate):
+    """
+    fc2SetVideoModeAndFrameRate(context, videoMode, frameRate)
+
+    context: ctypes.c_void_p
+    videoMode: ctypes.c_uint
+    frameRate: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetVideoModeAndFrameRate(context, videoMode, frameRate)
+
+
+def fc2GetFormat7Info(context, info, pSupported):
+    """
+    fc2GetFormat7Info(context, info, pSupported)
+
+    context: ctypes.c_void_p
+    info: ctypes.POINTER(raw_types.fc2Format7Info)
+    pSupported: ctypes.POINTER(ctypes.c_int)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetFormat7Info(context, info, pSupported)
+
+
+def fc2ValidateFormat7Settings(context, imageSettings, settingsAreValid, packetInfo):
+    """
+    fc2ValidateFormat7Settings(context, imageSettings, settingsAreValid, packetInfo)
+
+    context: ctypes.c_void_p
+    imageSettings: ctypes.POINTER(raw_types.fc2Format7ImageSettings)
+    settingsAreValid: ctypes.POINTER(ctypes.c_int)
+    packetInfo: ctypes.POINTER(raw_types.fc2Format7PacketInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ValidateFormat7Settings(context, imageSettings, settingsAreValid, packetInfo)
+
+
+def fc2GetFormat7Configuration(context, imageSettings, packetSize, percentage):
+    """
+    fc2GetFormat7Configuration(context, imageSettings, packetSize, percentage)
+
+    context: ctypes.c_void_p
+    imageSettings: ctypes.POINTER(raw_types.fc2Format7ImageSettings)
+    packetSize: ctypes.POINTER(ctypes.c_uint)
+    percentage: ctypes.POINTER(ctypes.c_float)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetFormat7Configuration(context, imageSettings, packetSize, percentage)
+
+
+def fc2SetFormat7ConfigurationPacket(context, imageSettings, packetSize):
+    """
+    fc2SetFormat7ConfigurationPacket(context, imageSettings, packetSize)
+
+    context: ctypes.c_void_p
+    imageSettings: ctypes.POINTER(raw_types.fc2Format7ImageSettings)
+    packetSize: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetFormat7ConfigurationPacket(context, imageSettings, packetSize)
+
+
+def fc2SetFormat7Configuration(context, imageSettings, percentSpeed):
+    """
+    fc2SetFormat7Configuration(context, imageSettings, percentSpeed)
+
+    context: ctypes.c_void_p
+    imageSettings: ctypes.POINTER(raw_types.fc2Format7ImageSettings)
+    percentSpeed: ctypes.c_float
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetFormat7Configuration(context, imageSettings, percentSpeed)
+
+
+def fc2WriteGVCPRegister(context, address, value):
+    """
+    fc2WriteGVCPRegister(context, address, value)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    value: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2WriteGVCPRegister(context, address, value)
+
+
+def fc2WriteGVCPRegisterBroadcast(context, address, value):
+    """
+    fc2WriteGVCPRegisterBroadcast(context, address, value)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    value: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2WriteGVCPRegisterBroadcast(context, address, value)
+
+
+def fc2ReadGVCPRegister(context, address, pValue):
+    """
+    fc2ReadGVCPRegister(context, address, pValue)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    pValue: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ReadGVCPRegister(context, address, pValue)
+
+
+def fc2WriteGVCPRegisterBlock(context, address, pBuffer, length):
+    """
+    fc2WriteGVCPRegisterBlock(context, address, pBuffer, length)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    pBuffer: ctypes.POINTER(ctypes.c_uint)
+    length: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2WriteGVCPRegisterBlock(context, address, pBuffer, length)
+
+
+def fc2ReadGVCPRegisterBlock(context, address, pBuffer, length):
+    """
+    fc2ReadGVCPRegisterBlock(context, address, pBuffer, length)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    pBuffer: ctypes.POINTER(ctypes.c_uint)
+    length: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ReadGVCPRegisterBlock(context, address, pBuffer, length)
+
+
+def fc2WriteGVCPMemory(context, address, pBuffer, length):
+    """
+    fc2WriteGVCPMemory(context, address, pBuffer, length)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    pBuffer: ctypes.POINTER(ctypes.c_ubyte)
+    length: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2WriteGVCPMemory(context, address, pBuffer, length)
+
+
+def fc2ReadGVCPMemory(context, address, pBuffer, length):
+    """
+    fc2ReadGVCPMemory(context, address, pBuffer, length)
+
+    context: ctypes.c_void_p
+    address: ctypes.c_uint
+    pBuffer: ctypes.POINTER(ctypes.c_ubyte)
+    length: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ReadGVCPMemory(context, address, pBuffer, length)
+
+
+def fc2GetGigEProperty(context, pGigEProp):
+    """
+    fc2GetGigEProperty(context, pGigEProp)
+
+    context: ctypes.c_void_p
+    pGigEProp: ctypes.POINTER(raw_types.fc2GigEProperty)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetGigEProperty(context, pGigEProp)
+
+
+def fc2SetGigEProperty(context, pGigEProp):
+    """
+    fc2SetGigEProperty(context, pGigEProp)
+
+    context: ctypes.c_void_p
+    pGigEProp: ctypes.POINTER(raw_types.fc2GigEProperty)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetGigEProperty(context, pGigEProp)
+
+
+def fc2DiscoverGigEPacketSize(context, packetSize):
+    """
+    fc2DiscoverGigEPacketSize(context, packetSize)
+
+    context: ctypes.c_void_p
+    packetSize: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2DiscoverGigEPacketSize(context, packetSize)
+
+
+def fc2QueryGigEImagingMode(context, mode, isSupported):
+    """
+    fc2QueryGigEImagingMode(context, mode, isSupported)
+
+    context: ctypes.c_void_p
+    mode: ctypes.c_uint
+    isSupported: ctypes.POINTER(ctypes.c_int)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2QueryGigEImagingMode(context, mode, isSupported)
+
+
+def fc2GetGigEImagingMode(context, mode):
+    """
+    fc2GetGigEImagingMode(context, mode)
+
+    context: ctypes.c_void_p
+    mode: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetGigEImagingMode(context, mode)
+
+
+def fc2SetGigEImagingMode(context, mode):
+    """
+    fc2SetGigEImagingMode(context, mode)
+
+    context: ctypes.c_void_p
+    mode: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetGigEImagingMode(context, mode)
+
+
+def fc2GetGigEImageSettingsInfo(context, pInfo):
+    """
+    fc2GetGigEImageSettingsInfo(context, pInfo)
+
+    context: ctypes.c_void_p
+    pInfo: ctypes.POINTER(raw_types.fc2GigEImageSettingsInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetGigEImageSettingsInfo(context, pInfo)
+
+
+def fc2GetGigEImageSettings(context, pImageSettings):
+    """
+    fc2GetGigEImageSettings(context, pImageSettings)
+
+    context: ctypes.c_void_p
+    pImageSettings: ctypes.POINTER(raw_types.fc2GigEImageSettings)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetGigEImageSettings(context, pImageSettings)
+
+
+def fc2SetGigEImageSettings(context, pImageSettings):
+    """
+    fc2SetGigEImageSettings(context, pImageSettings)
+
+    context: ctypes.c_void_p
+    pImageSettings: ctypes.POINTER(raw_types.fc2GigEImageSettings)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetGigEImageSettings(context, pImageSettings)
+
+
+def fc2GetGigEImageBinningSettings(context, horzBinnningValue, vertBinnningValue):
+    """
+    fc2GetGigEImageBinningSettings(context, horzBinnningValue, vertBinnningValue)
+
+    context: ctypes.c_void_p
+    horzBinnningValue: ctypes.POINTER(ctypes.c_uint)
+    vertBinnningValue: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetGigEImageBinningSettings(context, horzBinnningValue, vertBinnningValue)
+
+
+def fc2SetGigEImageBinningSettings(context, horzBinnningValue, vertBinnningValue):
+    """
+    fc2SetGigEImageBinningSettings(context, horzBinnningValue, vertBinnningValue)
+
+    context: ctypes.c_void_p
+    horzBinnningValue: ctypes.c_uint
+    vertBinnningValue: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetGigEImageBinningSettings(context, horzBinnningValue, vertBinnningValue)
+
+
+def fc2GetNumStreamChannels(context, numChannels):
+    """
+    fc2GetNumStreamChannels(context, numChannels)
+
+    context: ctypes.c_void_p
+    numChannels: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetNumStreamChannels(context, numChannels)
+
+
+def fc2GetGigEStreamChannelInfo(context, channel, pChannel):
+    """
+    fc2GetGigEStreamChannelInfo(context, channel, pChannel)
+
+    context: ctypes.c_void_p
+    channel: ctypes.c_uint
+    pChannel: ctypes.POINTER(raw_types.fc2GigEStreamChannel)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetGigEStreamChannelInfo(context, channel, pChannel)
+
+
+def fc2SetGigEStreamChannelInfo(context, channel, pChannel):
+    """
+    fc2SetGigEStreamChannelInfo(context, channel, pChannel)
+
+    context: ctypes.c_void_p
+    channel: ctypes.c_uint
+    pChannel: ctypes.POINTER(raw_types.fc2GigEStreamChannel)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetGigEStreamChannelInfo(context, channel, pChannel)
+
+
+def fc2GetGigEConfig(context, pConfig):
+    """
+    fc2GetGigEConfig(context, pConfig)
+
+    context: ctypes.c_void_p
+    pConfig: ctypes.POINTER(raw_types.fc2GigEConfig)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetGigEConfig(context, pConfig)
+
+
+def fc2SetGigEConfig(context, pConfig):
+    """
+    fc2SetGigEConfig(context, pConfig)
+
+    context: ctypes.c_void_p
+    pConfig: ctypes.POINTER(raw_types.fc2GigEConfig)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetGigEConfig(context, pConfig)
+
+
+def fc2SetDefaultColorProcessing(defaultMethod):
+    """
+    fc2SetDefaultColorProcessing(defaultMethod)
+
+    defaultMethod: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetDefaultColorProcessing(defaultMethod)
+
+
+def fc2GetDefaultColorProcessing(pDefaultMethod):
+    """
+    fc2GetDefaultColorProcessing(pDefaultMethod)
+
+    pDefaultMethod: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetDefaultColorProcessing(pDefaultMethod)
+
+
+def fc2SetDefaultOutputFormat(format):
+    """
+    fc2SetDefaultOutputFormat(format)
+
+    format: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetDefaultOutputFormat(format)
+
+
+def fc2GetDefaultOutputFormat(pFormat):
+    """
+    fc2GetDefaultOutputFormat(pFormat)
+
+    pFormat: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetDefaultOutputFormat(pFormat)
+
+
+def fc2DetermineBitsPerPixel(format, pBitsPerPixel):
+    """
+    fc2DetermineBitsPerPixel(format, pBitsPerPixel)
+
+    format: ctypes.c_uint
+    pBitsPerPixel: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2DetermineBitsPerPixel(format, pBitsPerPixel)
+
+
+def fc2CreateImage(pImage):
+    """
+    fc2CreateImage(pImage)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2CreateImage(pImage)
+
+
+def fc2DestroyImage(image):
+    """
+    fc2DestroyImage(image)
+
+    image: ctypes.POINTER(raw_types.fc2Image)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2DestroyImage(image)
+
+
+def fc2SetImageDimensions(pImage, rows, cols, stride, pixelFormat, bayerFormat):
+    """
+    fc2SetImageDimensions(pImage, rows, cols, stride, pixelFormat, bayerFormat)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    rows: ctypes.c_uint
+    cols: ctypes.c_uint
+    stride: ctypes.c_uint
+    pixelFormat: ctypes.c_uint
+    bayerFormat: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetImageDimensions(pImage, rows, cols, stride, pixelFormat, bayerFormat)
+
+
+def fc2GetImageDimensions(pImage, pRows, pCols, pStride, pPixelFormat, pBayerFormat):
+    """
+    fc2GetImageDimensions(pImage, pRows, pCols, pStride, pPixelFormat, pBayerFormat)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    pRows: ctypes.POINTER(ctypes.c_uint)
+    pCols: ctypes.POINTER(ctypes.c_uint)
+    pStride: ctypes.POINTER(ctypes.c_uint)
+    pPixelFormat: ctypes.POINTER(ctypes.c_uint)
+    pBayerFormat: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetImageDimensions(pImage, pRows, pCols, pStride, pPixelFormat, pBayerFormat)
+
+
+def fc2SetImageColorProcessing(pImage, colorProc):
+    """
+    fc2SetImageColorProcessing(pImage, colorProc)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    colorProc: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetImageColorProcessing(pImage, colorProc)
+
+
+def fc2GetImageColorProcessing(pImage, pColorProc):
+    """
+    fc2GetImageColorProcessing(pImage, pColorProc)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    pColorProc: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetImageColorProcessing(pImage, pColorProc)
+
+
+def fc2SetImageData(pImage, pData, dataSize):
+    """
+    fc2SetImageData(pImage, pData, dataSize)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    pData: ctypes.POINTER(ctypes.c_ubyte)
+    dataSize: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetImageData(pImage, pData, dataSize)
+
+
+def fc2GetImageData(pImage, ppData):
+    """
+    fc2GetImageData(pImage, ppData)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    ppData: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetImageData(pImage, ppData)
+
+
+def fc2GetImageMetadata(pImage, pImageMetaData):
+    """
+    fc2GetImageMetadata(pImage, pImageMetaData)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    pImageMetaData: ctypes.POINTER(raw_types.fc2ImageMetadata)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetImageMetadata(pImage, pImageMetaData)
+
+
+def fc2GetImageTimeStamp(pImage):
+    """
+    fc2GetImageTimeStamp(pImage)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    returns: raw_types.fc2TimeStamp
+    """
+    return _fc2GetImageTimeStamp(pImage)
+
+
+def fc2SaveImage(pImage, pFilename, format):
+    """
+    fc2SaveImage(pImage, pFilename, format)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    pFilename: ctypes.c_char_p
+    format: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SaveImage(pImage, pFilename, format)
+
+
+def fc2SaveImageWithOption(pImage, pFilename, format, pOption):
+    """
+    fc2SaveImageWithOption(pImage, pFilename, format, pOption)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    pFilename: ctypes.c_char_p
+    format: ctypes.c_uint
+    pOption: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SaveImageWithOption(pImage, pFilename, format, pOption)
+
+
+def fc2ConvertImage(pImageIn, pImageOut):
+    """
+    fc2ConvertImage(pImageIn, pImageOut)
+
+    pImageIn: ctypes.POINTER(raw_types.fc2Image)
+    pImageOut: ctypes.POINTER(raw_types.fc2Image)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ConvertImage(pImageIn, pImageOut)
+
+
+def fc2ConvertImageTo(format, pImageIn, pImageOut):
+    """
+    fc2ConvertImageTo(format, pImageIn, pImageOut)
+
+    format: ctypes.c_uint
+    pImageIn: ctypes.POINTER(raw_types.fc2Image)
+    pImageOut: ctypes.POINTER(raw_types.fc2Image)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ConvertImageTo(format, pImageIn, pImageOut)
+
+
+def fc2CalculateImageStatistics(pImage, pImageStatisticsContext):
+    """
+    fc2CalculateImageStatistics(pImage, pImageStatisticsContext)
+
+    pImage: ctypes.POINTER(raw_types.fc2Image)
+    pImageStatisticsContext: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2CalculateImageStatistics(pImage, pImageStatisticsContext)
+
+
+def fc2CreateImageStatistics(pImageStatisticsContext):
+    """
+    fc2CreateImageStatistics(pImageStatisticsContext)
+
+    pImageStatisticsContext: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2CreateImageStatistics(pImageStatisticsContext)
+
+
+def fc2DestroyImageStatistics(imageStatisticsContext):
+    """
+    fc2DestroyImageStatistics(imageStatisticsContext)
+
+    imageStatisticsContext: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2DestroyImageStatistics(imageStatisticsContext)
+
+
+def fc2ImageStatisticsEnableAll(imageStatisticsContext):
+    """
+    fc2ImageStatisticsEnableAll(imageStatisticsContext)
+
+    imageStatisticsContext: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ImageStatisticsEnableAll(imageStatisticsContext)
+
+
+def fc2ImageStatisticsDisableAll(imageStatisticsContext):
+    """
+    fc2ImageStatisticsDisableAll(imageStatisticsContext)
+
+    imageStatisticsContext: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ImageStatisticsDisableAll(imageStatisticsContext)
+
+
+def fc2ImageStatisticsEnableGreyOnly(imageStatisticsContext):
+    """
+    fc2ImageStatisticsEnableGreyOnly(imageStatisticsContext)
+
+    imageStatisticsContext: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ImageStatisticsEnableGreyOnly(imageStatisticsContext)
+
+
+def fc2ImageStatisticsEnableRGBOnly(imageStatisticsContext):
+    """
+    fc2ImageStatisticsEnableRGBOnly(imageStatisticsContext)
+
+    imageStatisticsContext: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ImageStatisticsEnableRGBOnly(imageStatisticsContext)
+
+
+def fc2ImageStatisticsEnableHSLOnly(imageStatisticsContext):
+    """
+    fc2ImageStatisticsEnableHSLOnly(imageStatisticsContext)
+
+    imageStatisticsContext: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2ImageStatisticsEnableHSLOnly(imageStatisticsContext)
+
+
+def fc2GetChannelStatus(imageStatisticsContext, channel, pEnabled):
+    """
+    fc2GetChannelStatus(imageStatisticsContext, channel, pEnabled)
+
+    imageStatisticsContext: ctypes.c_void_p
+    channel: ctypes.c_uint
+    pEnabled: ctypes.POINTER(ctypes.c_int)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetChannelStatus(imageStatisticsContext, channel, pEnabled)
+
+
+def fc2SetChannelStatus(imageStatisticsContext, channel, enabled):
+    """
+    fc2SetChannelStatus(imageStatisticsContext, channel, enabled)
+
+    imageStatisticsContext: ctypes.c_void_p
+    channel: ctypes.c_uint
+    enabled: ctypes.c_int
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2SetChannelStatus(imageStatisticsContext, channel, enabled)
+
+
+def fc2GetChannelRange(imageStatisticsContext, channel, pMin, pMax):
+    """
+    fc2GetChannelRange(imageStatisticsContext, channel, pMin, pMax)
+
+    imageStatisticsContext: ctypes.c_void_p
+    channel: ctypes.c_uint
+    pMin: ctypes.POINTER(ctypes.c_uint)
+    pMax: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetChannelRange(imageStatisticsContext, channel, pMin, pMax)
+
+
+def fc2GetChannelPixelValueRange(imageStatisticsContext, channel, pPixelValueMin, pPixelValueMax):
+    """
+    fc2GetChannelPixelValueRange(imageStatisticsContext, channel, pPixelValueMin, pPixelValueMax)
+
+    imageStatisticsContext: ctypes.c_void_p
+    channel: ctypes.c_uint
+    pPixelValueMin: ctypes.POINTER(ctypes.c_uint)
+    pPixelValueMax: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetChannelPixelValueRange(imageStatisticsContext, channel, pPixelValueMin, pPixelValueMax)
+
+
+def fc2GetChannelNumPixelValues(imageStatisticsContext, channel, pNumPixelValues):
+    """
+    fc2GetChannelNumPixelValues(imageStatisticsContext, channel, pNumPixelValues)
+
+    imageStatisticsContext: ctypes.c_void_p
+    channel: ctypes.c_uint
+    pNumPixelValues: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetChannelNumPixelValues(imageStatisticsContext, channel, pNumPixelValues)
+
+
+def fc2GetChannelMean(imageStatisticsContext, channel, pPixelValueMean):
+    """
+    fc2GetChannelMean(imageStatisticsContext, channel, pPixelValueMean)
+
+    imageStatisticsContext: ctypes.c_void_p
+    channel: ctypes.c_uint
+    pPixelValueMean: ctypes.POINTER(ctypes.c_float)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetChannelMean(imageStatisticsContext, channel, pPixelValueMean)
+
+
+def fc2GetChannelHistogram(imageStatisticsContext, channel, ppHistogram):
+    """
+    fc2GetChannelHistogram(imageStatisticsContext, channel, ppHistogram)
+
+    imageStatisticsContext: ctypes.c_void_p
+    channel: ctypes.c_uint
+    ppHistogram: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetChannelHistogram(imageStatisticsContext, channel, ppHistogram)
+
+
+def fc2GetImageStatistics(imageStatisticsContext, channel, pRangeMin, pRangeMax, pPixelValueMin, pPixelValueMax, pNumPixelValues, pPixelValueMean, ppHistogram):
+    """
+    fc2GetImageStatistics(imageStatisticsContext, channel, pRangeMin, pRangeMax, pPixelValueMin, pPixelValueMax, pNumPixelValues, pPixelValueMean, ppHistogram)
+
+    imageStatisticsContext: ctypes.c_void_p
+    channel: ctypes.c_uint
+    pRangeMin: ctypes.POINTER(ctypes.c_uint)
+    pRangeMax: ctypes.POINTER(ctypes.c_uint)
+    pPixelValueMin: ctypes.POINTER(ctypes.c_uint)
+    pPixelValueMax: ctypes.POINTER(ctypes.c_uint)
+    pNumPixelValues: ctypes.POINTER(ctypes.c_uint)
+    pPixelValueMean: ctypes.POINTER(ctypes.c_float)
+    ppHistogram: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetImageStatistics(imageStatisticsContext, channel, pRangeMin, pRangeMax, pPixelValueMin, pPixelValueMax, pNumPixelValues, pPixelValueMean, ppHistogram)
+
+
+def fc2CreateTopologyNode(pTopologyNodeContext):
+    """
+    fc2CreateTopologyNode(pTopologyNodeContext)
+
+    pTopologyNodeContext: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2CreateTopologyNode(pTopologyNodeContext)
+
+
+def fc2TopologyNodeGetGuid(TopologyNodeContext, pGuid):
+    """
+    fc2TopologyNodeGetGuid(TopologyNodeContext, pGuid)
+
+    TopologyNodeContext: ctypes.c_void_p
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeGetGuid(TopologyNodeContext, pGuid)
+
+
+def fc2TopologyNodeGetDeviceId(TopologyNodeContext, pID):
+    """
+    fc2TopologyNodeGetDeviceId(TopologyNodeContext, pID)
+
+    TopologyNodeContext: ctypes.c_void_p
+    pID: ctypes.POINTER(ctypes.c_int)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeGetDeviceId(TopologyNodeContext, pID)
+
+
+def fc2TopologyNodeGetNodeType(TopologyNodeContext, pNodeType):
+    """
+    fc2TopologyNodeGetNodeType(TopologyNodeContext, pNodeType)
+
+    TopologyNodeContext: ctypes.c_void_p
+    pNodeType: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeGetNodeType(TopologyNodeContext, pNodeType)
+
+
+def fc2TopologyNodeGetInterfaceType(TopologyNodeContext, pInterfaceType):
+    """
+    fc2TopologyNodeGetInterfaceType(TopologyNodeContext, pInterfaceType)
+
+    TopologyNodeContext: ctypes.c_void_p
+    pInterfaceType: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeGetInterfaceType(TopologyNodeContext, pInterfaceType)
+
+
+def fc2TopologyNodeGetNumChildren(TopologyNodeContext, pNumChildNodes):
+    """
+    fc2TopologyNodeGetNumChildren(TopologyNodeContext, pNumChildNodes)
+
+    TopologyNodeContext: ctypes.c_void_p
+    pNumChildNodes: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeGetNumChildren(TopologyNodeContext, pNumChildNodes)
+
+
+def fc2TopologyNodeGetChild(TopologyNodeContext, position, pChildTopologyNodeContext):
+    """
+    fc2TopologyNodeGetChild(TopologyNodeContext, position, pChildTopologyNodeContext)
+
+    TopologyNodeContext: ctypes.c_void_p
+    position: ctypes.c_uint
+    pChildTopologyNodeContext: ctypes.POINTER(ctypes.c_void_p)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeGetChild(TopologyNodeContext, position, pChildTopologyNodeContext)
+
+
+def fc2TopologyNodeAddChild(TopologyNodeContext, TopologyNodeChildContext):
+    """
+    fc2TopologyNodeAddChild(TopologyNodeContext, TopologyNodeChildContext)
+
+    TopologyNodeContext: ctypes.c_void_p
+    TopologyNodeChildContext: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeAddChild(TopologyNodeContext, TopologyNodeChildContext)
+
+
+def fc2TopologyNodeGetNumPorts(TopologyNodeContext, pNumPorts):
+    """
+    fc2TopologyNodeGetNumPorts(TopologyNodeContext, pNumPorts)
+
+    TopologyNodeContext: ctypes.c_void_p
+    pNumPorts: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeGetNumPorts(TopologyNodeContext, pNumPorts)
+
+
+def fc2TopologyNodeGetPortType(TopologyNodeContext, position, pPortType):
+    """
+    fc2TopologyNodeGetPortType(TopologyNodeContext, position, pPortType)
+
+    TopologyNodeContext: ctypes.c_void_p
+    position: ctypes.c_uint
+    pPortType: ctypes.POINTER(ctypes.c_uint)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeGetPortType(TopologyNodeContext, position, pPortType)
+
+
+def fc2TopologyNodeAddPortType(TopologyNodeContext, portType):
+    """
+    fc2TopologyNodeAddPortType(TopologyNodeContext, portType)
+
+    TopologyNodeContext: ctypes.c_void_p
+    portType: ctypes.c_uint
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2TopologyNodeAddPortType(TopologyNodeContext, portType)
+
+
+def fc2TopologyNodeAssignGuidToNode(TopologyNodeContext, guid, deviceId):
+    """
+    fc2TopologyNodeAssignGuidToNode(TopologyNodeContext, guid, deviceId)
+
+    TopologyNodeContext: ctypes.c_void_p
+    guid: raw_types.fc2PGRGuid
+    deviceId: ctypes.c_int
+    returns: ctypes.c_int
+    """
+    return _fc2TopologyNodeAssignGuidToNode(TopologyNodeContext, guid, deviceId)
+
+
+def fc2TopologyNodeAssignGuidToNodeEx(TopologyNodeContext, guid, deviceId, nodeType):
+    """
+    fc2TopologyNodeAssignGuidToNodeEx(TopologyNodeContext, guid, deviceId, nodeType)
+
+    TopologyNodeContext: ctypes.c_void_p
+    guid: raw_types.fc2PGRGuid
+    deviceId: ctypes.c_int
+    nodeType: ctypes.c_uint
+    returns: ctypes.c_int
+    """
+    return _fc2TopologyNodeAssignGuidToNodeEx(TopologyNodeContext, guid, deviceId, nodeType)
+
+
+def fc2DestroyTopologyNode(TopologyNodeContext):
+    """
+    fc2DestroyTopologyNode(TopologyNodeContext)
+
+    TopologyNodeContext: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2DestroyTopologyNode(TopologyNodeContext)
+
+
+def fc2CheckDriver(pGuid):
+    """
+    fc2CheckDriver(pGuid)
+
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2CheckDriver(pGuid)
+
+
+def fc2GetDriverDeviceName(pGuid, pDeviceName, deviceNameLength):
+    """
+    fc2GetDriverDeviceName(pGuid, pDeviceName, deviceNameLength)
+
+    pGuid: ctypes.POINTER(raw_types.fc2PGRGuid)
+    pDeviceName: ctypes.c_char_p
+    deviceNameLength: ctypes.POINTER(ctypes.c_ulong)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetDriverDeviceName(pGuid, pDeviceName, deviceNameLength)
+
+
+def fc2GetSystemInfo(pSystemInfo):
+    """
+    fc2GetSystemInfo(pSystemInfo)
+
+    pSystemInfo: ctypes.POINTER(raw_types.fc2SystemInfo)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetSystemInfo(pSystemInfo)
+
+
+def fc2GetLibraryVersion(pVersion):
+    """
+    fc2GetLibraryVersion(pVersion)
+
+    pVersion: ctypes.POINTER(raw_types.fc2Version)
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2GetLibraryVersion(pVersion)
+
+
+def fc2LaunchBrowser(pAddress):
+    """
+    fc2LaunchBrowser(pAddress)
+
+    pAddress: ctypes.c_char_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2LaunchBrowser(pAddress)
+
+
+def fc2LaunchHelp(pFileName):
+    """
+    fc2LaunchHelp(pFileName)
+
+    pFileName: ctypes.c_char_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2LaunchHelp(pFileName)
+
+
+def fc2LaunchCommand(pCommand):
+    """
+    fc2LaunchCommand(pCommand)
+
+    pCommand: ctypes.c_char_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2LaunchCommand(pCommand)
+
+
+def fc2LaunchCommandAsync(pCommand, pCallback, pUserData):
+    """
+    fc2LaunchCommandAsync(pCommand, pCallback, pUserData)
+
+    pCommand: ctypes.c_char_p
+    pCallback: ctypes.c_void_p
+    pUserData: ctypes.c_void_p
+    returns: ctypes.c_uint, raises errors.FlyCapture2Error on failure
+    """
+    return _fc2LaunchCommandAsync(pCommand, pCallback, pUserData)
+
+
+def fc2ErrorToDescription(error):
+    """
+    fc2ErrorToDescription(error)
+
+    error: ctypes.c_uint
+    returns: ctypes.c_char_p
+    """
+    return _fc2ErrorToDescription(error)
+
+
+def load(library=None):
+    """
+    Open library (see raw_types.open_library) and bind the functions to it
+    """
+    lib = raw_types.open_library(library)
+    bind(lib)
+    return lib
+
+
+# share the library raw loaded (if raw was imported first)
+_raw = sys.modules.get(__package__ + '.raw', None)
+if _raw is not None and _raw._lib is not None:
+    bind(_raw._lib)
+elif 'FLYCAPTURE2_LIBRARY' in os.environ:
+    load()
+else:
+    try:
+        load()
+    except OSError:
+        # no sdk, functions raise until a library is loaded with load
+        pass
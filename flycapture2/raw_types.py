@@ -0,0 +1,993 @@
+#!/usr/bin/env python
+"""
+The ctypes types, enums and structures of libflycapture-c and finding
+the library, without any functions (see raw)
+
+Importing this is cheap: it does not load the library or create any
+raw.Function, so bindings that only need the types (see raw_static) can
+use it without importing raw.
+"""
+import ctypes
+import os
+
+
+# when lazy, enum reverse maps are built on first use (see raw.lazy)
+lazy = os.environ.get('FLYCAPTURE2_LAZY', '1') != '0'
+
+
+class Enum(dict):
+    def __init__(self, name, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.name = name
+        if not lazy:
+            self.reverse
+
+    @property
+    def reverse(self):
+        try:
+            return self._reverse
+        except AttributeError:
+            self._reverse = dict([(self[n], n) for n in self])
+        return self._reverse
+
+    def name_to_value(self, name):
+        return dict.__getitem__(self, name)
+
+    def value_to_name(self, value):
+        return self.reverse[value]
+
+    def __getitem__(self, k):
+        if isinstance(k, str):
+            return self.name_to_value(k)
+        elif isinstance(k, int):
+            return self.value_to_name(k)
+        else:
+            raise ValueError(
+                "Invalid enum key {}, must be str, unicode or int: {}".format(
+                    k, type(k)))
+
+
+# paths tried (in order) when loading the library, see open_library
+library_paths = [
+    '/usr/lib/libflycapture-c.so',
+    'libflycapture-c.so',
+]
+
+
+def open_library(library=None):
+    """
+    Open (but do not bind any functions to) a library
+
+    library can be a path to libflycapture-c, 'sim' for the simulated
+    backend (see flycapture2.sim) or an already loaded library.
+    If None, the FLYCAPTURE2_LIBRARY environment variable is used if
+    set, otherwise each of library_paths is tried.
+    """
+    if library is None:
+        library = os.environ.get('FLYCAPTURE2_LIBRARY', None)
+    if library is None:
+        for path in library_paths:
+            try:
+                return ctypes.cdll.LoadLibrary(path)
+            except OSError:
+                pass
+        raise OSError(
+            "Failed to load libflycapture-c from: {}".format(library_paths))
+    if library == 'sim':
+        # the simulator has state, share the one raw loaded (if any)
+        from . import raw
+        from . import sim
+        if isinstance(raw._lib, sim.Library):
+            return raw._lib
+        return sim.Library.from_environ()
+    if isinstance(library, str):
+        return ctypes.cdll.LoadLibrary(library)
+    return library
+
+
+BOOL = ctypes.c_int
+fc2Context = ctypes.c_void_p
+fc2GuiContext = ctypes.c_void_p
+fc2ImageImpl = ctypes.c_void_p
+fc2ImageStatisticsContext = ctypes.c_void_p
+fc2TopologyNodeContext = ctypes.c_void_p
+class fc2PGRGuid(ctypes.Structure):
+    _fields_ = [
+        ('value', ctypes.c_uint * 4),
+    ]
+
+
+fc2Error = Enum('fc2Error', [
+    ('FC2_ERROR_READ_REGISTER_FAILED', 28),
+    ('FC2_ERROR_UNDEFINED', -1),
+    ('FC2_ERROR_INVALID_PACKET_SIZE', 14),
+    ('FC2_ERROR_REGISTER_FAILED', 27),
+    ('FC2_ERROR_TRIGGER_FAILED', 24),
+    ('FC2_ERROR_INIT_FAILED', 5),
+    ('FC2_ERROR_IMAGE_CONVERSION_FAILED', 38),
+    ('FC2_ERROR_NOT_IN_FORMAT7', 16),
+    ('FC2_ERROR_NOT_SUPPORTED', 17),
+    ('FC2_ERROR_INVALID_BUS_MANAGER', 9),
+    ('FC2_ERROR_TIMEOUT', 18),
+    ('FC2_ERROR_ISOCH_SYNC_FAILED', 36),
+    ('FC2_ERROR_FAILED_GUID', 13),
+    ('FC2_ERROR_ISOCH_START_FAILED', 33),
+    ('FC2_ERROR_PROPERTY_NOT_PRESENT', 26),
+    ('FC2_ERROR_INVALID_GENERATION', 20),
+    ('FC2_ERROR_IIDC_FAILED', 22),
+    ('FC2_ERROR_INVALID_SETTINGS', 8),
+    ('FC2_ERROR_STROBE_FAILED', 23),
+    ('FC2_ERROR_ISOCH_RETRIEVE_BUFFER_FAILED', 34),
+    ('FC2_ERROR_IMAGE_CONSISTENCY_ERROR', 41),
+    ('FC2_ERROR_BUS_MASTER_FAILED', 19),
+    ('FC2_ERROR_FAILED', 1),
+    ('FC2_ERROR_NOT_CONNECTED', 4),
+    ('FC2_ERROR_IMAGE_LIBRARY_FAILURE', 39),
+    ('FC2_ERROR_WRITE_REGISTER_FAILED', 29),
+    ('FC2_ERROR_ISOCH_NOT_STARTED', 32),
+    ('FC2_ERROR_ISOCH_STOP_FAILED', 35),
+    ('FC2_ERROR_FORCE_32BITS', 2147483647),
+    ('FC2_ERROR_NOT_INTITIALIZED', 6),
+    ('FC2_ERROR_NOT_FOUND', 12),
+    ('FC2_ERROR_FAILED_BUS_MASTER_CONNECTION', 3),
+    ('FC2_ERROR_LOW_LEVEL_FAILURE', 11),
+    ('FC2_ERROR_ISOCH_ALREADY_STARTED', 31),
+    ('FC2_ERROR_INVALID_MODE', 15),
+    ('FC2_ERROR_INVALID_PARAMETER', 7),
+    ('FC2_ERROR_LUT_FAILED', 21),
+    ('FC2_ERROR_BUFFER_TOO_SMALL', 40),
+    ('FC2_ERROR_PROPERTY_FAILED', 25),
+    ('FC2_ERROR_ISOCH_FAILED', 30),
+    ('FC2_ERROR_INCOMPATIBLE_DRIVER', 42),
+    ('FC2_ERROR_ISOCH_BANDWIDTH_EXCEEDED', 37),
+    ('FC2_ERROR_NOT_IMPLEMENTED', 2),
+    ('FC2_ERROR_OK', 0),
+    ('FC2_ERROR_MEMORY_ALLOCATION_FAILED', 10),
+])
+
+
+fc2BusCallbackType = Enum('fc2BusCallbackType', [
+    ('FC2_ARRIVAL', 1),
+    ('FC2_CALLBACK_TYPE_FORCE_32BITS', 2147483647),
+    ('FC2_REMOVAL', 2),
+    ('FC2_BUS_RESET', 0),
+])
+
+
+fc2GrabMode = Enum('fc2GrabMode', [
+    ('FC2_BUFFER_FRAMES', 1),
+    ('FC2_UNSPECIFIED_GRAB_MODE', 2),
+    ('FC2_GRAB_MODE_FORCE_32BITS', 2147483647),
+    ('FC2_DROP_FRAMES', 0),
+])
+
+
+fc2GrabTimeout = Enum('fc2GrabTimeout', [
+    ('FC2_TIMEOUT_UNSPECIFIED', -2),
+    ('FC2_TIMEOUT_INFINITE', -1),
+    ('FC2_TIMEOUT_NONE', 0),
+    ('FC2_GRAB_TIMEOUT_FORCE_32BITS', 2147483647),
+])
+
+
+fc2BandwidthAllocation = Enum('fc2BandwidthAllocation', [
+    ('FC2_BANDWIDTH_ALLOCATION_UNSUPPORTED', 2),
+    ('FC2_BANDWIDTH_ALLOCATION_UNSPECIFIED', 3),
+    ('FC2_BANDWIDTH_ALLOCATION_FORCE_32BITS', 2147483647),
+    ('FC2_BANDWIDTH_ALLOCATION_OFF', 0),
+    ('FC2_BANDWIDTH_ALLOCATION_ON', 1),
+])
+
+
+fc2InterfaceType = Enum('fc2InterfaceType', [
+    ('FC2_INTERFACE_TYPE_FORCE_32BITS', 2147483647),
+    ('FC2_INTERFACE_GIGE', 3),
+    ('FC2_INTERFACE_USB_2', 1),
+    ('FC2_INTERFACE_USB_3', 2),
+    ('FC2_INTERFACE_UNKNOWN', 4),
+    ('FC2_INTERFACE_IEEE1394', 0),
+])
+
+
+fc2PropertyType = Enum('fc2PropertyType', [
+    ('FC2_HUE', 4),
+    ('FC2_SHARPNESS', 2),
+    ('FC2_ZOOM', 9),
+    ('FC2_TRIGGER_MODE', 14),
+    ('FC2_TRIGGER_DELAY', 15),
+    ('FC2_IRIS', 7),
+    ('FC2_WHITE_BALANCE', 3),
+    ('FC2_PROPERTY_TYPE_FORCE_32BITS', 2147483647),
+    ('FC2_SATURATION', 5),
+    ('FC2_GAMMA', 6),
+    ('FC2_UNSPECIFIED_PROPERTY_TYPE', 18),
+    ('FC2_SHUTTER', 12),
+    ('FC2_TEMPERATURE', 17),
+    ('FC2_AUTO_EXPOSURE', 1),
+    ('FC2_FRAME_RATE', 16),
+    ('FC2_PAN', 10),
+    ('FC2_BRIGHTNESS', 0),
+    ('FC2_TILT', 11),
+    ('FC2_FOCUS', 8),
+    ('FC2_GAIN', 13),
+])
+
+
+fc2FrameRate = Enum('fc2FrameRate', [
+    ('FC2_FRAMERATE_7_5', 2),
+    ('FC2_FRAMERATE_60', 5),
+    ('FC2_FRAMERATE_15', 3),
+    ('FC2_FRAMERATE_1_875', 0),
+    ('FC2_NUM_FRAMERATES', 9),
+    ('FC2_FRAMERATE_240', 7),
+    ('FC2_FRAMERATE_30', 4),
+    ('FC2_FRAMERATE_120', 6),
+    ('FC2_FRAMERATE_3_75', 1),
+    ('FC2_FRAMERATE_FORCE_32BITS', 2147483647),
+    ('FC2_FRAMERATE_FORMAT7', 8),
+])
+
+
+fc2VideoMode = Enum('fc2VideoMode', [
+    ('FC2_VIDEOMODE_1280x960YUV422', 15),
+    ('FC2_VIDEOMODE_800x600RGB', 8),
+    ('FC2_NUM_VIDEOMODES', 24),
+    ('FC2_VIDEOMODE_320x240YUV422', 1),
+    ('FC2_VIDEOMODE_800x600YUV422', 7),
+    ('FC2_VIDEOMODE_FORCE_32BITS', 2147483647),
+    ('FC2_VIDEOMODE_FORMAT7', 23),
+    ('FC2_VIDEOMODE_1600x1200Y8', 21),
+    ('FC2_VIDEOMODE_1600x1200RGB', 20),
+    ('FC2_VIDEOMODE_1280x960RGB', 16),
+    ('FC2_VIDEOMODE_1600x1200YUV422', 19),
+    ('FC2_VIDEOMODE_800x600Y16', 10),
+    ('FC2_VIDEOMODE_640x480Y16', 6),
+    ('FC2_VIDEOMODE_640x480YUV411', 2),
+    ('FC2_VIDEOMODE_1024x768RGB', 12),
+    ('FC2_VIDEOMODE_1280x960Y8', 17),
+    ('FC2_VIDEOMODE_1024x768Y8', 13),
+    ('FC2_VIDEOMODE_800x600Y8', 9),
+    ('FC2_VIDEOMODE_1024x768YUV422', 11),
+    ('FC2_VIDEOMODE_160x120YUV444', 0),
+    ('FC2_VIDEOMODE_640x480RGB', 4),
+    ('FC2_VIDEOMODE_1280x960Y16', 18),
+    ('FC2_VIDEOMODE_640x480Y8', 5),
+    ('FC2_VIDEOMODE_640x480YUV422', 3),
+    ('FC2_VIDEOMODE_1024x768Y16', 14),
+    ('FC2_VIDEOMODE_1600x1200Y16', 22),
+])
+
+
+fc2Mode = Enum('fc2Mode', [
+    ('FC2_MODE_25', 25),
+    ('FC2_MODE_24', 24),
+    ('FC2_MODE_27', 27),
+    ('FC2_MODE_26', 26),
+    ('FC2_MODE_21', 21),
+    ('FC2_MODE_20', 20),
+    ('FC2_MODE_23', 23),
+    ('FC2_MODE_22', 22),
+    ('FC2_MODE_29', 29),
+    ('FC2_MODE_28', 28),
+    ('FC2_NUM_MODES', 32),
+    ('FC2_MODE_30', 30),
+    ('FC2_MODE_31', 31),
+    ('FC2_MODE_10', 10),
+    ('FC2_MODE_11', 11),
+    ('FC2_MODE_12', 12),
+    ('FC2_MODE_13', 13),
+    ('FC2_MODE_14', 14),
+    ('FC2_MODE_15', 15),
+    ('FC2_MODE_16', 16),
+    ('FC2_MODE_17', 17),
+    ('FC2_MODE_18', 18),
+    ('FC2_MODE_19', 19),
+    ('FC2_MODE_FORCE_32BITS', 2147483647),
+    ('FC2_MODE_2', 2),
+    ('FC2_MODE_3', 3),
+    ('FC2_MODE_0', 0),
+    ('FC2_MODE_1', 1),
+    ('FC2_MODE_6', 6),
+    ('FC2_MODE_7', 7),
+    ('FC2_MODE_4', 4),
+    ('FC2_MODE_5', 5),
+    ('FC2_MODE_8', 8),
+    ('FC2_MODE_9', 9),
+])
+
+
+fc2PixelFormat = Enum('fc2PixelFormat', [
+    ('FC2_PIXEL_FORMAT_S_RGB16', 8388608),
+    ('FC2_PIXEL_FORMAT_422YUV8_JPEG', 1073741825),
+    ('FC2_PIXEL_FORMAT_RGBU', 1073741826),
+    ('FC2_PIXEL_FORMAT_BGR16', 33554433),
+    ('FC2_PIXEL_FORMAT_444YUV8', 268435456),
+    ('FC2_PIXEL_FORMAT_411YUV8', 1073741824),
+    ('FC2_PIXEL_FORMAT_BGRU16', 33554434),
+    ('FC2_PIXEL_FORMAT_MONO12', 1048576),
+    ('FC2_PIXEL_FORMAT_MONO16', 67108864),
+    ('FC2_PIXEL_FORMAT_422YUV8', 536870912),
+    ('FC2_PIXEL_FORMAT_BGRU', 1073741832),
+    ('FC2_PIXEL_FORMAT_RAW8', 4194304),
+    ('FC2_PIXEL_FORMAT_RGB16', 33554432),
+    ('FC2_PIXEL_FORMAT_RAW12', 524288),
+    ('FC2_PIXEL_FORMAT_RAW16', 2097152),
+    ('FC2_NUM_PIXEL_FORMATS', 20),
+    ('FC2_UNSPECIFIED_PIXEL_FORMAT', 0),
+    ('FC2_PIXEL_FORMAT_S_MONO16', 16777216),
+    ('FC2_PIXEL_FORMAT_MONO8', 2147483648),
+    ('FC2_PIXEL_FORMAT_BGR', 2147483656),
+    ('FC2_PIXEL_FORMAT_RGB8', 134217728),
+    ('FC2_PIXEL_FORMAT_RGB', 134217728),
+])
+
+
+fc2BusSpeed = Enum('fc2BusSpeed', [
+    ('FC2_BUSSPEED_FORCE_32BITS', 2147483647),
+    ('FC2_BUSSPEED_10000BASE_T', 11),
+    ('FC2_BUSSPEED_S480', 3),
+    ('FC2_BUSSPEED_S5000', 7),
+    ('FC2_BUSSPEED_S800', 4),
+    ('FC2_BUSSPEED_S1600', 5),
+    ('FC2_BUSSPEED_100BASE_T', 9),
+    ('FC2_BUSSPEED_S3200', 6),
+    ('FC2_BUSSPEED_S200', 1),
+    ('FC2_BUSSPEED_SPEED_UNKNOWN', -1),
+    ('FC2_BUSSPEED_10BASE_T', 8),
+    ('FC2_BUSSPEED_ANY', 13),
+    ('FC2_BUSSPEED_S100', 0),
+    ('FC2_BUSSPEED_S_FASTEST', 12),
+    ('FC2_BUSSPEED_1000BASE_T', 10),
+    ('FC2_BUSSPEED_S400', 2),
+])
+
+
+fc2PCIeBusSpeed = Enum('fc2PCIeBusSpeed', [
+    ('FC2_PCIE_BUSSPEED_2_5', 0),
+    ('FC2_PCIE_BUSSPEED_FORCE_32BITS', 2147483647),
+    ('FC2_PCIE_BUSSPEED_UNKNOWN', -1),
+    ('FC2_PCIE_BUSSPEED_5_0', 1),
+])
+
+
+fc2DriverType = Enum('fc2DriverType', [
+    ('FC2_DRIVER_USB_NONE', 5),
+    ('FC2_DRIVER_FORCE_32BITS', 2147483647),
+    ('FC2_DRIVER_UNKNOWN', -1),
+    ('FC2_DRIVER_USB_CAM', 6),
+    ('FC2_DRIVER_1394_VIDEO1394', 3),
+    ('FC2_DRIVER_GIGE_NONE', 8),
+    ('FC2_DRIVER_GIGE_LWF', 11),
+    ('FC2_DRIVER_GIGE_PRO', 10),
+    ('FC2_DRIVER_1394_CAM', 0),
+    ('FC2_DRIVER_1394_RAW1394', 4),
+    ('FC2_DRIVER_1394_JUJU', 2),
+    ('FC2_DRIVER_USB3_PRO', 7),
+    ('FC2_DRIVER_GIGE_FILTER', 9),
+    ('FC2_DRIVER_1394_PRO', 1),
+])
+
+
+fc2ColorProcessingAlgorithm = Enum('fc2ColorProcessingAlgorithm', [
+    ('FC2_IPP', 6),
+    ('FC2_EDGE_SENSING', 3),
+    ('FC2_COLOR_PROCESSING_ALGORITHM_FORCE_32BITS', 2147483647),
+    ('FC2_WEIGHTED_DIRECTIONAL', 8),
+    ('FC2_RIGOROUS', 5),
+    ('FC2_NO_COLOR_PROCESSING', 1),
+    ('FC2_DEFAULT', 0),
+    ('FC2_NEAREST_NEIGHBOR_FAST', 2),
+    ('FC2_HQ_LINEAR', 4),
+    ('FC2_DIRECTIONAL', 7),
+])
+
+
+fc2BayerTileFormat = Enum('fc2BayerTileFormat', [
+    ('FC2_BT_GRBG', 2),
+    ('FC2_BT_GBRG', 3),
+    ('FC2_BT_FORCE_32BITS', 2147483647),
+    ('FC2_BT_NONE', 0),
+    ('FC2_BT_RGGB', 1),
+    ('FC2_BT_BGGR', 4),
+])
+
+
+fc2ImageFileFormat = Enum('fc2ImageFileFormat', [
+    ('FC2_FROM_FILE_EXT', -1),
+    ('FC2_PNG', 6),
+    ('FC2_IMAGE_FILE_FORMAT_FORCE_32BITS', 2147483647),
+    ('FC2_RAW', 7),
+    ('FC2_PGM', 0),
+    ('FC2_JPEG2000', 4),
+    ('FC2_PPM', 1),
+    ('FC2_TIFF', 5),
+    ('FC2_BMP', 2),
+    ('FC2_JPEG', 3),
+])
+
+
+fc2GigEPropertyType = Enum('fc2GigEPropertyType', [
+    ('FC2_HEARTBEAT', 0),
+    ('PACKET_SIZE', 2),
+    ('PACKET_DELAY', 3),
+    ('FC2_HEARTBEAT_TIMEOUT', 1),
+])
+
+
+fc2StatisticsChannel = Enum('fc2StatisticsChannel', [
+    ('FC2_STATISTICS_FORCE_32BITS', 2147483647),
+    ('FC2_STATISTICS_RED', 1),
+    ('FC2_STATISTICS_GREEN', 2),
+    ('FC2_STATISTICS_BLUE', 3),
+    ('FC2_STATISTICS_GREY', 0),
+    ('FC2_STATISTICS_LIGHTNESS', 6),
+    ('FC2_STATISTICS_HUE', 4),
+    ('FC2_STATISTICS_SATURATION', 5),
+])
+
+
+fc2OSType = Enum('fc2OSType', [
+    ('FC2_LINUX_X64', 3),
+    ('FC2_UNKNOWN_OS', 5),
+    ('FC2_WINDOWS_X86', 0),
+    ('FC2_MAC', 4),
+    ('FC2_WINDOWS_X64', 1),
+    ('FC2_LINUX_X86', 2),
+    ('FC2_OSTYPE_FORCE_32BITS', 2147483647),
+])
+
+
+fc2ByteOrder = Enum('fc2ByteOrder', [
+    ('FC2_BYTE_ORDER_LITTLE_ENDIAN', 0),
+    ('FC2_BYTE_ORDER_FORCE_32BITS', 2147483647),
+    ('FC2_BYTE_ORDER_BIG_ENDIAN', 1),
+])
+
+
+fc2PortType = Enum('fc2PortType', [
+    ('CONNECTED_TO_CHILD', 3),
+    ('CONNECTED_TO_PARENT', 2),
+    ('NOT_CONNECTED', 1),
+])
+
+
+fc2NodeType = Enum('fc2NodeType', [
+    ('NODE', 3),
+    ('BUS', 1),
+    ('COMPUTER', 0),
+    ('CAMERA', 2),
+])
+
+
+class fc2Image(ctypes.Structure):
+    _fields_ = [
+        ('rows', ctypes.c_uint),
+        ('cols', ctypes.c_uint),
+        ('stride', ctypes.c_uint),
+        ('pData', ctypes.POINTER(ctypes.c_ubyte)),
+        ('dataSize', ctypes.c_uint),
+        ('receivedDataSize', ctypes.c_uint),
+        ('format', ctypes.c_uint),
+        ('bayerFormat', ctypes.c_uint),
+        ('imageImpl', ctypes.c_void_p),
+    ]
+
+
+class fc2SystemInfo(ctypes.Structure):
+    _fields_ = [
+        ('osType', ctypes.c_uint),
+        ('osDescription', ctypes.c_char * 512),
+        ('byteOrder', ctypes.c_uint),
+        ('sysMemSize', ctypes.c_ulong),
+        ('cpuDescription', ctypes.c_char * 512),
+        ('numCpuCores', ctypes.c_ulong),
+        ('driverList', ctypes.c_char * 512),
+        ('libraryList', ctypes.c_char * 512),
+        ('gpuDescription', ctypes.c_char * 512),
+        ('screenWidth', ctypes.c_ulong),
+        ('screenHeight', ctypes.c_ulong),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2Version(ctypes.Structure):
+    _fields_ = [
+        ('major', ctypes.c_uint),
+        ('minor', ctypes.c_uint),
+        ('type', ctypes.c_uint),
+        ('build', ctypes.c_uint),
+    ]
+
+
+class fc2IPAddress(ctypes.Structure):
+    _fields_ = [
+        ('octets', ctypes.c_ubyte * 4),
+    ]
+
+
+class fc2MACAddress(ctypes.Structure):
+    _fields_ = [
+        ('octets', ctypes.c_ubyte * 6),
+    ]
+
+
+class fc2GigEProperty(ctypes.Structure):
+    _fields_ = [
+        ('propType', ctypes.c_uint),
+        ('isReadable', ctypes.c_int),
+        ('isWritable', ctypes.c_int),
+        ('min', ctypes.c_uint),
+        ('max', ctypes.c_uint),
+        ('value', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2GigEStreamChannel(ctypes.Structure):
+    _fields_ = [
+        ('networkInterfaceIndex', ctypes.c_uint),
+        ('hostPort', ctypes.c_uint),
+        ('doNotFragment', ctypes.c_int),
+        ('packetSize', ctypes.c_uint),
+        ('interPacketDelay', ctypes.c_uint),
+        ('destinationIpAddress', fc2IPAddress),
+        ('sourcePort', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2GigEConfig(ctypes.Structure):
+    _fields_ = [
+        ('enablePacketResend', ctypes.c_int),
+        ('registerTimeoutRetries', ctypes.c_uint),
+        ('registerTimeout', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2GigEImageSettingsInfo(ctypes.Structure):
+    _fields_ = [
+        ('maxWidth', ctypes.c_uint),
+        ('maxHeight', ctypes.c_uint),
+        ('offsetHStepSize', ctypes.c_uint),
+        ('offsetVStepSize', ctypes.c_uint),
+        ('imageHStepSize', ctypes.c_uint),
+        ('imageVStepSize', ctypes.c_uint),
+        ('pixelFormatBitField', ctypes.c_uint),
+        ('vendorPixelFormatBitField', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2GigEImageSettings(ctypes.Structure):
+    _fields_ = [
+        ('offsetX', ctypes.c_uint),
+        ('offsetY', ctypes.c_uint),
+        ('width', ctypes.c_uint),
+        ('height', ctypes.c_uint),
+        ('pixelFormat', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2Format7ImageSettings(ctypes.Structure):
+    _fields_ = [
+        ('mode', ctypes.c_uint),
+        ('offsetX', ctypes.c_uint),
+        ('offsetY', ctypes.c_uint),
+        ('width', ctypes.c_uint),
+        ('height', ctypes.c_uint),
+        ('pixelFormat', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2Format7Info(ctypes.Structure):
+    _fields_ = [
+        ('mode', ctypes.c_uint),
+        ('maxWidth', ctypes.c_uint),
+        ('maxHeight', ctypes.c_uint),
+        ('offsetHStepSize', ctypes.c_uint),
+        ('offsetVStepSize', ctypes.c_uint),
+        ('imageHStepSize', ctypes.c_uint),
+        ('imageVStepSize', ctypes.c_uint),
+        ('pixelFormatBitField', ctypes.c_uint),
+        ('vendorPixelFormatBitField', ctypes.c_uint),
+        ('packetSize', ctypes.c_uint),
+        ('minPacketSize', ctypes.c_uint),
+        ('maxPacketSize', ctypes.c_uint),
+        ('percentage', ctypes.c_float),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2Format7PacketInfo(ctypes.Structure):
+    _fields_ = [
+        ('recommendedBytesPerPacket', ctypes.c_uint),
+        ('maxBytesPerPacket', ctypes.c_uint),
+        ('unitBytesPerPacket', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2Config(ctypes.Structure):
+    _fields_ = [
+        ('numBuffers', ctypes.c_uint),
+        ('numImageNotifications', ctypes.c_uint),
+        ('minNumImageNotifications', ctypes.c_uint),
+        ('grabTimeout', ctypes.c_int),
+        ('grabMode', ctypes.c_uint),
+        ('highPerformanceRetrieveBuffer', ctypes.c_int),
+        ('isochBusSpeed', ctypes.c_uint),
+        ('asyncBusSpeed', ctypes.c_uint),
+        ('bandwidthAllocation', ctypes.c_uint),
+        ('registerTimeoutRetries', ctypes.c_uint),
+        ('registerTimeout', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2PropertyInfo(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_uint),
+        ('present', ctypes.c_int),
+        ('autoSupported', ctypes.c_int),
+        ('manualSupported', ctypes.c_int),
+        ('onOffSupported', ctypes.c_int),
+        ('onePushSupported', ctypes.c_int),
+        ('absValSupported', ctypes.c_int),
+        ('readOutSupported', ctypes.c_int),
+        ('min', ctypes.c_uint),
+        ('max', ctypes.c_uint),
+        ('absMin', ctypes.c_float),
+        ('absMax', ctypes.c_float),
+        ('pUnits', ctypes.c_char * 512),
+        ('pUnitAbbr', ctypes.c_char * 512),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2TriggerDelayInfo(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_uint),
+        ('present', ctypes.c_int),
+        ('autoSupported', ctypes.c_int),
+        ('manualSupported', ctypes.c_int),
+        ('onOffSupported', ctypes.c_int),
+        ('onePushSupported', ctypes.c_int),
+        ('absValSupported', ctypes.c_int),
+        ('readOutSupported', ctypes.c_int),
+        ('min', ctypes.c_uint),
+        ('max', ctypes.c_uint),
+        ('absMin', ctypes.c_float),
+        ('absMax', ctypes.c_float),
+        ('pUnits', ctypes.c_char * 512),
+        ('pUnitAbbr', ctypes.c_char * 512),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2Property(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_uint),
+        ('present', ctypes.c_int),
+        ('absControl', ctypes.c_int),
+        ('onePush', ctypes.c_int),
+        ('onOff', ctypes.c_int),
+        ('autoManualMode', ctypes.c_int),
+        ('valueA', ctypes.c_uint),
+        ('valueB', ctypes.c_uint),
+        ('absValue', ctypes.c_float),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2TriggerDelay(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_uint),
+        ('present', ctypes.c_int),
+        ('absControl', ctypes.c_int),
+        ('onePush', ctypes.c_int),
+        ('onOff', ctypes.c_int),
+        ('autoManualMode', ctypes.c_int),
+        ('valueA', ctypes.c_uint),
+        ('valueB', ctypes.c_uint),
+        ('absValue', ctypes.c_float),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2TriggerModeInfo(ctypes.Structure):
+    _fields_ = [
+        ('present', ctypes.c_int),
+        ('readOutSupported', ctypes.c_int),
+        ('onOffSupported', ctypes.c_int),
+        ('polaritySupported', ctypes.c_int),
+        ('valueReadable', ctypes.c_int),
+        ('sourceMask', ctypes.c_uint),
+        ('softwareTriggerSupported', ctypes.c_int),
+        ('modeMask', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2TriggerMode(ctypes.Structure):
+    _fields_ = [
+        ('onOff', ctypes.c_int),
+        ('polarity', ctypes.c_uint),
+        ('source', ctypes.c_uint),
+        ('mode', ctypes.c_uint),
+        ('parameter', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2StrobeInfo(ctypes.Structure):
+    _fields_ = [
+        ('source', ctypes.c_uint),
+        ('present', ctypes.c_int),
+        ('readOutSupported', ctypes.c_int),
+        ('onOffSupported', ctypes.c_int),
+        ('polaritySupported', ctypes.c_int),
+        ('minValue', ctypes.c_float),
+        ('maxValue', ctypes.c_float),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2StrobeControl(ctypes.Structure):
+    _fields_ = [
+        ('source', ctypes.c_uint),
+        ('onOff', ctypes.c_int),
+        ('polarity', ctypes.c_uint),
+        ('delay', ctypes.c_float),
+        ('duration', ctypes.c_float),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2TimeStamp(ctypes.Structure):
+    _fields_ = [
+        ('seconds', ctypes.c_long),
+        ('microSeconds', ctypes.c_uint),
+        ('cycleSeconds', ctypes.c_uint),
+        ('cycleCount', ctypes.c_uint),
+        ('cycleOffset', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2ConfigROM(ctypes.Structure):
+    _fields_ = [
+        ('nodeVendorId', ctypes.c_uint),
+        ('chipIdHi', ctypes.c_uint),
+        ('chipIdLo', ctypes.c_uint),
+        ('unitSpecId', ctypes.c_uint),
+        ('unitSWVer', ctypes.c_uint),
+        ('unitSubSWVer', ctypes.c_uint),
+        ('vendorUniqueInfo_0', ctypes.c_uint),
+        ('vendorUniqueInfo_1', ctypes.c_uint),
+        ('vendorUniqueInfo_2', ctypes.c_uint),
+        ('vendorUniqueInfo_3', ctypes.c_uint),
+        ('pszKeyword', ctypes.c_char * 512),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2CameraInfo(ctypes.Structure):
+    _fields_ = [
+        ('serialNumber', ctypes.c_uint),
+        ('interfaceType', ctypes.c_uint),
+        ('driverType', ctypes.c_uint),
+        ('isColorCamera', ctypes.c_int),
+        ('modelName', ctypes.c_char * 512),
+        ('vendorName', ctypes.c_char * 512),
+        ('sensorInfo', ctypes.c_char * 512),
+        ('sensorResolution', ctypes.c_char * 512),
+        ('driverName', ctypes.c_char * 512),
+        ('firmwareVersion', ctypes.c_char * 512),
+        ('firmwareBuildTime', ctypes.c_char * 512),
+        ('maximumBusSpeed', ctypes.c_uint),
+        ('bayerTileFormat', ctypes.c_uint),
+        ('pcieBusSpeed', ctypes.c_uint),
+        ('nodeNumber', ctypes.c_ushort),
+        ('busNumber', ctypes.c_ushort),
+        ('iidcVer', ctypes.c_uint),
+        ('configROM', fc2ConfigROM),
+        ('gigEMajorVersion', ctypes.c_uint),
+        ('gigEMinorVersion', ctypes.c_uint),
+        ('userDefinedName', ctypes.c_char * 512),
+        ('xmlURL1', ctypes.c_char * 512),
+        ('xmlURL2', ctypes.c_char * 512),
+        ('macAddress', fc2MACAddress),
+        ('ipAddress', fc2IPAddress),
+        ('subnetMask', fc2IPAddress),
+        ('defaultGateway', fc2IPAddress),
+        ('ccpStatus', ctypes.c_uint),
+        ('applicationIPAddress', ctypes.c_uint),
+        ('applicationPort', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2EmbeddedImageInfoProperty(ctypes.Structure):
+    _fields_ = [
+        ('available', ctypes.c_int),
+        ('onOff', ctypes.c_int),
+    ]
+
+
+class fc2EmbeddedImageInfo(ctypes.Structure):
+    _fields_ = [
+        ('timestamp', fc2EmbeddedImageInfoProperty),
+        ('gain', fc2EmbeddedImageInfoProperty),
+        ('shutter', fc2EmbeddedImageInfoProperty),
+        ('brightness', fc2EmbeddedImageInfoProperty),
+        ('exposure', fc2EmbeddedImageInfoProperty),
+        ('whiteBalance', fc2EmbeddedImageInfoProperty),
+        ('frameCounter', fc2EmbeddedImageInfoProperty),
+        ('strobePattern', fc2EmbeddedImageInfoProperty),
+        ('GPIOPinState', fc2EmbeddedImageInfoProperty),
+        ('ROIPosition', fc2EmbeddedImageInfoProperty),
+    ]
+
+
+class fc2ImageMetadata(ctypes.Structure):
+    _fields_ = [
+        ('embeddedTimeStamp', ctypes.c_uint),
+        ('embeddedGain', ctypes.c_uint),
+        ('embeddedShutter', ctypes.c_uint),
+        ('embeddedBrightness', ctypes.c_uint),
+        ('embeddedExposure', ctypes.c_uint),
+        ('embeddedWhiteBalance', ctypes.c_uint),
+        ('embeddedFrameCounter', ctypes.c_uint),
+        ('embeddedStrobePattern', ctypes.c_uint),
+        ('embeddedGPIOPinState', ctypes.c_uint),
+        ('embeddedROIPosition', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 31),
+    ]
+
+
+class fc2LUTData(ctypes.Structure):
+    _fields_ = [
+        ('supported', ctypes.c_int),
+        ('enabled', ctypes.c_int),
+        ('numBanks', ctypes.c_uint),
+        ('numChannels', ctypes.c_uint),
+        ('inputBitDepth', ctypes.c_uint),
+        ('outputBitDepth', ctypes.c_uint),
+        ('numEntries', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 8),
+    ]
+
+
+class fc2CameraStats(ctypes.Structure):
+    _fields_ = [
+        ('imageDropped', ctypes.c_uint),
+        ('imageCorrupt', ctypes.c_uint),
+        ('imageXmitFailed', ctypes.c_uint),
+        ('imageDriverDropped', ctypes.c_uint),
+        ('regReadFailed', ctypes.c_uint),
+        ('regWriteFailed', ctypes.c_uint),
+        ('portErrors', ctypes.c_uint),
+        ('cameraPowerUp', ctypes.c_int),
+        ('cameraVoltages', ctypes.c_float * 8),
+        ('numVoltages', ctypes.c_uint),
+        ('cameraCurrents', ctypes.c_float * 8),
+        ('numCurrents', ctypes.c_uint),
+        ('temperature', ctypes.c_uint),
+        ('timeSinceInitialization', ctypes.c_uint),
+        ('timeSinceBusReset', ctypes.c_uint),
+        ('timeStamp', fc2TimeStamp),
+        ('numResendPacketsRequested', ctypes.c_uint),
+        ('numResendPacketsReceived', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2PNGOption(ctypes.Structure):
+    _fields_ = [
+        ('interlaced', ctypes.c_int),
+        ('compressionLevel', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2PPMOption(ctypes.Structure):
+    _fields_ = [
+        ('binaryFile', ctypes.c_int),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2PGMOption(ctypes.Structure):
+    _fields_ = [
+        ('binaryFile', ctypes.c_int),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+fc2TIFFCompressionMethod = Enum('fc2TIFFCompressionMethod', [
+    ('FC2_TIFF_PACKBITS', 2),
+    ('FC2_TIFF_ADOBE_DEFLATE', 4),
+    ('FC2_TIFF_CCITTFAX4', 6),
+    ('FC2_TIFF_JPEG', 8),
+    ('FC2_TIFF_CCITTFAX3', 5),
+    ('FC2_TIFF_LZW', 7),
+    ('FC2_TIFF_DEFLATE', 3),
+    ('FC2_TIFF_NONE', 1),
+])
+
+
+class fc2TIFFOption(ctypes.Structure):
+    _fields_ = [
+        ('compression', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2JPEGOption(ctypes.Structure):
+    _fields_ = [
+        ('progressive', ctypes.c_int),
+        ('quality', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2JPG2Option(ctypes.Structure):
+    _fields_ = [
+        ('quality', ctypes.c_uint),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+class fc2BMPOption(ctypes.Structure):
+    _fields_ = [
+        ('indexedColor_8bit', ctypes.c_int),
+        ('reserved', ctypes.c_uint * 16),
+    ]
+
+
+fc2CallbackHandle = ctypes.c_void_p
+fc2BusEventCallback = ctypes.CFUNCTYPE(
+    None,
+    ctypes.c_void_p,
+    ctypes.c_uint,
+)
+
+fc2ImageEventCallback = ctypes.CFUNCTYPE(
+    None,
+    ctypes.POINTER(fc2Image),
+    ctypes.c_void_p,
+)
+
+fc2AsyncCommandCallback = ctypes.CFUNCTYPE(
+    None,
+    ctypes.c_uint,
+    ctypes.c_void_p,
+)
+
+fc2CameraEventCallback = ctypes.CFUNCTYPE(
+    None,
+    ctypes.c_void_p,
+)
+
+class fc2EventOptions(ctypes.Structure):
+    _fields_ = [
+        ('EventCallbackFcn', ctypes.POINTER(None)),
+        ('EventName', ctypes.c_char_p),
+        ('EventUserData', ctypes.c_void_p),
+        ('EventUserDataSize', ctypes.c_ulong),
+    ]
+
+
+class fc2EventCallbackData(ctypes.Structure):
+    _fields_ = [
+        ('EventUserData', ctypes.c_void_p),
+        ('EventUserDataSize', ctypes.c_ulong),
+        ('EventName', ctypes.c_char_p),
+        ('EventID', ctypes.c_ulong),
+        ('EventTimestamp', ctypes.c_ulong),
+        ('EventData', ctypes.c_void_p),
+        ('EventDataSize', ctypes.c_ulong),
+    ]
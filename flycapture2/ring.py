@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+A fixed ring of preallocated frames shared by one producer (an
+acquisition thread) and consumers
+
+The producer reserves the slot after the newest frame, writes into it
+(without holding the lock, consumers never read an uncommitted slot) and
+commits it. When the ring is full the producer either drops the oldest
+frame ('drop') or waits for a consumer ('block'). Consumers copy frames
+out while holding the lock so a slot is never overwritten while it is
+being read.
+"""
+
+import threading
+import time
+
+import numpy
+
+
+policies = ('drop', 'block')
+
+
+class FrameRing(object):
+    def __init__(self, n, shape, dtype, policy='drop'):
+        if policy not in policies:
+            raise ValueError(
+                "Invalid policy %s not in %s" % (policy, policies))
+        if n < 2:
+            raise ValueError("A ring needs at least 2 frames not %s" % n)
+        self.n = n
+        self.policy = policy
+        self.frames = numpy.empty((n, ) + tuple(shape), dtype=dtype)
+        self.meta = [None] * n
+        # head: frames committed, tail: oldest frame not yet consumed
+        self.head = 0
+        self.tail = 0
+        self.produced = 0
+        self.consumed = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.closed = False
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        # frames waiting to be consumed
+        with self._cond:
+            return self.head - self.tail
+
+    def counters(self):
+        with self._cond:
+            return {
+                'produced': self.produced,
+                'consumed': self.consumed,
+                'dropped': self.dropped,
+                'skipped': self.skipped,
+                'queued': self.head - self.tail,
+            }
+
+    def close(self):
+        # wake up everyone waiting (reserve returns None, get returns None)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def reserve(self):
+        """
+        Index of the slot the producer should write the next frame to
+        (None if the ring is closed)
+        """
+        with self._cond:
+            while self.head - self.tail >= self.n:
+                if self.closed:
+                    return None
+                if self.policy == 'drop':
+                    self.tail += 1
+                    self.dropped += 1
+                else:
+                    self._cond.wait()
+            if self.closed:
+                return None
+            return self.head % self.n
+
+    def commit(self, meta=None):
+        with self._cond:
+            self.meta[self.head % self.n] = meta
+            self.head += 1
+            self.produced += 1
+            self._cond.notify_all()
+
+    def _wait(self, timeout):
+        # wait (holding the lock) for a frame, False on timeout or close
+        if timeout is not None:
+            end = time.time() + timeout
+        while self.head == self.tail:
+            if self.closed:
+                return False
+            if timeout is None:
+                self._cond.wait()
+            else:
+                remaining = end - time.time()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _take(self, index, out):
+        slot = index % self.n
+        if out is None:
+            out = self.frames[slot].copy()
+        else:
+            numpy.copyto(out, self.frames[slot])
+        return out, self.meta[slot]
+
+    def get(self, timeout=None, out=None):
+        """
+        Copy out (to a new array or out) the oldest frame not yet consumed,
+        waiting up to timeout seconds (None: forever) for one
+
+        Returns (array, meta) or None on timeout (or if closed and empty)
+        """
+        with self._cond:
+            if not self._wait(timeout):
+                return None
+            r = self._take(self.tail, out)
+            self.tail += 1
+            self.consumed += 1
+            self._cond.notify_all()
+            return r
+
+    def latest(self, timeout=None, out=None):
+        """
+        Copy out the newest frame (skipping and discarding older unconsumed
+        frames), waiting up to timeout seconds for one if none are new
+        """
+        with self._cond:
+            if not self._wait(timeout):
+                return None
+            r = self._take(self.head - 1, out)
+            self.skipped += self.head - 1 - self.tail
+            self.tail = self.head
+            self.consumed += 1
+            self._cond.notify_all()
+            return r
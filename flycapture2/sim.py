@@ -0,0 +1,800 @@
+#!/usr/bin/env python
+"""
+Simulated libflycapture-c
+
+Library implements the part of the libflycapture-c api used by this
+package (contexts, camera enumeration, connect, capture, retrieve,
+images, configuration, properties, video mode and format7) on top of
+simulated cameras. This allows using (and benchmarking) everything on
+the python side without the SDK or a camera:
+
+    from flycapture2 import raw, sim
+    raw.load(sim.Library([sim.Camera(width=1280, height=960)]))
+
+or set the environment variable FLYCAPTURE2_LIBRARY=sim (and configure
+the cameras with FLYCAPTURE2_SIM, see Library.from_environ).
+
+Functions are wrapped in ctypes callbacks with the prototype of the
+matching raw.Function so arguments are converted exactly as they are
+for the real library. Functions that are not simulated return
+FC2_ERROR_NOT_IMPLEMENTED.
+"""
+
+import ctypes
+import itertools
+import os
+import threading
+import time
+import traceback
+
+import numpy
+
+from . import consts
+from . import raw
+
+
+# bits per pixel of the pixel formats a simulated camera can produce
+bits_per_pixel = {
+    k: v.bits for (k, v) in consts.pixel_format_info.items()}
+
+
+class SimError(Exception):
+    def __init__(self, name):
+        Exception.__init__(self, name)
+        self.code = raw.fc2Error[name]
+
+
+def resolve_pixel_format(pixel_format):
+    if isinstance(pixel_format, str):
+        if pixel_format not in raw.fc2PixelFormat:
+            pixel_format = 'FC2_PIXEL_FORMAT_%s' % pixel_format.upper()
+        pixel_format = raw.fc2PixelFormat[pixel_format]
+    return pixel_format
+
+
+def resolve_bayer_format(bayer_format):
+    if isinstance(bayer_format, str):
+        if bayer_format not in raw.fc2BayerTileFormat:
+            bayer_format = 'FC2_BT_%s' % bayer_format.upper()
+        bayer_format = raw.fc2BayerTileFormat[bayer_format]
+    return bayer_format
+
+
+def embedded_timestamp(t):
+    # 1394 cycle time: seconds (7 bits), cycle count, cycle offset
+    ts = to_timestamp(t)
+    return (ts.cycleSeconds << 25) | (ts.cycleCount << 12) | ts.cycleOffset
+
+
+def to_timestamp(t, ts=None):
+    if ts is None:
+        ts = raw.fc2TimeStamp()
+    ts.seconds = int(t)
+    ts.microSeconds = int((t % 1) * 1E6)
+    ts.cycleSeconds = ts.seconds % 128
+    ts.cycleCount = int((t % 1) * 8000)
+    ts.cycleOffset = 0
+    return ts
+
+
+class Camera(object):
+    """
+    A simulated camera
+
+    Frames are produced at frame_rate (frames per second, 0 for as fast
+    as they are retrieved) with a fraction (drop_rate) of frames dropped
+    before reaching the host and fractions of the delivered frames empty
+    (empty_rate, no data received) or incomplete (incomplete_rate, half
+    the data received). Frames contain a ramp that shifts by one
+    byte per frame (with the enabled embedded image info written over
+    the first bytes).
+    """
+    def __init__(
+            self, serial=None, width=640, height=480, pixel_format='MONO8',
+            frame_rate=30., drop_rate=0., bayer_format='NONE', seed=0,
+            model='Simulated Camera', empty_rate=0., incomplete_rate=0.):
+        self.serial = serial
+        self.model = model
+        self.sensor_width = width
+        self.sensor_height = height
+        self.offset_x = 0
+        self.offset_y = 0
+        self.width = width
+        self.height = height
+        self.pixel_format = resolve_pixel_format(pixel_format)
+        self.bayer_format = resolve_bayer_format(bayer_format)
+        self.frame_rate = float(frame_rate)
+        self.drop_rate = drop_rate
+        self.empty_rate = empty_rate
+        self.incomplete_rate = incomplete_rate
+        self.seed = seed
+        self.packet_percent = 100.
+        self.supported_formats = sorted(bits_per_pixel)
+        self.config = raw.fc2Config()
+        self.config.numBuffers = 10
+        self.config.grabMode = raw.fc2GrabMode['FC2_DROP_FRAMES']
+        self.config.grabTimeout = raw.fc2GrabTimeout['FC2_TIMEOUT_INFINITE']
+        self.properties = {}
+        for name in raw.fc2PropertyType:
+            if 'FORCE_32BITS' in name or 'UNSPECIFIED' in name:
+                continue
+            p = raw.fc2Property()
+            p.type = raw.fc2PropertyType[name]
+            p.present = 1
+            p.onOff = 1
+            p.absControl = 1
+            self.properties[p.type] = p
+        self.properties[
+            raw.fc2PropertyType['FC2_FRAME_RATE']].absValue = self.frame_rate
+        self.connected = False
+        self.capturing = False
+        self.start_time = 0.
+        self.next_index = 0
+        self.n_dropped = 0
+        self._pattern = None
+        self._stopped = threading.Event()
+        # (address, size, number) of the buffers set by fc2SetUserBuffers
+        self.user_buffers = None
+        # embedded image info field: on/off
+        self.embedded = {
+            n: False for (n, _) in raw.fc2EmbeddedImageInfo._fields_}
+
+    @property
+    def stride(self):
+        return self.width * bits_per_pixel[self.pixel_format] // 8
+
+    @property
+    def frame_size(self):
+        return self.stride * self.height
+
+    @property
+    def pixel_format_bit_field(self):
+        b = 0
+        for f in self.supported_formats:
+            b |= f
+        return b
+
+    def set_frame_rate(self, frame_rate):
+        if self.capturing and frame_rate > 0:
+            # keep the next frame index at the current time
+            self.start_time = time.time() - self.next_index / frame_rate
+        self.frame_rate = float(frame_rate)
+
+    def start(self, start_time=None):
+        self.capturing = True
+        if start_time is None:
+            start_time = time.time()
+        # like a real camera the frame counter (and so timestamps and
+        # dropped frames) carries on across stop and start, next_index is
+        # the first frame after start_time
+        if self.frame_rate > 0:
+            start_time -= self.next_index / self.frame_rate
+        self.start_time = start_time
+        self._stopped.clear()
+
+    def stop(self):
+        self.capturing = False
+        # abort waits for frames
+        self._stopped.set()
+
+    def _sleep(self, t):
+        if self._stopped.wait(t):
+            raise SimError('FC2_ERROR_ISOCH_NOT_STARTED')
+
+    def _chance(self, index, salt=0):
+        # deterministic pseudo random number in [0, 1) for a frame
+        h = (index * 2654435761) & 0xFFFFFFFF
+        # mix so the numbers for different seeds (cameras) and salts are
+        # independent
+        h = ((h ^ ((self.seed * 3 + salt) * 0x85EBCA6B)) *
+             0xC2B2AE35) & 0xFFFFFFFF
+        h ^= h >> 16
+        return h / 4294967296.
+
+    def is_dropped(self, index):
+        if self.drop_rate <= 0:
+            return False
+        return self._chance(index) < self.drop_rate
+
+    def received_size(self, index):
+        # bytes of frame index that reached the host
+        size = self.frame_size
+        if self.empty_rate > 0 and self._chance(index, 1) < self.empty_rate:
+            return 0
+        if (self.incomplete_rate > 0 and
+                self._chance(index, 2) < self.incomplete_rate):
+            return size // 2
+        return size
+
+    def next_frame(self):
+        """
+        Wait for the next frame (according to the grab mode and timeout)
+        returning it's index and timestamp
+        """
+        index = self.next_index
+        if self.frame_rate > 0:
+            period = 1. / self.frame_rate
+            now = time.time()
+            # frames completed so far
+            n = int((now - self.start_time) / period)
+            if self.config.grabMode == raw.fc2GrabMode['FC2_BUFFER_FRAMES']:
+                index = max(index, n - max(self.config.numBuffers, 1))
+            else:
+                index = max(index, n - 1)
+            while self.is_dropped(index):
+                index += 1
+            t = self.start_time + (index + 1) * period
+            wait = t - now
+            if wait > 0:
+                timeout = self.config.grabTimeout
+                if timeout >= 0 and wait > timeout / 1000.:
+                    self._sleep(timeout / 1000.)
+                    raise SimError('FC2_ERROR_TIMEOUT')
+                self._sleep(wait)
+        else:
+            while self.is_dropped(index):
+                index += 1
+            t = time.time()
+        self.n_dropped += index - self.next_index
+        self.next_index = index + 1
+        return index, t
+
+    def fill(self, address, index):
+        size = self.frame_size
+        if self._pattern is None or len(self._pattern) < size + 256:
+            n = (size + 256) // 256 + 1
+            self._pattern = (ctypes.c_ubyte * (n * 256)).from_buffer_copy(
+                bytes(bytearray(range(256))) * n)
+        ctypes.memmove(
+            address, ctypes.addressof(self._pattern) + index % 256, size)
+
+    def embed(self, address, index, t):
+        """
+        Write the enabled embedded image info fields over the frame at
+        address (as big endian 32 bit words)
+        """
+        def prop(name):
+            return self.properties[raw.fc2PropertyType['FC2_%s' % name]]
+        wb = prop('WHITE_BALANCE')
+        values = {
+            'timestamp': embedded_timestamp(t),
+            'gain': prop('GAIN').valueA,
+            'shutter': prop('SHUTTER').valueA,
+            'brightness': prop('BRIGHTNESS').valueA,
+            'exposure': prop('AUTO_EXPOSURE').valueA,
+            'whiteBalance': ((wb.valueA & 0xFFF) << 12) | (wb.valueB & 0xFFF),
+            'frameCounter': index & 0xFFFFFFFF,
+            'strobePattern': 0,
+            'GPIOPinState': 0,
+            'ROIPosition': (self.offset_x << 16) | self.offset_y,
+        }
+        words = [
+            values[n] for (n, _) in raw.fc2EmbeddedImageInfo._fields_
+            if self.embedded[n]]
+        data = numpy.array(words, dtype='>u4').tobytes()
+        ctypes.memmove(address, data, min(len(data), self.frame_size))
+
+
+class Library(object):
+    """
+    A simulated libflycapture-c for raw.load
+    """
+    def __init__(self, cameras=None):
+        if cameras is None:
+            cameras = [Camera(), ]
+        for (i, camera) in enumerate(cameras):
+            if camera.serial is None:
+                camera.serial = 10000000 + i
+        self.cameras = cameras
+        self.contexts = {}
+        self.images = {}
+        # threads calling image event callbacks by context
+        self.callback_threads = {}
+        self._handles = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environ(cls, key='FLYCAPTURE2_SIM'):
+        """
+        Make a library configured by the environment variable key, a comma
+        separated list of Camera arguments and n_cameras, for example:
+            FLYCAPTURE2_SIM=n_cameras=2,width=1280,height=960,frame_rate=0
+        """
+        kwargs = {}
+        n_cameras = 1
+        for item in os.environ.get(key, '').split(','):
+            if '=' not in item:
+                continue
+            k, v = [s.strip() for s in item.split('=', 1)]
+            for t in (int, float):
+                try:
+                    v = t(v)
+                    break
+                except ValueError:
+                    pass
+            if k == 'n_cameras':
+                n_cameras = v
+            else:
+                kwargs[k] = v
+        return cls([Camera(**kwargs) for _ in range(n_cameras)])
+
+    def __getattr__(self, name):
+        if name[:1] == '_' or name not in raw.Function.registry:
+            raise AttributeError(name)
+        f = self._wrap(name, getattr(self, '_' + name, None))
+        # cache it, this also keeps the callback alive
+        setattr(self, name, f)
+        return f
+
+    def __getitem__(self, name):
+        # like CDLL, a new function each time
+        if name not in raw.Function.registry:
+            raise AttributeError(name)
+        return self._wrap(name, getattr(self, '_' + name, None))
+
+    def _wrap(self, name, handler):
+        if handler is None:
+            def call(*args):
+                return raw.fc2Error['FC2_ERROR_NOT_IMPLEMENTED']
+        else:
+            def call(*args):
+                try:
+                    r = handler(*args)
+                except SimError as e:
+                    return e.code
+                except Exception:
+                    traceback.print_exc()
+                    return raw.fc2Error['FC2_ERROR_FAILED']
+                if r is None:
+                    return raw.fc2Error['FC2_ERROR_OK']
+                return r
+        f = raw.Function.registry[name]
+        if f.restype in (ctypes.c_uint, ctypes.c_int):
+            try:
+                return f.as_ctype()(call)
+            except (TypeError, NotImplementedError):
+                pass
+        # callbacks can only (safely) return integers, these functions
+        # are called with python arguments (see _deref)
+        if handler is None:
+            return call
+
+        def pycall(*args):
+            return handler(*args)
+        return pycall
+
+    # ----- helpers -----
+    def _context(self, context):
+        if context not in self.contexts:
+            raise SimError('FC2_ERROR_INVALID_PARAMETER')
+        return self.contexts[context]
+
+    def _camera(self, context):
+        camera = self._context(context)
+        if camera is None:
+            raise SimError('FC2_ERROR_NOT_CONNECTED')
+        return camera
+
+    def _find_camera(self, serial):
+        for camera in self.cameras:
+            if camera.serial == serial:
+                return camera
+        raise SimError('FC2_ERROR_NOT_FOUND')
+
+    def _deref(self, p):
+        if isinstance(p, ctypes._Pointer):
+            return p.contents
+        if hasattr(p, '_obj'):  # byref
+            return p._obj
+        return p
+
+    # ----- context -----
+    def _fc2CreateContext(self, pContext):
+        handle = next(self._handles)
+        self.contexts[handle] = None
+        pContext[0] = handle
+
+    _fc2CreateGigEContext = _fc2CreateContext
+
+    def _fc2DestroyContext(self, context):
+        camera = self._context(context)
+        if camera is not None:
+            camera.stop()
+            camera.connected = False
+        del self.contexts[context]
+
+    # ----- enumeration -----
+    def _fc2GetNumOfCameras(self, context, pNumCameras):
+        self._context(context)
+        pNumCameras[0] = len(self.cameras)
+
+    _fc2GetNumOfDevices = _fc2GetNumOfCameras
+
+    def _fc2GetCameraFromIndex(self, context, index, pGuid):
+        self._context(context)
+        if index >= len(self.cameras):
+            raise SimError('FC2_ERROR_NOT_FOUND')
+        pGuid.contents.value[0] = self.cameras[index].serial
+
+    def _fc2GetCameraFromSerialNumber(self, context, serialNumber, pGuid):
+        self._context(context)
+        pGuid.contents.value[0] = self._find_camera(serialNumber).serial
+
+    def _fc2GetCameraSerialNumberFromIndex(
+            self, context, index, pSerialNumber):
+        self._context(context)
+        if index >= len(self.cameras):
+            raise SimError('FC2_ERROR_NOT_FOUND')
+        pSerialNumber[0] = self.cameras[index].serial
+
+    # ----- connection -----
+    def _fc2Connect(self, context, guid):
+        if self._context(context) is not None:
+            return
+        camera = self._find_camera(guid.contents.value[0])
+        camera.connected = True
+        self.contexts[context] = camera
+
+    def _fc2Disconnect(self, context):
+        camera = self._context(context)
+        if camera is not None:
+            camera.stop()
+            camera.connected = False
+        self.contexts[context] = None
+
+    def _fc2IsConnected(self, context):
+        return int(self.contexts.get(context, None) is not None)
+
+    def _fc2GetCameraInfo(self, context, pCameraInfo):
+        camera = self._camera(context)
+        info = pCameraInfo.contents
+        info.serialNumber = camera.serial
+        info.isColorCamera = int(
+            camera.bayer_format != raw.fc2BayerTileFormat['FC2_BT_NONE'])
+        info.modelName = camera.model.encode('ascii')
+        info.vendorName = b'flycapture2.sim'
+        info.sensorResolution = '{}x{}'.format(
+            camera.sensor_width, camera.sensor_height).encode('ascii')
+        info.bayerTileFormat = camera.bayer_format
+
+    def _fc2GetConfiguration(self, context, config):
+        config[0] = self._camera(context).config
+
+    def _fc2SetConfiguration(self, context, config):
+        self._camera(context).config = raw.fc2Config.from_buffer_copy(
+            config.contents)
+
+    # ----- capture -----
+    def _fc2StartCapture(self, context):
+        camera = self._camera(context)
+        if camera.capturing:
+            raise SimError('FC2_ERROR_ISOCH_ALREADY_STARTED')
+        camera.start()
+
+    def _fc2StartSyncCapture(self, numCameras, pContexts):
+        cameras = [self._camera(pContexts[i]) for i in range(numCameras)]
+        if any(camera.capturing for camera in cameras):
+            raise SimError('FC2_ERROR_ISOCH_ALREADY_STARTED')
+        # synchronized cameras produce their frames at the same times
+        t = time.time()
+        for camera in cameras:
+            camera.start(t)
+
+    def _fc2StopCapture(self, context):
+        camera = self._camera(context)
+        if not camera.capturing:
+            raise SimError('FC2_ERROR_ISOCH_NOT_STARTED')
+        camera.stop()
+        thread = self.callback_threads.pop(context, None)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _fc2SetUserBuffers(self, context, ppMemBuffers, size, nNumBuffers):
+        camera = self._camera(context)
+        if camera.capturing:
+            raise SimError('FC2_ERROR_ISOCH_ALREADY_STARTED')
+        address = ctypes.cast(ppMemBuffers, ctypes.c_void_p).value
+        if not address or size < 1 or nNumBuffers < 1:
+            raise SimError('FC2_ERROR_INVALID_PARAMETER')
+        camera.user_buffers = (address, size, nNumBuffers)
+
+    def _fc2StartCaptureCallback(self, context, pCallbackFn, pCallbackData):
+        camera = self._camera(context)
+        if camera.capturing:
+            raise SimError('FC2_ERROR_ISOCH_ALREADY_STARTED')
+        if not pCallbackFn:
+            raise SimError('FC2_ERROR_INVALID_PARAMETER')
+        callback = raw.fc2ImageEventCallback(pCallbackFn)
+        camera.start()
+        thread = threading.Thread(
+            target=self._run_callbacks,
+            args=(camera, callback, pCallbackData))
+        thread.daemon = True
+        self.callback_threads[context] = thread
+        thread.start()
+
+    def _run_callbacks(self, camera, callback, data):
+        # the driver thread calling the image event callback
+        im = raw.fc2Image()
+        self._fc2CreateImage(ctypes.pointer(im))
+        try:
+            while camera.capturing:
+                try:
+                    index, t = camera.next_frame()
+                except SimError:
+                    # stopped (or timed out)
+                    continue
+                self._fill_image(im, camera, index, t)
+                callback(ctypes.pointer(im), data)
+        finally:
+            self._fc2DestroyImage(ctypes.pointer(im))
+
+    def _fc2RetrieveBuffer(self, context, pImage):
+        camera = self._camera(context)
+        if not camera.capturing:
+            raise SimError('FC2_ERROR_ISOCH_NOT_STARTED')
+        im = pImage.contents
+        index, t = camera.next_frame()
+        self._fill_image(im, camera, index, t)
+
+    def _fill_image(self, im, camera, index, t):
+        size = camera.frame_size
+        if camera.user_buffers is None:
+            info = self._image_buffer(im, size)
+            address = ctypes.addressof(info['buffer'])
+        else:
+            # frames go (round robin) to the buffers set with
+            # fc2SetUserBuffers and the image points to them
+            base, buffer_size, n = camera.user_buffers
+            if buffer_size < size:
+                raise SimError('FC2_ERROR_BUFFER_TOO_SMALL')
+            info = self.images.get(im.imageImpl, None)
+            if info is None:
+                raise SimError('FC2_ERROR_NOT_INTITIALIZED')
+            address = base + (index % n) * buffer_size
+        im.pData = ctypes.cast(address, ctypes.POINTER(ctypes.c_ubyte))
+        camera.fill(address, index)
+        camera.embed(address, index, t)
+        im.rows = camera.height
+        im.cols = camera.width
+        im.stride = camera.stride
+        im.dataSize = size
+        im.receivedDataSize = camera.received_size(index)
+        im.format = camera.pixel_format
+        im.bayerFormat = camera.bayer_format
+        info['timestamp'] = t
+        info['frame_counter'] = index
+
+    def _image_buffer(self, im, size):
+        # image info with a buffer of at least size bytes
+        info = self.images.get(im.imageImpl, None)
+        if info is None:
+            raise SimError('FC2_ERROR_NOT_INTITIALIZED')
+        if info['buffer'] is None or len(info['buffer']) < size:
+            info['buffer'] = (ctypes.c_ubyte * size)()
+            im.pData = ctypes.cast(
+                info['buffer'], ctypes.POINTER(ctypes.c_ubyte))
+        return info
+
+    # ----- images -----
+    def _fc2CreateImage(self, pImage):
+        im = pImage.contents
+        with self._lock:
+            impl = next(self._handles)
+            self.images[impl] = {
+                'buffer': None, 'timestamp': 0., 'frame_counter': 0}
+        ctypes.memset(ctypes.addressof(im), 0, ctypes.sizeof(im))
+        im.imageImpl = impl
+
+    def _fc2DestroyImage(self, image):
+        im = image.contents
+        if self.images.pop(im.imageImpl, None) is None:
+            raise SimError('FC2_ERROR_INVALID_PARAMETER')
+        im.pData = None
+        im.imageImpl = None
+
+    def _fc2ConvertImageTo(self, format, pImageIn, pImageOut):
+        # only from single channel formats, colour outputs are grey
+        src = pImageIn.contents
+        dst = pImageOut.contents
+        src_info = self.images.get(src.imageImpl, None)
+        if src_info is None or not src.pData:
+            raise SimError('FC2_ERROR_NOT_INTITIALIZED')
+        i = consts.pixel_format_info.get(src.format, None)
+        o = consts.pixel_format_info.get(format, None)
+        if (
+                i is None or o is None or i.channels != 1 or
+                o.channels is None):
+            raise SimError('FC2_ERROR_IMAGE_CONVERSION_FAILED')
+        a = numpy.ndarray(
+            (src.rows, src.cols), i.typestr,
+            numpy.ctypeslib.as_array(src.pData, (src.dataSize, )),
+            strides=(src.stride, numpy.dtype(i.typestr).itemsize))
+        a = a.astype('u4')
+        shift = (
+            numpy.dtype(o.typestr).itemsize -
+            numpy.dtype(i.typestr).itemsize) * 8
+        if shift > 0:
+            a <<= shift
+        elif shift < 0:
+            a >>= -shift
+        stride = src.cols * o.bits // 8
+        size = stride * src.rows
+        info = self._image_buffer(dst, size)
+        b = numpy.ndarray(
+            (src.rows, src.cols, o.channels), o.typestr, info['buffer'])
+        b[...] = a[:, :, numpy.newaxis]
+        if o.channels == 4:
+            b[:, :, 3] = numpy.iinfo(b.dtype).max
+        dst.rows = src.rows
+        dst.cols = src.cols
+        dst.stride = stride
+        dst.dataSize = size
+        dst.receivedDataSize = size
+        dst.format = format
+        dst.bayerFormat = src.bayerFormat if o.channels == 1 else 0
+        info['timestamp'] = src_info['timestamp']
+        info['frame_counter'] = src_info['frame_counter']
+
+    def _fc2GetImageTimeStamp(self, pImage):
+        # called with python arguments
+        im = self._deref(pImage)
+        info = self.images.get(im.imageImpl, None)
+        if info is None:
+            return raw.fc2TimeStamp()
+        return to_timestamp(info['timestamp'])
+
+    def _fc2GetImageMetadata(self, pImage, pImageMetaData):
+        info = self.images.get(pImage.contents.imageImpl, None)
+        if info is None:
+            raise SimError('FC2_ERROR_NOT_INTITIALIZED')
+        md = pImageMetaData.contents
+        ctypes.memset(ctypes.addressof(md), 0, ctypes.sizeof(md))
+        md.embeddedTimeStamp = embedded_timestamp(info['timestamp'])
+        md.embeddedFrameCounter = info['frame_counter'] & 0xFFFFFFFF
+
+    def _fc2ErrorToDescription(self, error):
+        # called with python arguments
+        return raw.fc2Error[int(error)].encode('ascii')
+
+    # ----- embedded image info -----
+    def _fc2GetEmbeddedImageInfo(self, context, pInfo):
+        camera = self._camera(context)
+        info = pInfo.contents
+        for n in camera.embedded:
+            p = getattr(info, n)
+            p.available = 1
+            p.onOff = int(camera.embedded[n])
+
+    def _fc2SetEmbeddedImageInfo(self, context, pInfo):
+        camera = self._camera(context)
+        info = pInfo.contents
+        for n in camera.embedded:
+            camera.embedded[n] = bool(getattr(info, n).onOff)
+
+    # ----- properties -----
+    def _fc2GetPropertyInfo(self, context, propInfo):
+        camera = self._camera(context)
+        info = propInfo.contents
+        if info.type not in camera.properties:
+            raise SimError('FC2_ERROR_PROPERTY_NOT_PRESENT')
+        info.present = 1
+        info.manualSupported = 1
+        info.onOffSupported = 1
+        info.absValSupported = 1
+        info.readOutSupported = 1
+        info.min = 0
+        info.max = 4095
+        info.absMin = 0.
+        info.absMax = 1000.
+
+    def _fc2GetProperty(self, context, prop):
+        camera = self._camera(context)
+        t = prop.contents.type
+        if t not in camera.properties:
+            raise SimError('FC2_ERROR_PROPERTY_NOT_PRESENT')
+        prop[0] = camera.properties[t]
+
+    def _fc2SetProperty(self, context, prop):
+        camera = self._camera(context)
+        p = raw.fc2Property.from_buffer_copy(prop.contents)
+        if p.type not in camera.properties:
+            raise SimError('FC2_ERROR_PROPERTY_NOT_PRESENT')
+        camera.properties[p.type] = p
+        if p.type == raw.fc2PropertyType['FC2_FRAME_RATE']:
+            camera.set_frame_rate(p.absValue)
+
+    # ----- video mode -----
+    def _fc2GetVideoModeAndFrameRateInfo(
+            self, context, videoMode, frameRate, pSupported):
+        self._camera(context)
+        pSupported[0] = int(
+            videoMode == raw.fc2VideoMode['FC2_VIDEOMODE_FORMAT7'] and
+            frameRate == raw.fc2FrameRate['FC2_FRAMERATE_FORMAT7'])
+
+    def _fc2GetVideoModeAndFrameRate(self, context, videoMode, frameRate):
+        self._camera(context)
+        videoMode[0] = raw.fc2VideoMode['FC2_VIDEOMODE_FORMAT7']
+        frameRate[0] = raw.fc2FrameRate['FC2_FRAMERATE_FORMAT7']
+
+    def _fc2SetVideoModeAndFrameRate(self, context, videoMode, frameRate):
+        self._camera(context)
+        if (videoMode != raw.fc2VideoMode['FC2_VIDEOMODE_FORMAT7'] or
+                frameRate != raw.fc2FrameRate['FC2_FRAMERATE_FORMAT7']):
+            raise SimError('FC2_ERROR_INVALID_MODE')
+
+    # ----- format 7 -----
+    def _fc2GetFormat7Info(self, context, info, pSupported):
+        camera = self._camera(context)
+        i = info.contents
+        if i.mode != raw.fc2Mode['FC2_MODE_0']:
+            pSupported[0] = 0
+            return
+        i.maxWidth = camera.sensor_width
+        i.maxHeight = camera.sensor_height
+        i.offsetHStepSize = 2
+        i.offsetVStepSize = 2
+        i.imageHStepSize = 8
+        i.imageVStepSize = 2
+        i.pixelFormatBitField = camera.pixel_format_bit_field
+        i.packetSize = 8192
+        i.minPacketSize = 4
+        i.maxPacketSize = 8192
+        i.percentage = camera.packet_percent
+        pSupported[0] = 1
+
+    def _validate_format7(self, camera, s):
+        return (
+            s.mode == raw.fc2Mode['FC2_MODE_0'] and
+            s.width > 0 and s.height > 0 and
+            s.offsetX % 2 == 0 and s.offsetY % 2 == 0 and
+            s.width % 8 == 0 and s.height % 2 == 0 and
+            s.offsetX + s.width <= camera.sensor_width and
+            s.offsetY + s.height <= camera.sensor_height and
+            s.pixelFormat in camera.supported_formats)
+
+    def _fc2ValidateFormat7Settings(
+            self, context, imageSettings, settingsAreValid, packetInfo):
+        camera = self._camera(context)
+        settingsAreValid[0] = int(
+            self._validate_format7(camera, imageSettings.contents))
+        p = packetInfo.contents
+        p.recommendedBytesPerPacket = 8192
+        p.maxBytesPerPacket = 8192
+        p.unitBytesPerPacket = 4
+
+    def _fc2GetFormat7Configuration(
+            self, context, imageSettings, packetSize, percentage):
+        camera = self._camera(context)
+        s = imageSettings.contents
+        s.mode = raw.fc2Mode['FC2_MODE_0']
+        s.offsetX = camera.offset_x
+        s.offsetY = camera.offset_y
+        s.width = camera.width
+        s.height = camera.height
+        s.pixelFormat = camera.pixel_format
+        packetSize[0] = int(8192 * camera.packet_percent / 100.)
+        percentage[0] = camera.packet_percent
+
+    def _set_format7(self, camera, s):
+        if camera.capturing:
+            raise SimError('FC2_ERROR_ISOCH_ALREADY_STARTED')
+        if not self._validate_format7(camera, s):
+            raise SimError('FC2_ERROR_INVALID_SETTINGS')
+        camera.offset_x = s.offsetX
+        camera.offset_y = s.offsetY
+        camera.width = s.width
+        camera.height = s.height
+        camera.pixel_format = s.pixelFormat
+
+    def _fc2SetFormat7Configuration(
+            self, context, imageSettings, percentSpeed):
+        camera = self._camera(context)
+        self._set_format7(camera, imageSettings.contents)
+        camera.packet_percent = percentSpeed
+
+    def _fc2SetFormat7ConfigurationPacket(
+            self, context, imageSettings, packetSize):
+        camera = self._camera(context)
+        self._set_format7(camera, imageSettings.contents)
+        camera.packet_percent = packetSize * 100. / 8192
@@ -1,45 +1,279 @@
 #!/usr/bin/env python
 
 import atexit
+import collections
+import ctypes
+import threading
 
-from . import errors
+import numpy
+
+from . import buffers
+from . import consts
 from . import raw
 
 
 class FCImage(object):
-    instances = []
+    """
+    Create, recycle and destroy fc2Images
+
+    Released images are kept in a pool (up to max_free images, the oldest
+    are destroyed beyond that) and handed out again by acquire, preferring
+    images with a matching key (rows, columns and pixel format, see key)
+    so the SDK does not need to reallocate the image data.
+    """
+    # live (created and not yet destroyed) images by id
+    instances = {}
+    # pooled images by id, oldest first
+    free = collections.OrderedDict()
+    max_free = 8
+    hits = 0
+    misses = 0
+    evictions = 0
+    peak = 0
+    lock = threading.RLock()
 
     @classmethod
     def get(cls, index=None):
         if index is None:
-            index = len(cls.instances) + 1
-        if index > len(cls.instances):
-            return cls.new()
-        return cls.instances[index]
+            return cls.acquire()
+        return list(cls.instances.values())[index]
 
     @classmethod
     def new(cls):
         im = raw.fc2Image()
-        errors.check_return(raw.fc2CreateImage, im)
-        cls.instances.append(im)
+        raw.fc2CreateImage(im)
+        with cls.lock:
+            cls.instances[id(im)] = im
+            cls.peak = max(cls.peak, len(cls.instances))
         return im
 
+    @staticmethod
+    def key(im):
+        return (im.rows, im.cols, im.format)
+
+    @classmethod
+    def acquire(cls, key=None):
+        """
+        Get an image from the pool (one matching key if possible) or
+        create a new one if the pool is empty
+        """
+        with cls.lock:
+            if cls.free:
+                found = None
+                if key is not None:
+                    for i in reversed(cls.free):
+                        if cls.key(cls.free[i]) == key:
+                            found = i
+                            break
+                if found is None:
+                    found = next(reversed(cls.free))
+                cls.hits += 1
+                return cls.free.pop(found)
+            cls.misses += 1
+        return cls.new()
+
+    @classmethod
+    def release(cls, im):
+        """
+        Return an image to the pool, destroying the oldest pooled
+        image if the pool holds more than max_free images
+        """
+        with cls.lock:
+            if id(im) not in cls.instances or id(im) in cls.free:
+                return
+            cls.free[id(im)] = im
+            if len(cls.free) <= cls.max_free:
+                return
+            _, im = cls.free.popitem(last=False)
+            cls.evictions += 1
+        cls.destroy(im)
+
     @classmethod
     def destroy(cls, im):
-        if im in cls.instances:
-            errors.check_return(raw.fc2DestroyImage, im)
-            cls.instances.remove(im)
+        with cls.lock:
+            if cls.instances.pop(id(im), None) is None:
+                return
+            cls.free.pop(id(im), None)
+        raw.fc2DestroyImage(im)
 
     @classmethod
     def destroy_all(cls):
-        for instance in cls.instances:
-            errors.check_return(raw.fc2DestroyImage, instance)
-        cls.instances = []
+        with cls.lock:
+            instances = list(cls.instances.values())
+            cls.instances = {}
+            cls.free = collections.OrderedDict()
+        for instance in instances:
+            raw.fc2DestroyImage(instance)
+
+    @classmethod
+    def stats(cls):
+        with cls.lock:
+            return {
+                'hits': cls.hits,
+                'misses': cls.misses,
+                'evictions': cls.evictions,
+                'live': len(cls.instances),
+                'free': len(cls.free),
+                'peak': cls.peak,
+            }
 
 
 atexit.register(FCImage.destroy_all)
 
 
+class ImageView(object):
+    """
+    Expose the data of an fc2Image with the array interface
+
+    numpy arrays made from this (numpy.asarray) view the image data
+    without copying and keep this (and so the image) alive. If release,
+    the image is returned to the pool (see FCImage.release) when the
+    last array is garbage collected. Images retrieved into user buffers
+    (see buffers.UserBuffers) point into memory the buffers own, the
+    view keeps those buffers alive.
+    """
+    def __init__(self, im, shape, typestr='|u1', strides=None, release=True):
+        self.image = im
+        self.release = release
+        address = ctypes.cast(im.pData, ctypes.c_void_p).value
+        self.owner = None
+        if address is not None:
+            self.owner = buffers.UserBuffers.owner(address)
+        if self.owner is not None:
+            self.owner.views += 1
+        self.__array_interface__ = {
+            'shape': tuple(shape),
+            'typestr': typestr,
+            'strides': strides,
+            'data': (address, False),
+            'version': 3,
+        }
+
+    def __del__(self):
+        if self.owner is not None:
+            self.owner.views -= 1
+        if self.release:
+            FCImage.release(self.image)
+
+
+class FrameMeta(object):
+    """
+    Metadata of a frame
+
+    rows, cols, stride, dataSize, receivedDataSize, format and bayerFormat
+    are copied from the fc2Image, timestamp (seconds, from
+    fc2GetImageTimeStamp) and frameCounter (from fc2GetImageMetadata, only
+    meaningful if the camera embeds the frame counter) from the image as
+    retrieved (before any conversion).
+
+    For compatibility with the dicts returned before, items can also be
+    looked up by key (meta['rows'], keys, items, get) and format and
+    bayerFormat are then returned as names.
+    """
+    __slots__ = (
+        'rows', 'cols', 'stride', 'dataSize', 'receivedDataSize', 'format',
+        'bayerFormat', 'timestamp', 'frameCounter')
+    dtype = numpy.dtype([
+        ('rows', 'u4'), ('cols', 'u4'), ('stride', 'u4'), ('dataSize', 'u4'),
+        ('receivedDataSize', 'u4'), ('format', 'u4'), ('bayerFormat', 'u4'),
+        ('timestamp', 'f8'), ('frameCounter', 'u4')])
+    _names = {
+        'format': consts.pixel_formats,
+        'bayerFormat': consts.bayer_tile_formats,
+    }
+
+    def __init__(self, im=None, retrieved=None):
+        if im is None:
+            for k in self.__slots__:
+                setattr(self, k, 0)
+            return
+        if retrieved is None:
+            retrieved = im
+        self.rows = im.rows
+        self.cols = im.cols
+        self.stride = im.stride
+        self.dataSize = im.dataSize
+        self.receivedDataSize = im.receivedDataSize
+        self.format = im.format
+        self.bayerFormat = im.bayerFormat
+        ts = raw.fc2GetImageTimeStamp(retrieved)
+        self.timestamp = ts.seconds + ts.microSeconds * 1E-6
+        md = raw.fc2ImageMetadata()
+        raw.fc2GetImageMetadata(retrieved, md)
+        self.frameCounter = md.embeddedFrameCounter
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        v = getattr(self, key)
+        if key in self._names:
+            return self._names[key].get(v, v)
+        return v
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return 'FrameMeta(%s)' % ', '.join(
+            '%s=%r' % (k, getattr(self, k)) for k in self.__slots__)
+
+    def get(self, key, default=None):
+        if key not in self.__slots__:
+            return default
+        return self[key]
+
+    def keys(self):
+        return list(self.__slots__)
+
+    def items(self):
+        return [(k, self[k]) for k in self.__slots__]
+
+    def as_dict(self):
+        return dict(self.items())
+
+    def as_record(self):
+        return tuple(getattr(self, k) for k in self.__slots__)
+
+
+class FrameMetaLog(object):
+    """
+    Collect FrameMeta into a (growing) numpy structured array
+
+    log = FrameMetaLog()
+    ...
+    log.append(meta)
+    ...
+    log.array['timestamp']
+    """
+    def __init__(self, size=1024):
+        self._data = numpy.zeros(max(int(size), 1), dtype=FrameMeta.dtype)
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def append(self, meta):
+        if self.n == len(self._data):
+            data = numpy.zeros(len(self._data) * 2, dtype=FrameMeta.dtype)
+            data[:self.n] = self._data
+            self._data = data
+        self._data[self.n] = meta.as_record()
+        self.n += 1
+
+    def clear(self):
+        self.n = 0
+
+    @property
+    def array(self):
+        return self._data[:self.n]
+
+
 class WrappedStruct(object):
     def __init__(self, struct_type, struct=None):
         self._struct_type = struct_type
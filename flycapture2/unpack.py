@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Unpack (and pack) 12 bit pixels (FC2_PIXEL_FORMAT_MONO12 and RAW12)
+
+Packed frames (as returned by image_to_array, rows of bytes) store two
+pixels in three bytes:
+    byte 0: pixel 0 bits 11-4
+    byte 1: pixel 1 bits 3-0 (high nibble), pixel 0 bits 3-0 (low nibble)
+    byte 2: pixel 1 bits 11-4
+
+    a, meta = camera.grab()  # MONO12 or RAW12
+    image = unpack.unpack12(a)
+
+Any leading dimensions (a batch of frames) are kept and the last
+dimension (bytes of a row) becomes pixels.
+"""
+
+import numpy
+
+from . import oo
+
+
+def unpacked_shape(shape):
+    """
+    Shape of the uint16 array unpacked from packed 12 bit data of shape
+    """
+    if len(shape) == 0 or shape[-1] % 3:
+        raise ValueError(
+            "Packed 12 bit rows must be a multiple of 3 bytes not {}".format(
+                shape))
+    return tuple(shape[:-1]) + (shape[-1] // 3 * 2, )
+
+
+def unpack12(packed, out=None, left_align=False):
+    """
+    Unpack 12 bit pixels from packed (uint8, last dimension is the bytes
+    of a row) to a uint16 array (or out)
+
+    Values are 0-4095 or, if left_align, 0-65520 (shifted by 4 like
+    fc2ConvertImageTo to MONO16)
+    """
+    packed = numpy.asarray(packed)
+    if packed.dtype != numpy.uint8:
+        raise ValueError(
+            "packed must be uint8 not {}".format(packed.dtype))
+    shape = unpacked_shape(packed.shape)
+    if out is None:
+        out = numpy.empty(shape, dtype=numpy.uint16)
+    else:
+        oo.check_out(out, shape, numpy.uint16)
+    b0 = packed[..., 0::3]
+    b1 = packed[..., 1::3]
+    b2 = packed[..., 2::3]
+    even = out[..., 0::2]
+    odd = out[..., 1::2]
+    shift = 8 if left_align else 4
+    numpy.left_shift(b0, shift, out=even, dtype=numpy.uint16)
+    numpy.left_shift(b2, shift, out=odd, dtype=numpy.uint16)
+    low = numpy.bitwise_and(b1, 0x0F)
+    high = numpy.right_shift(b1, 4)
+    if left_align:
+        numpy.left_shift(low, 4, out=low)
+        numpy.left_shift(high, 4, out=high)
+    numpy.bitwise_or(even, low, out=even)
+    numpy.bitwise_or(odd, high, out=odd)
+    return out
+
+
+def pack12(values, out=None):
+    """
+    Pack 12 bit values (uint16 0-4095, last dimension is the pixels of a
+    row) to a uint8 array (or out), the inverse of unpack12
+    """
+    values = numpy.asarray(values)
+    if values.shape[-1] % 2:
+        raise ValueError(
+            "Rows must have an even number of pixels not {}".format(
+                values.shape))
+    shape = tuple(values.shape[:-1]) + (values.shape[-1] // 2 * 3, )
+    if out is None:
+        out = numpy.empty(shape, dtype=numpy.uint8)
+    else:
+        oo.check_out(out, shape, numpy.uint8)
+    even = values[..., 0::2]
+    odd = values[..., 1::2]
+    out[..., 0::3] = even >> 4
+    out[..., 1::3] = ((odd & 0x0F) << 4) | (even & 0x0F)
+    out[..., 2::3] = odd >> 4
+    return out
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Convert YUV frames (FC2_PIXEL_FORMAT_411YUV8, 422YUV8 and 444YUV8) to
+luma (grey) and RGB with numpy
+
+Frames are the arrays returned by image_to_array:
+    411YUV8: rows of bytes, UYYVYY (4 pixels in 6 bytes)
+    422YUV8: (rows, cols, 2), UYVY (2 pixels in 4 bytes)
+    444YUV8: (rows, cols, 3), UYV
+
+    a, meta = camera.grab()  # for example in FC2_VIDEOMODE_640x480YUV422
+    rgb = yuv.to_rgb(a, meta.format)
+
+Any leading dimensions (a batch of frames) are kept. RGB uses the full
+range BT.601 (JFIF) coefficients with chroma shared by the pixels of a
+group (no chroma interpolation).
+"""
+
+import numpy
+
+from . import oo
+
+
+# pixels sharing chroma, bytes per group and offsets of U, the Y and V
+layouts = {
+    '411YUV8': (4, 6, 0, (1, 2, 4, 5), 3),
+    '422YUV8': (2, 4, 0, (1, 3), 2),
+    '444YUV8': (1, 3, 0, (1, ), 2),
+}
+
+
+def resolve_layout(pixel_format):
+    pixel_format = oo.resolve_pixel_format(pixel_format)
+    for name in layouts:
+        if pixel_format == oo.resolve_pixel_format(name):
+            return name
+    raise ValueError("Unsupported YUV pixel format: %s" % pixel_format)
+
+
+def _groups(a, name):
+    # a as (..., rows, groups, bytes per group) and the frame shape
+    a = numpy.asarray(a)
+    if a.dtype != numpy.uint8:
+        raise ValueError("YUV frames must be uint8 not {}".format(a.dtype))
+    n, size = layouts[name][:2]
+    if name == '411YUV8':
+        lead, row_size = a.shape[:-1], a.shape[-1]
+    else:
+        if a.ndim < 3 or a.shape[-1] != size // n:
+            raise ValueError(
+                "Invalid {} frame shape {}".format(name, a.shape))
+        lead, row_size = a.shape[:-2], a.shape[-2] * a.shape[-1]
+    if row_size % size:
+        raise ValueError(
+            "{} rows must be a multiple of {} bytes not {}".format(
+                name, size, row_size))
+    cols = row_size // size * n
+    return a.reshape(lead + (row_size // size, size)), lead + (cols, )
+
+
+def luma(a, pixel_format, out=None):
+    """
+    Y of a YUV frame (or batch of frames)
+
+    For 422YUV8 and 444YUV8 (and without out) this is a view of a,
+    411YUV8 luma is not evenly strided so is copied
+    """
+    name = resolve_layout(pixel_format)
+    if name != '411YUV8':
+        y = numpy.asarray(a)[..., 1]
+    else:
+        g, shape = _groups(a, name)
+        y = g[..., layouts[name][3]].reshape(shape)
+    if out is None:
+        return y
+    oo.check_out(out, y.shape, numpy.uint8)
+    numpy.copyto(out, y)
+    return out
+
+
+def to_rgb(a, pixel_format, out=None):
+    """
+    Convert a YUV frame (or batch of frames) to (..., rows, cols, 3) RGB
+    """
+    name = resolve_layout(pixel_format)
+    n, _, iu, iy, iv = layouts[name]
+    g, shape = _groups(a, name)
+    shape = shape + (3, )
+    if out is None:
+        out = numpy.empty(shape, dtype=numpy.uint8)
+    else:
+        oo.check_out(out, shape, numpy.uint8)
+    # (..., rows, groups, pixels, 3), splitting the cols axis is a view
+    o = out.reshape(g.shape[:-1] + (n, 3))
+    if name == '444YUV8':
+        y = g[..., 1:2].astype('i4')
+    elif name == '422YUV8':
+        y = g[..., 1::2].astype('i4')
+    else:
+        y = g[..., iy].astype('i4')
+    cb = g[..., iu:iu + 1].astype('i4') - 128
+    cr = g[..., iv:iv + 1].astype('i4') - 128
+    # fixed point (1 / 1024) BT.601 coefficients
+    for (c, offset) in enumerate((
+            (1436 * cr + 512) >> 10,
+            -((352 * cb + 731 * cr + 512) >> 10),
+            (1815 * cb + 512) >> 10)):
+        v = y + offset
+        numpy.clip(v, 0, 255, out=v)
+        o[..., c] = v
+    if not numpy.shares_memory(o, out):
+        out[...] = o.reshape(shape)
+    return out